@@ -69,18 +69,15 @@ class HistoricalReturnsAlphaModel(AlphaModel):
 
         # initialize data for added securities
         symbols = [ x.Symbol for x in changes.AddedSecurities ]
-        history = algorithm.History(symbols, self.lookback, self.resolution)
-        if history.empty: return
-
-        tickers = history.index.levels[0]
-        for ticker in tickers:
-            symbol = SymbolCache.GetSymbol(ticker)
+        closes, historySymbols, times = algorithm.HistoryArray(symbols, self.lookback, self.resolution)
+        times = pd.DatetimeIndex(times).to_pydatetime()
 
+        for symbol, close in zip(historySymbols, closes):
             if symbol not in self.symbolDataBySymbol:
                 symbolData = SymbolData(symbol, self.lookback)
                 self.symbolDataBySymbol[symbol] = symbolData
                 symbolData.RegisterIndicators(algorithm, self.resolution)
-                symbolData.WarmUpIndicators(history.loc[ticker])
+                symbolData.WarmUpIndicators(times, close)
 
     def CancelInsights(self, algorithm, symbol):
         if not self.insightCollection.ContainsKey(symbol):
@@ -106,9 +103,10 @@ class SymbolData:
         if self.Consolidator is not None:
             algorithm.SubscriptionManager.RemoveConsolidator(self.Symbol, self.Consolidator)
 
-    def WarmUpIndicators(self, history):
-        for tuple in history.itertuples():
-            self.ROC.Update(tuple.Index, tuple.close)
+    def WarmUpIndicators(self, times, closes):
+        for time, close in zip(times, closes):
+            if not np.isnan(close):
+                self.ROC.Update(time, close)
 
     @property
     def Return(self):
@@ -51,7 +51,7 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
 
         symbols = [ x.Symbol for x in self.Securities ]
         
-        history = algorithm.History(symbols, self.lookback, self.resolution).close.unstack(level=0)
+        history = algorithm.History(symbols, self.lookback, self.resolution, columns=['close']).close.unstack(level=0)
 
         if not history.empty:
 
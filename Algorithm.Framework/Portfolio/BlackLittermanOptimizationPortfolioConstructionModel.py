@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
+from Portfolio.ReturnsMatrix import ReturnsMatrix
 from itertools import groupby
 from numpy import dot, transpose
 from numpy.linalg import inv
@@ -66,6 +67,7 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         self.sign = lambda x: -1 if x < 0 else (1 if x > 0 else 0)
         self.symbolDataBySymbol = {}
+        self.returnsMatrix = ReturnsMatrix(period)
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancingFunc
@@ -86,19 +88,25 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         # Get view vectors
         P, Q = self.get_views(lastActiveInsights)
         if P is not None:
-            returns = dict()
             # Updates the BlackLittermanSymbolData with insights
-            # Create a dictionary keyed by the symbols in the insights with an pandas.Series as value to create a data frame
-            for insight in lastActiveInsights:
-                symbol = insight.Symbol
-                symbolData = self.symbolDataBySymbol.get(symbol, self.BlackLittermanSymbolData(symbol, self.lookback, self.period))
-                if insight.Magnitude is None:
-                    self.Algorithm.SetRunTimeError(ArgumentNullException('BlackLittermanOptimizationPortfolioConstructionModel does not accept \'None\' as Insight.Magnitude. Please make sure your Alpha Model is generating Insights with the Magnitude property set.'))
-                    return targets
-                symbolData.Add(insight.GeneratedTimeUtc, insight.Magnitude)
-                returns[symbol] = symbolData.Return
-
-            returns = pd.DataFrame(returns)
+            # Symbols without data get a temporary row of the returns matrix, removed once the data frame is created
+            temporarySymbolData = {}
+            try:
+                for insight in lastActiveInsights:
+                    symbol = insight.Symbol
+                    symbolData = self.symbolDataBySymbol.get(symbol) or temporarySymbolData.get(symbol)
+                    if symbolData is None:
+                        symbolData = temporarySymbolData[symbol] = self.BlackLittermanSymbolData(symbol, self.lookback, self.returnsMatrix)
+                    if insight.Magnitude is None:
+                        self.Algorithm.SetRunTimeError(ArgumentNullException('BlackLittermanOptimizationPortfolioConstructionModel does not accept \'None\' as Insight.Magnitude. Please make sure your Alpha Model is generating Insights with the Magnitude property set.'))
+                        return targets
+                    symbolData.Add(insight.GeneratedTimeUtc, insight.Magnitude)
+
+                # Create a data frame with a column per symbol in the insights from the shared returns matrix
+                returns = self.returnsMatrix.GetReturns(list(dict.fromkeys(insight.Symbol for insight in lastActiveInsights)))
+            finally:
+                for symbolData in temporarySymbolData.values():
+                    symbolData.Reset()
 
             # Calculate prior estimate of the mean and covariance
             Pi, Sigma = self.get_equilibrium_return(returns)
@@ -150,7 +158,7 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         # initialize data for added securities
         addedSymbols = { x.Symbol: x.Exchange.TimeZone for x in changes.AddedSecurities }
-        history = algorithm.History(list(addedSymbols.keys()), self.lookback * self.period, self.resolution)
+        history = algorithm.History(list(addedSymbols.keys()), self.lookback * self.period, self.resolution, columns=['close'])
 
         if history.empty:
             return
@@ -162,7 +170,9 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             if str(symbol) not in symbols:
                 continue
 
-            symbolData = self.symbolDataBySymbol.get(symbol, self.BlackLittermanSymbolData(symbol, self.lookback, self.period))
+            symbolData = self.symbolDataBySymbol.get(symbol)
+            if symbolData is None:
+                symbolData = self.BlackLittermanSymbolData(symbol, self.lookback, self.returnsMatrix)
             for time, close in history[symbol].items():
                 utcTime = Extensions.ConvertToUtc(time, timezone)
                 symbolData.Update(utcTime, close)
@@ -207,10 +217,13 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         size = len(returns.columns)
         # equal weighting scheme
         W = np.array([1/size]*size)
+        # the mean and covariance kept up to date by the returns matrix, if the returns allow it
+        moments = self.returnsMatrix.GetMoments(list(returns.columns))
+        mean, cov = (returns.mean(), returns.cov()) if moments is None else moments
         # the covariance matrix of excess returns (N x N matrix)
-        cov = returns.cov()*252
+        cov = cov*252
         # annualized return
-        annual_return = np.sum(((1 + returns.mean())**252 -1) * W)
+        annual_return = np.sum(((1 + mean)**252 -1) * W)
         # annualized variance of return
         annual_variance = dot(W.T, dot(cov, W))
         # the risk aversion coefficient
@@ -271,40 +284,40 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
     class BlackLittermanSymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, returnsMatrix):
             self.symbol = symbol
             self.roc = RateOfChange(f'{symbol}.ROC({lookback})', lookback)
             self.roc.Updated += self.OnRateOfChangeUpdated
-            self.window = RollingWindow[IndicatorDataPoint](period)
+            self.returnsMatrix = returnsMatrix
+            self.returnsMatrix.Add(symbol)
 
         def Reset(self):
             self.roc.Updated -= self.OnRateOfChangeUpdated
             self.roc.Reset()
-            self.window.Reset()
+            self.returnsMatrix.Remove(self.symbol)
 
         def Update(self, utcTime, close):
             self.roc.Update(utcTime, close)
 
         def OnRateOfChangeUpdated(self, roc, value):
             if roc.IsReady:
-                self.window.Add(value)
+                self.returnsMatrix.Update(self.symbol, value.EndTime, value.Value)
 
         def Add(self, time, value):
-            if self.window.Samples > 0 and self.window[0].EndTime == time:
+            latest = self.returnsMatrix.Latest(self.symbol)
+            if latest is not None and latest[0] == time:
                 return
 
-            item = IndicatorDataPoint(self.symbol, time, value)
-            self.window.Add(item)
+            self.returnsMatrix.Update(self.symbol, time, value)
 
         @property
         def Return(self):
-            return pd.Series(
-                data = [x.Value for x in self.window],
-                index = [x.EndTime for x in self.window])
+            times, values = self.returnsMatrix.GetRow(self.symbol)
+            return pd.Series(data = values, index = pd.DatetimeIndex(times))
 
         @property
         def IsReady(self):
-            return self.window.IsReady
+            return self.returnsMatrix.IsReady(self.symbol)
 
         def __str__(self, **kwargs):
-            return f'{self.roc.Name}: {(1 + self.window[0])**252 - 1:.2%}'
+            return f'{self.roc.Name}: {(1 + self.returnsMatrix.Latest(self.symbol)[1])**252 - 1:.2%}'
@@ -0,0 +1,82 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+### <summary>
+### Provides an implementation of a covariance estimator that shrinks the sample covariance towards a constant correlation
+### matrix: the sample variances with the average sample correlation between every pair of securities.
+### </summary>
+### <remarks>Ledoit, O., & Wolf, M. (2004). Honey, I shrunk the sample covariance matrix.
+### The Journal of Portfolio Management, 30(4), 110-119.</remarks>
+class ConstantCorrelationCovarianceEstimator:
+    '''Provides an implementation of a covariance estimator that shrinks the sample covariance towards a constant correlation matrix'''
+    def __init__(self, shrinkage = None):
+        '''Initialize the ConstantCorrelationCovarianceEstimator
+        Args:
+            shrinkage(float): Fixed shrinkage intensity between 0 and 1. If None, the optimal intensity is estimated'''
+        self.shrinkage = shrinkage
+        self.last_shrinkage = None
+
+    def Estimate(self, historicalReturns):
+        '''
+        Estimate the covariance of the given historical returns
+        args:
+            historicalReturns: Matrix of historical returns where each column represents a security and each row returns for the given date/time (size: K x N).
+        Returns:
+            pandas.DataFrame with the covariance of the returns (size: N x N)
+        '''
+        # missing returns are replaced by the mean, so they don't contribute to the covariance
+        returns = historicalReturns.to_numpy(dtype = float)
+        y = np.nan_to_num(returns - np.nanmean(returns, axis = 0))
+        t, n = y.shape
+
+        sample = y.T @ y / t
+        var = np.diag(sample).copy()
+        sqrtvar = np.sqrt(var)
+        scale = np.outer(sqrtvar, sqrtvar)
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            correlation = np.where(scale > 0, sample / scale, 0)
+        rBar = (np.sum(correlation) - np.trace(correlation)) / (n * (n - 1)) if n > 1 else 0
+        prior = rBar * scale
+        np.fill_diagonal(prior, var)
+
+        shrinkage = self.shrinkage
+        if shrinkage is None:
+            shrinkage = self.get_optimal_shrinkage(y, sample, var, sqrtvar, rBar, prior)
+        self.last_shrinkage = shrinkage
+
+        covariance = shrinkage * prior + (1 - shrinkage) * sample
+        return pd.DataFrame(covariance, index = historicalReturns.columns, columns = historicalReturns.columns)
+
+    def get_optimal_shrinkage(self, y, sample, var, sqrtvar, rBar, prior):
+        '''Estimates the shrinkage intensity that minimizes the expected quadratic loss'''
+        t = y.shape[0]
+        gamma = np.sum((sample - prior) ** 2)
+        if gamma == 0:
+            return 0
+
+        # pi: sum of the asymptotic variances of the entries of the sample covariance
+        y2 = y ** 2
+        phiMat = y2.T @ y2 / t - 2 * (y.T @ y) * sample / t + sample ** 2
+        phi = np.sum(phiMat)
+
+        # rho: sum of the asymptotic covariances of the entries of the prior and the sample covariance
+        thetaMat = (y ** 3).T @ y / t - var[:, None] * sample
+        np.fill_diagonal(thetaMat, 0)
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            ratio = np.where(sqrtvar[:, None] > 0, sqrtvar[None, :] / sqrtvar[:, None], 0)
+        rho = np.trace(phiMat) + rBar * np.sum(ratio * thetaMat)
+
+        kappa = (phi - rho) / gamma
+        return max(0, min(1, kappa / t))
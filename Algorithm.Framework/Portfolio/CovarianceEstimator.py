@@ -0,0 +1,111 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+### <summary>
+### Incrementally updated mean and covariance of cross sections of returns, so the moments are available in O(N^2) per
+### cross section instead of O(T*N^2) each time they are needed.
+### By default it keeps the sample moments of the last period cross sections, adding and evicting them with Welford's update.
+### Given a half life it keeps exponentially weighted moments instead.
+### </summary>
+### <remarks>Welford, B. P. (1962). Note on a method for calculating corrected sums of squares and products.
+### Technometrics, 4(3), 419-420.</remarks>
+class CovarianceEstimator:
+    def __init__(self, period, size, halfLife = None):
+        """Initialize the estimator
+        Args:
+            period(int): The number of cross sections of the rolling sample moments
+            size(int): The number of returns of each cross section
+            halfLife(float): The half life, in cross sections, of the exponentially weighted moments. If None, the sample moments are used"""
+        self.period = period
+        self.alpha = None if halfLife is None else 1 - np.exp(np.log(0.5) / halfLife)
+        self.Reset(size)
+
+    def Reset(self, size):
+        """Clears the moments
+        Args:
+            size(int): The number of returns of each cross section"""
+        self.count = 0
+        self.mean = np.zeros(size)
+        # sum of the products of the deviations from the mean, or the covariance itself for the exponentially weighted moments
+        self.comoment = np.zeros((size, size))
+        self.window = np.zeros((self.period, size))
+        self.head = 0
+
+    def Update(self, returns):
+        """Adds a cross section of returns, evicting the oldest one once there are period of them
+        Args:
+            returns: Array of the returns of the cross section (size: N)"""
+        if self.alpha is not None:
+            self.updateExponentiallyWeighted(returns)
+            return
+
+        if self.count == self.period:
+            self.remove(self.window[self.head])
+        self.window[self.head] = returns
+        self.head = (self.head + 1) % self.period
+
+        self.count += 1
+        delta = returns - self.mean
+        self.mean += delta / self.count
+        self.comoment += np.outer(delta, returns - self.mean)
+
+    def Rebuild(self, returns):
+        """Resets the moments to the ones of the given cross sections of returns
+        Args:
+            returns: Matrix of returns where each row is a cross section, the oldest first (size: T x N)"""
+        self.Reset(returns.shape[1])
+        if self.alpha is not None:
+            for row in returns:
+                self.updateExponentiallyWeighted(row)
+            return
+
+        returns = returns[-self.period:]
+        self.count = len(returns)
+        self.window[:self.count] = returns
+        self.head = self.count % self.period
+        if self.count > 0:
+            self.mean = returns.mean(axis = 0)
+            deviations = returns - self.mean
+            self.comoment = deviations.T @ deviations
+
+    def Mean(self, indices):
+        """Gets the mean of the returns at the given indices of the cross sections"""
+        return self.mean[indices]
+
+    def Covariance(self, indices):
+        """Gets the covariance of the returns at the given indices of the cross sections, NaN with less than two cross sections"""
+        covariance = self.comoment[np.ix_(indices, indices)]
+        if self.alpha is not None:
+            return covariance.copy()
+        return covariance / (self.count - 1) if self.count > 1 else np.full(covariance.shape, np.nan)
+
+    def remove(self, returns):
+        self.count -= 1
+        if self.count == 0:
+            self.mean[:] = 0
+            self.comoment[:] = 0
+            return
+        delta = returns - self.mean
+        self.mean -= delta / self.count
+        self.comoment -= np.outer(delta, returns - self.mean)
+
+    def updateExponentiallyWeighted(self, returns):
+        self.count += 1
+        if self.count == 1:
+            self.mean = np.array(returns, dtype = float)
+            return
+        delta = returns - self.mean
+        self.mean += self.alpha * delta
+        self.comoment = (1 - self.alpha) * (self.comoment + self.alpha * np.outer(delta, delta))
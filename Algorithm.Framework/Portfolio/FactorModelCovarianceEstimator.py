@@ -0,0 +1,90 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+### <summary>
+### Provides an implementation of a covariance estimator based on a statistical factor model: the principal components
+### of the historical returns are the factors and what they don't explain is the specific variance of each security.
+### The estimate is a low rank plus diagonal matrix, so products with it take O(N*k) instead of O(N^2).
+### </summary>
+class FactorModelCovarianceEstimator:
+    '''Provides an implementation of a covariance estimator based on a statistical factor model'''
+    def __init__(self,
+                 factors = 5,
+                 minimum_specific_variance = 1e-10):
+        '''Initialize the FactorModelCovarianceEstimator
+        Args:
+            factors(int): The number of principal components used as factors
+            minimum_specific_variance(float): The lower bound on the specific variance of each security, keeps the estimate positive definite'''
+        self.factors = factors
+        self.minimum_specific_variance = minimum_specific_variance
+
+    def Estimate(self, historicalReturns):
+        '''
+        Estimate the covariance of the given historical returns
+        args:
+            historicalReturns: Matrix of historical returns where each column represents a security and each row returns for the given date/time (size: K x N).
+        Returns:
+            LowRankCovariance with the covariance of the returns (size: N x N)
+        '''
+        # missing returns are replaced by the mean, so they don't contribute to the covariance
+        returns = historicalReturns.to_numpy(dtype = float)
+        deviations = np.nan_to_num(returns - np.nanmean(returns, axis = 0))
+        count = max(len(deviations) - 1, 1)
+
+        # the right singular vectors of the deviations are the principal components of the sample covariance,
+        # a thin SVD costs O(K^2*N) and never builds the N x N sample covariance
+        _, singularValues, components = np.linalg.svd(deviations, full_matrices = False)
+        factors = min(self.factors, len(singularValues))
+        loadings = components[:factors].T
+        factorVariances = singularValues[:factors] ** 2 / count
+
+        variances = np.sum(deviations ** 2, axis = 0) / count
+        specificVariances = np.maximum(variances - (loadings ** 2) @ factorVariances, self.minimum_specific_variance)
+
+        return LowRankCovariance(loadings, factorVariances, specificVariances, historicalReturns.columns)
+
+### <summary>
+### Covariance matrix represented as B.diag(f).B^T + diag(d), with B the N x k factor loadings, f the k factor variances
+### and d the N specific variances. Behaves as the dense matrix in numpy operations.
+### </summary>
+class LowRankCovariance:
+    '''Covariance matrix represented as the low rank factor covariance plus the diagonal specific variances'''
+    def __init__(self, loadings, factorVariances, specificVariances, columns):
+        self.loadings = loadings
+        self.factorVariances = factorVariances
+        self.specificVariances = specificVariances
+        self.columns = pd.Index(columns)
+        self.index = self.columns
+        self.shape = (len(specificVariances), len(specificVariances))
+
+    def dot(self, weights):
+        '''Computes the product with the given weights in O(N*k)'''
+        return self.loadings @ (self.factorVariances * (self.loadings.T @ weights)) + self.specificVariances * weights
+
+    def __matmul__(self, weights):
+        return self.dot(weights)
+
+    def __mul__(self, scalar):
+        return LowRankCovariance(self.loadings, self.factorVariances * scalar, self.specificVariances * scalar, self.columns)
+
+    __rmul__ = __mul__
+
+    def to_numpy(self):
+        '''Gets the dense covariance matrix'''
+        return (self.loadings * self.factorVariances) @ self.loadings.T + np.diag(self.specificVariances)
+
+    def __array__(self, dtype = None, copy = None):
+        array = self.to_numpy()
+        return array if dtype is None else array.astype(dtype)
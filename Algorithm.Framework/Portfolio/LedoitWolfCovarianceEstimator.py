@@ -0,0 +1,57 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+### <summary>
+### Provides an implementation of a covariance estimator that shrinks the sample covariance towards a scaled identity matrix.
+### The shrinkage intensity minimizes the expected quadratic loss, so the estimate is well conditioned even when
+### there are more securities than historical returns.
+### </summary>
+### <remarks>Ledoit, O., & Wolf, M. (2004). A well-conditioned estimator for large-dimensional covariance matrices.
+### Journal of Multivariate Analysis, 88(2), 365-411.</remarks>
+class LedoitWolfCovarianceEstimator:
+    '''Provides an implementation of a covariance estimator that shrinks the sample covariance towards a scaled identity matrix'''
+    def __init__(self, shrinkage = None):
+        '''Initialize the LedoitWolfCovarianceEstimator
+        Args:
+            shrinkage(float): Fixed shrinkage intensity between 0 and 1. If None, the optimal intensity is estimated'''
+        self.shrinkage = shrinkage
+        self.last_shrinkage = None
+
+    def Estimate(self, historicalReturns):
+        '''
+        Estimate the covariance of the given historical returns
+        args:
+            historicalReturns: Matrix of historical returns where each column represents a security and each row returns for the given date/time (size: K x N).
+        Returns:
+            pandas.DataFrame with the covariance of the returns (size: N x N)
+        '''
+        # missing returns are replaced by the mean, so they don't contribute to the covariance
+        returns = historicalReturns.to_numpy(dtype = float)
+        deviations = np.nan_to_num(returns - np.nanmean(returns, axis = 0))
+        count, size = deviations.shape
+
+        sample = deviations.T @ deviations / count
+        mu = np.trace(sample) / size
+        target = mu * np.eye(size)
+
+        shrinkage = self.shrinkage
+        if shrinkage is None:
+            d2 = np.sum((sample - target) ** 2)
+            b2 = (np.sum(np.sum(deviations ** 2, axis = 1) ** 2) / count - np.sum(sample ** 2)) / count
+            shrinkage = 0 if d2 == 0 else min(b2, d2) / d2
+        self.last_shrinkage = shrinkage
+
+        covariance = shrinkage * target + (1 - shrinkage) * sample
+        return pd.DataFrame(covariance, index = historicalReturns.columns, columns = historicalReturns.columns)
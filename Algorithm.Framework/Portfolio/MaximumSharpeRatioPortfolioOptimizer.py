@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from scipy.optimize import minimize
+from Portfolio.FactorModelCovarianceEstimator import LowRankCovariance
 
 ### <summary>
 ### Provides an implementation of a portfolio optimizer that maximizes the portfolio Sharpe Ratio.
@@ -26,15 +27,21 @@ class MaximumSharpeRatioPortfolioOptimizer:
     def __init__(self, 
                  minimum_weight = -1, 
                  maximum_weight = 1,
-                 risk_free_rate = 0):
+                 risk_free_rate = 0,
+                 covariance_estimator = None,
+                 solver = None):
         '''Initialize the MaximumSharpeRatioPortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
             maximum_weight(float): The upper bounds on portfolio weights
-            risk_free_rate(float): The risk free rate'''
+            risk_free_rate(float): The risk free rate
+            covariance_estimator: Estimates the covariance of the historical returns when it is not given, like LedoitWolfCovarianceEstimator. If None, the sample covariance is used
+            solver: Solves the optimization as a quadratic program, like QuadraticProgramSolver, warm started from the previous solution. If None, SLSQP is used'''
         self.minimum_weight = minimum_weight
         self.maximum_weight = maximum_weight
         self.risk_free_rate = risk_free_rate
+        self.covariance_estimator = covariance_estimator
+        self.solver = solver
         self.expected_returns = []
 
     def Optimize(self, historicalReturns, expectedReturns = None, covariance = None):
@@ -48,32 +55,44 @@ class MaximumSharpeRatioPortfolioOptimizer:
             Array of double with the portfolio weights (size: K x 1)
         '''
         if covariance is None:
-            covariance = historicalReturns.cov()
+            covariance = historicalReturns.cov() if self.covariance_estimator is None else self.covariance_estimator.Estimate(historicalReturns)
         if expectedReturns is None:
             expectedReturns = historicalReturns.mean()
-        expectedReturns = expectedReturns - self.risk_free_rate
 
-        size = covariance.columns.size   # K x 1
+        # convert the inputs once, the low rank covariance keeps its O(N*k) products
+        if not isinstance(covariance, LowRankCovariance):
+            covariance = np.ascontiguousarray(covariance, dtype = float)
+        expectedReturns = np.ascontiguousarray(expectedReturns, dtype = float).ravel() - self.risk_free_rate
+
+        size = covariance.shape[0]   # K x 1
         x0 = np.array(size * [1. / size])
         k = expectedReturns.dot(x0)
+        ones = np.ones(size)
+
+        if self.solver is not None:
+            # minimize w^T.S.w subject to the bounds, (µ − r_f)^T w = k and Σw = 1: a convex quadratic program
+            A = np.vstack([np.eye(size), expectedReturns, ones])
+            lower = np.concatenate([np.full(size, self.minimum_weight), [k, 1]])
+            upper = np.concatenate([np.full(size, self.maximum_weight), [k, 1]])
+            weights, _, converged = self.solver.Solve(2 * np.asarray(covariance), np.zeros(size), A, lower, upper, labels = historicalReturns.columns)
+            return weights if converged else x0
 
         # Sharpe Maximization under Quadratic Constraints
         # https://quant.stackexchange.com/questions/18521/sharpe-maximization-under-quadratic-constraints
-        # (µ − r_f)^T w = k
+        # (µ − r_f)^T w = k, the constraints are linear so their jacobians are constant
         constraints = [
-            {'type': 'eq', 'fun': lambda weights: expectedReturns.dot(weights) - k}]
+            {'type': 'eq', 'fun': lambda weights: expectedReturns.dot(weights) - k, 'jac': lambda weights: expectedReturns}]
 
         # Σw = 1
         constraints.append(
-            {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights)})
+            {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights), 'jac': lambda weights: ones})
 
-        opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),   # Objective function
+        opt = minimize(lambda weights: self.portfolio_variance_and_gradient(weights, covariance),   # Objective function and its gradient
                        x0,                                                        # Initial guess
+                       jac = True,                                                # The objective function returns the gradient
                        bounds = self.get_boundary_conditions(size),               # Bounds for variables: lw ≤ w ≤ up
                        constraints = constraints,                                 # Constraints definition
                        method='SLSQP')        # Optimization method:  Sequential Least SQuares Programming
-        sharpe_ratio = expectedReturns.dot(opt['x']) / opt.fun
-
         return opt['x'] if opt['success'] else x0
 
     def portfolio_variance(self, weights, covariance):
@@ -81,11 +100,19 @@ class MaximumSharpeRatioPortfolioOptimizer:
         Args:
             weighs: Portfolio weights
             covariance: Covariance matrix of historical returns'''
-        variance = np.dot(weights.T, np.dot(covariance, weights))
+        return self.portfolio_variance_and_gradient(weights, covariance)[0]
+
+    def portfolio_variance_and_gradient(self, weights, covariance):
+        '''Computes the portfolio variance w^T.S.w and its gradient 2.S.w, sharing the product of the covariance and the weights
+        Args:
+            weighs: Portfolio weights
+            covariance: Covariance matrix of historical returns'''
+        product = covariance @ weights
+        variance = np.dot(weights, product)
         if variance == 0 and np.any(weights):
             # variance can't be zero, with non zero weights
             raise ValueError(f'MaximumSharpeRatioPortfolioOptimizer.portfolio_variance: Volatility cannot be zero. Weights: {weights}')
-        return variance
+        return variance, 2 * product
 
     def get_boundary_conditions(self, size):
         '''Creates the boundary condition for the portfolio weights'''
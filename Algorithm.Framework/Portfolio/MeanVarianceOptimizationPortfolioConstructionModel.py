@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.ReturnsMatrix import ReturnsMatrix
 
 ### <summary>
 ### Provides an implementation of Mean-Variance portfolio optimization based on modern portfolio theory.
@@ -51,6 +52,7 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         self.optimizer = MinimumVariancePortfolioOptimizer(lower, upper, targetReturn) if optimizer is None else optimizer
 
         self.symbolDataBySymbol = {}
+        self.returnsMatrix = ReturnsMatrix(period)
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancingFunc
@@ -88,12 +90,20 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
 
         symbols = [insight.Symbol for insight in activeInsights]
 
-        # Create a dictionary keyed by the symbols in the insights with an pandas.Series as value to create a data frame
-        returns = { str(symbol.ID) : data.Return for symbol, data in self.symbolDataBySymbol.items() if symbol in symbols }
-        returns = pd.DataFrame(returns)
-
-        # The portfolio optimizer finds the optional weights for the given data
-        weights = self.optimizer.Optimize(returns)
+        # Create a data frame with a column per symbol in the insights from the shared returns matrix
+        symbols = [symbol for symbol in self.symbolDataBySymbol if symbol in symbols]
+        columns = [str(symbol.ID) for symbol in symbols]
+        returns = self.returnsMatrix.GetReturns(symbols, columns)
+
+        # The portfolio optimizer finds the optional weights for the given data,
+        # using the mean and covariance kept up to date by the returns matrix when available
+        moments = self.returnsMatrix.GetMoments(symbols, columns)
+        if moments is None:
+            weights = self.optimizer.Optimize(returns)
+        elif getattr(self.optimizer, 'covariance_estimator', None) is not None:
+            weights = self.optimizer.Optimize(returns, expectedReturns = moments[0])
+        else:
+            weights = self.optimizer.Optimize(returns, expectedReturns = moments[0], covariance = moments[1])
         weights = pd.Series(weights, index = returns.columns)
 
         # Create portfolio targets from the specified insights
@@ -122,7 +132,7 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         # initialize data for added securities
         symbols = [x.Symbol for x in changes.AddedSecurities]
         for symbol in [x for x in symbols if x not in self.symbolDataBySymbol]:
-            self.symbolDataBySymbol[symbol] = self.MeanVarianceSymbolData(symbol, self.lookback, self.period)
+            self.symbolDataBySymbol[symbol] = self.MeanVarianceSymbolData(symbol, self.lookback, self.returnsMatrix)
 
         history = algorithm.History[TradeBar](symbols, self.lookback * self.period, self.resolution)
         for bars in history:
@@ -131,40 +141,39 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
 
     class MeanVarianceSymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, returnsMatrix):
             self.symbol = symbol
             self.roc = RateOfChange(f'{symbol}.ROC({lookback})', lookback)
             self.roc.Updated += self.OnRateOfChangeUpdated
-            self.window = RollingWindow[IndicatorDataPoint](period)
+            self.returnsMatrix = returnsMatrix
+            self.returnsMatrix.Add(symbol)
 
         def Reset(self):
             self.roc.Updated -= self.OnRateOfChangeUpdated
             self.roc.Reset()
-            self.window.Reset()
+            self.returnsMatrix.Remove(self.symbol)
 
         def Update(self, time, value):
             return self.roc.Update(time, value)
 
         def OnRateOfChangeUpdated(self, roc, value):
             if roc.IsReady:
-                self.window.Add(value)
+                self.returnsMatrix.Update(self.symbol, value.EndTime, value.Value)
 
         def Add(self, time, value):
-            item = IndicatorDataPoint(self.symbol, time, value)
-            self.window.Add(item)
+            self.returnsMatrix.Update(self.symbol, time, value)
 
         # Get symbols' returns, we use simple return according to
         # Meucci, Attilio, Quant Nugget 2: Linear vs. Compounded Returns – Common Pitfalls in Portfolio Management (May 1, 2010). 
         # GARP Risk Professional, pp. 49-51, April 2010 , Available at SSRN: https://ssrn.com/abstract=1586656
         @property
         def Return(self):
-            return pd.Series(
-                data = [x.Value for x in self.window],
-                index = [x.EndTime for x in self.window])
+            times, values = self.returnsMatrix.GetRow(self.symbol)
+            return pd.Series(data = values, index = pd.DatetimeIndex(times))
 
         @property
         def IsReady(self):
-            return self.window.IsReady
+            return self.returnsMatrix.IsReady(self.symbol)
 
         def __str__(self, **kwargs):
-            return '{}: {:.2%}'.format(self.roc.Name, self.window[0])
+            return '{}: {:.2%}'.format(self.roc.Name, self.returnsMatrix.Latest(self.symbol)[1])
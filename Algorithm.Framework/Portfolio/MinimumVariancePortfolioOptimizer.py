@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from scipy.optimize import minimize
+from Portfolio.FactorModelCovarianceEstimator import LowRankCovariance
 
 ### <summary>
 ### Provides an implementation of a portfolio optimizer that calculate the optimal weights 
@@ -25,15 +26,21 @@ class MinimumVariancePortfolioOptimizer:
     def __init__(self, 
                  minimum_weight = -1, 
                  maximum_weight = 1,
-                 target_return = 0.02):
+                 target_return = 0.02,
+                 covariance_estimator = None,
+                 solver = None):
         '''Initialize the MinimumVariancePortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
             maximum_weight(float): The upper bounds on portfolio weights
-            target_return(float): The target portfolio return'''
+            target_return(float): The target portfolio return
+            covariance_estimator: Estimates the covariance of the historical returns when it is not given, like LedoitWolfCovarianceEstimator. If None, the sample covariance is used
+            solver: Solves the optimization as a quadratic program, like QuadraticProgramSolver, warm started from the previous solution. If None, SLSQP is used'''
         self.minimum_weight = minimum_weight
         self.maximum_weight = maximum_weight
         self.target_return = target_return
+        self.covariance_estimator = covariance_estimator
+        self.solver = solver
 
     def Optimize(self, historicalReturns, expectedReturns = None, covariance = None):
         '''
@@ -46,40 +53,65 @@ class MinimumVariancePortfolioOptimizer:
             Array of double with the portfolio weights (size: K x 1)
         '''
         if covariance is None:
-            covariance = historicalReturns.cov()
+            covariance = historicalReturns.cov() if self.covariance_estimator is None else self.covariance_estimator.Estimate(historicalReturns)
         if expectedReturns is None:
             expectedReturns = historicalReturns.mean()
 
+        # convert the inputs once, the low rank covariance keeps its O(N*k) products
+        if not isinstance(covariance, LowRankCovariance):
+            covariance = np.ascontiguousarray(covariance, dtype = float)
+        expectedReturns = np.ascontiguousarray(expectedReturns, dtype = float).ravel()
+
         size = historicalReturns.columns.size   # K x 1
         x0 = np.array(size * [1. / size])
+        ones = np.ones(size)
 
-        constraints = [
-            {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights)},
-            {'type': 'eq', 'fun': lambda weights: self.get_target_constraint(weights, expectedReturns)}]
+        if self.solver is not None:
+            # minimize w^T.S.w subject to the bounds, the budget and the target return: a convex quadratic program
+            A = np.vstack([np.eye(size), ones, expectedReturns])
+            lower = np.concatenate([np.full(size, self.minimum_weight), [1, self.target_return]])
+            upper = np.concatenate([np.full(size, self.maximum_weight), [1, self.target_return]])
+            weights, _, converged = self.solver.Solve(2 * np.asarray(covariance), np.zeros(size), A, lower, upper, labels = historicalReturns.columns)
+            if not converged: return x0
+        else:
+            # the constraints are linear, their jacobians are constant
+            constraints = [
+                {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights), 'jac': lambda weights: ones},
+                {'type': 'eq', 'fun': lambda weights: self.get_target_constraint(weights, expectedReturns), 'jac': lambda weights: expectedReturns}]
 
-        # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
-        opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),     # Objective function
-                       x0,                                                        # Initial guess
-                       bounds = self.get_boundary_conditions(size),               # Bounds for variables
-                       constraints = constraints,                                 # Constraints definition
-                       method='SLSQP')     # Optimization method:  Sequential Least Squares Programming (SLSQP)
+            # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
+            opt = minimize(lambda weights: self.portfolio_variance_and_gradient(weights, covariance),     # Objective function and its gradient
+                           x0,                                                        # Initial guess
+                           jac = True,                                                # The objective function returns the gradient
+                           bounds = self.get_boundary_conditions(size),               # Bounds for variables
+                           constraints = constraints,                                 # Constraints definition
+                           method='SLSQP')     # Optimization method:  Sequential Least Squares Programming (SLSQP)
 
-        if not opt['success']: return x0
+            if not opt['success']: return x0
+            weights = opt['x']
 
         # Scale the solution to ensure that the sum of the absolute weights is 1
-        sum_of_absolute_weights = np.sum(np.abs(opt['x']))
-        return opt['x'] / sum_of_absolute_weights
+        sum_of_absolute_weights = np.sum(np.abs(weights))
+        return weights / sum_of_absolute_weights
 
     def portfolio_variance(self, weights, covariance):
         '''Computes the portfolio variance
         Args:
             weighs: Portfolio weights
             covariance: Covariance matrix of historical returns'''
-        variance = np.dot(weights.T, np.dot(covariance, weights))
+        return self.portfolio_variance_and_gradient(weights, covariance)[0]
+
+    def portfolio_variance_and_gradient(self, weights, covariance):
+        '''Computes the portfolio variance w^T.S.w and its gradient 2.S.w, sharing the product of the covariance and the weights
+        Args:
+            weighs: Portfolio weights
+            covariance: Covariance matrix of historical returns'''
+        product = covariance @ weights
+        variance = np.dot(weights, product)
         if variance == 0 and np.any(weights):
             # variance can't be zero, with non zero weights
             raise ValueError(f'MinimumVariancePortfolioOptimizer.portfolio_variance: Volatility cannot be zero. Weights: {weights}')
-        return variance
+        return variance, 2 * product
 
     def get_boundary_conditions(self, size):
         '''Creates the boundary condition for the portfolio weights'''
@@ -91,4 +123,4 @@ class MinimumVariancePortfolioOptimizer:
 
     def get_target_constraint(self, weights, expectedReturns):
         '''Ensure that the portfolio return target a given return'''
-        return np.dot(np.matrix(expectedReturns), np.matrix(weights).T).item() - self.target_return
+        return np.dot(expectedReturns, weights) - self.target_return
@@ -0,0 +1,148 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from scipy.linalg import cho_factor, cho_solve
+
+### <summary>
+### Provides an implementation of a convex quadratic program solver based on the alternating direction method of multipliers.
+### It solves: minimize 1/2 x^T.P.x + q^T.x subject to l <= A.x <= u, factorizing the linear system once per problem
+### so each iteration costs O(N^2). The iterations are warm started from the last solution the solver found, so solving
+### a problem that changed little since the previous one, like a daily rebalance, takes few iterations.
+### </summary>
+### <remarks>Stellato, B., Banjac, G., Goulart, P., Bemporad, A., & Boyd, S. (2020). OSQP: An operator splitting solver for
+### quadratic programs. Mathematical Programming Computation, 12(4), 637-672.</remarks>
+class QuadraticProgramSolver:
+    '''Provides an implementation of a convex quadratic program solver based on the alternating direction method of multipliers'''
+    def __init__(self,
+                 max_iterations = 4000,
+                 absolute_tolerance = 1e-8,
+                 relative_tolerance = 1e-8,
+                 rho = 0.1,
+                 sigma = 1e-6,
+                 alpha = 1.6):
+        '''Initialize the QuadraticProgramSolver
+        Args:
+            max_iterations(int): The maximum number of iterations
+            absolute_tolerance(float): The absolute tolerance of the primal and dual residuals
+            relative_tolerance(float): The relative tolerance of the primal and dual residuals
+            rho(float): The step size of the inequality constraints, equality constraints use a thousand times larger one
+            sigma(float): The regularization of the linear system, keeps it positive definite for singular P
+            alpha(float): The relaxation parameter, between 0 and 2'''
+        self.max_iterations = max_iterations
+        self.absolute_tolerance = absolute_tolerance
+        self.relative_tolerance = relative_tolerance
+        self.rho = rho
+        self.sigma = sigma
+        self.alpha = alpha
+        self.last_labels = None
+        self.last_solution = None
+
+    def Solve(self, P, q, A = None, lower = None, upper = None, x0 = None, y0 = None, labels = None):
+        '''
+        Solve the quadratic program
+        args:
+            P: Positive semidefinite matrix of the quadratic term of the objective (size: N x N).
+            q: Array of the linear term of the objective (size: N x 1).
+            A: Matrix of the constraints (size: M x N). If None, the problem is unconstrained.
+            lower: Array of the lower bounds of the constraints, -inf if unbounded (size: M x 1).
+            upper: Array of the upper bounds of the constraints, inf if unbounded (size: M x 1).
+            x0: Optional initial solution, like the solution of a previous similar problem (size: N x 1).
+            y0: Optional initial dual solution of the constraints (size: M x 1).
+            labels: Optional labels of the variables, like the symbols. If given and x0 is not, the solution starts
+                    from the last solution found for the same labels
+        Returns:
+            tuple of the solution, the dual solution and whether the solver converged
+        '''
+        P = np.ascontiguousarray(P, dtype = float)
+        q = np.ascontiguousarray(q, dtype = float).ravel()
+        size = len(q)
+
+        # the objective is scaled so the tolerances and step sizes don't depend on the magnitude of the returns
+        scale = np.mean(np.abs(np.diag(P))) if size > 0 else 0
+        scale = 1 / scale if scale > 0 else 1
+        P = P * scale
+        q = q * scale
+
+        if A is None:
+            x = np.linalg.lstsq(P, -q, rcond = None)[0]
+            return x, np.empty(0), bool(np.all(np.isfinite(x)))
+
+        # each constraint is normalized, so constraints on values of different magnitudes converge alike
+        A = np.ascontiguousarray(A, dtype = float)
+        norms = np.max(np.abs(A), axis = 1)
+        norms[norms == 0] = 1
+        A = A / norms[:, None]
+        lower = np.asarray(lower, dtype = float) / norms
+        upper = np.asarray(upper, dtype = float) / norms
+
+        rho = np.where(lower == upper, 1e3 * self.rho, self.rho)
+        factor = cho_factor(P + self.sigma * np.eye(size) + A.T @ (rho[:, None] * A))
+
+        if x0 is None and labels is not None:
+            x0, y0 = self.get_warm_start(labels, len(A))
+        x = np.zeros(size) if x0 is None else np.array(x0, dtype = float)
+        z = np.clip(A @ x, lower, upper)
+        y = np.zeros(len(A)) if y0 is None or len(y0) != len(A) else np.array(y0, dtype = float) * norms * scale
+
+        converged = False
+        for iteration in range(1, self.max_iterations + 1):
+            previousY = y
+            xTilde = cho_solve(factor, self.sigma * x - q + A.T @ (rho * z - y))
+            zTilde = A @ xTilde
+            x = self.alpha * xTilde + (1 - self.alpha) * x
+            zRelaxed = self.alpha * zTilde + (1 - self.alpha) * z
+            z = np.clip(zRelaxed + y / rho, lower, upper)
+            y = y + rho * (zRelaxed - z)
+
+            if iteration % 10 == 0:
+                converged = self.has_converged(P, q, A, x, y, z)
+                if converged or self.is_primal_infeasible(A, lower, upper, y - previousY):
+                    break
+
+        y = y / (scale * norms)
+        if converged and labels is not None:
+            self.last_labels = pd.Index(labels)
+            self.last_solution = (x, y)
+        return x, y, converged
+
+    def get_warm_start(self, labels, constraints):
+        '''Gets the last solution for the given labels, variables that are new start at zero.
+        The dual solution is only kept when the variables and the number of constraints did not change'''
+        if self.last_solution is None:
+            return None, None
+        x, y = self.last_solution
+        if self.last_labels.equals(pd.Index(labels)):
+            return x, (y if len(y) == constraints else None)
+        return pd.Series(x, index = self.last_labels).reindex(labels).fillna(0).to_numpy(), None
+
+    def has_converged(self, P, q, A, x, y, z):
+        '''Checks whether the primal and dual residuals are within the tolerances'''
+        Ax = A @ x
+        Px = P @ x
+        ATy = A.T @ y
+        primal = np.max(np.abs(Ax - z))
+        dual = np.max(np.abs(Px + q + ATy))
+        return (primal <= self.absolute_tolerance + self.relative_tolerance * max(np.max(np.abs(Ax)), np.max(np.abs(z)))
+            and dual <= self.absolute_tolerance + self.relative_tolerance * max(np.max(np.abs(Px)), np.max(np.abs(ATy)), np.max(np.abs(q))))
+
+    def is_primal_infeasible(self, A, lower, upper, deltaY):
+        '''Checks whether the change of the dual solution certifies that the constraints can't be satisfied'''
+        norm = np.max(np.abs(deltaY))
+        if norm == 0:
+            return False
+        tolerance = 1e-6 * norm
+        positive = deltaY > 0
+        negative = deltaY < 0
+        bound = upper[positive] @ deltaY[positive] + lower[negative] @ deltaY[negative]
+        return np.max(np.abs(A.T @ deltaY)) <= tolerance and bound < -tolerance
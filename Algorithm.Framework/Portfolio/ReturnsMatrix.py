@@ -0,0 +1,207 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Portfolio.CovarianceEstimator import CovarianceEstimator
+
+### <summary>
+### Rolling window of the returns of a set of symbols, stored in preallocated numpy ring buffers with a row per symbol.
+### The optimization based portfolio construction models read their returns data frame from it
+### instead of building a pandas.Series per symbol on each rebalance.
+### While every symbol has returns at the same times, the matrix also keeps their mean and covariance up to date
+### as each cross section of returns is completed.
+### </summary>
+class ReturnsMatrix:
+    def __init__(self, period, capacity = 16, halfLife = None):
+        """Initialize the matrix
+        Args:
+            period(int): The number of returns kept for each symbol
+            capacity(int): The initial number of symbol rows, the matrix grows as symbols are added
+            halfLife(float): The half life of the exponentially weighted moments. If None, the sample moments of the period are used"""
+        self.period = period
+        self.values = np.full((capacity, period), np.nan)
+        self.times = np.zeros((capacity, period), dtype='datetime64[ns]')
+        # the number of returns held by each row and the position of its next return
+        self.counts = np.zeros(capacity, dtype=np.int64)
+        self.heads = np.zeros(capacity, dtype=np.int64)
+        self.rowBySymbol = {}
+        self.freeRows = list(range(capacity - 1, -1, -1))
+
+        # the estimator only follows the rows of the symbols there were when it was rebuilt, in this order
+        self.estimator = CovarianceEstimator(period, 0, halfLife)
+        self.estimatorRows = np.empty(0, dtype=np.int64)
+        self.estimatorIsValid = False
+        # the time of the cross section being completed and the number of symbols that have a return at that time
+        self.crossSectionTime = None
+        self.crossSectionCount = 0
+
+    def __contains__(self, symbol):
+        return symbol in self.rowBySymbol
+
+    def __len__(self):
+        return len(self.rowBySymbol)
+
+    def Add(self, symbol):
+        """Adds an empty row for the symbol if it doesn't have one
+        Args:
+            symbol: The symbol to add"""
+        if symbol in self.rowBySymbol:
+            return
+        if not self.freeRows:
+            self.grow()
+        self.rowBySymbol[symbol] = self.freeRows.pop()
+        self.estimatorIsValid = False
+
+    def Remove(self, symbol):
+        """Removes the row of the symbol, it is reused by the next symbol that is added
+        Args:
+            symbol: The symbol to remove"""
+        row = self.rowBySymbol.pop(symbol, None)
+        if row is None:
+            return
+        self.values[row] = np.nan
+        self.counts[row] = 0
+        self.heads[row] = 0
+        self.freeRows.append(row)
+        self.estimatorIsValid = False
+
+    def Update(self, symbol, time, value):
+        """Adds a return of the symbol, replacing its oldest one once the row is full
+        Args:
+            symbol: The symbol of the return
+            time: The end time of the return
+            value: The return"""
+        self.Add(symbol)
+        row = self.rowBySymbol[symbol]
+        head = self.heads[row]
+        time = np.datetime64(time, 'ns')
+        # the moments can't follow returns that are not added in order
+        if self.counts[row] > 0 and self.times[row, head - 1] >= time:
+            self.estimatorIsValid = False
+        self.values[row, head] = value
+        self.times[row, head] = time
+        self.heads[row] = (head + 1) % self.period
+        self.counts[row] = min(self.counts[row] + 1, self.period)
+        self.updateEstimator(time)
+
+    def Samples(self, symbol):
+        """Gets the number of returns held for the symbol"""
+        row = self.rowBySymbol.get(symbol)
+        return 0 if row is None else int(self.counts[row])
+
+    def IsReady(self, symbol):
+        """True if the row of the symbol holds a full period of returns"""
+        return self.Samples(symbol) == self.period
+
+    def Latest(self, symbol):
+        """Gets the end time and value of the most recent return of the symbol, None if it has none"""
+        row = self.rowBySymbol.get(symbol)
+        if row is None or self.counts[row] == 0:
+            return None
+        head = (self.heads[row] - 1) % self.period
+        return pd.Timestamp(self.times[row, head]).to_pydatetime(), self.values[row, head]
+
+    def GetRow(self, symbol):
+        """Gets the end times and values of the returns of the symbol, oldest first
+        Returns:
+            tuple of the datetime64 times array and the float64 values array"""
+        row = self.rowBySymbol.get(symbol)
+        if row is None:
+            return np.empty(0, dtype='datetime64[ns]'), np.empty(0)
+        count = self.counts[row]
+        if count < self.period:
+            return self.times[row, :count], self.values[row, :count]
+        order = np.roll(np.arange(self.period), -self.heads[row])
+        return self.times[row, order], self.values[row, order]
+
+    def GetMoments(self, symbols, columns = None):
+        """Gets the mean and covariance of the returns of the given symbols, kept up to date as the returns are added
+        Args:
+            symbols: The symbols of the moments, in order
+            columns: Optional labels, by default the symbols
+        Returns:
+            tuple of the pandas.Series of the mean and the pandas.DataFrame of the covariance,
+            None if the symbols don't have returns at the same times, in which case they need to be computed from the returns"""
+        if not symbols or any(symbol not in self.rowBySymbol for symbol in symbols):
+            return None
+        if not self.estimatorIsValid and not self.rebuildEstimator():
+            return None
+        # some symbols already have returns of a cross section that is not completed yet
+        if self.crossSectionCount != len(self.rowBySymbol):
+            return None
+
+        columns = symbols if columns is None else columns
+        indices = np.searchsorted(self.estimatorRows, [self.rowBySymbol[symbol] for symbol in symbols])
+        mean = pd.Series(self.estimator.Mean(indices), index = columns)
+        covariance = pd.DataFrame(self.estimator.Covariance(indices), index = columns, columns = columns)
+        return mean, covariance
+
+    def GetReturns(self, symbols, columns = None):
+        """Gets the returns of the given symbols as a data frame with a column per symbol and a row per end time
+        Args:
+            symbols: The symbols of the columns, in order
+            columns: Optional column labels, by default the symbols
+        Returns:
+            pandas.DataFrame of the returns, NaN where a symbol has no return at a time"""
+        columns = symbols if columns is None else columns
+        rows = [self.GetRow(symbol) for symbol in symbols]
+        if not rows:
+            return pd.DataFrame()
+
+        # the usual case: every symbol has returns at the same times, the rows are the data frame as is
+        if self.isAligned(rows):
+            times = rows[0][0]
+            return pd.DataFrame(np.column_stack([values for _, values in rows]), index = pd.DatetimeIndex(times), columns = columns)
+
+        # else we align the returns on their times, sorting them
+        return pd.DataFrame({ column: pd.Series(values, index = pd.DatetimeIndex(rowTimes)) for column, (rowTimes, values) in zip(columns, rows) })
+
+    def isAligned(self, rows):
+        times = rows[0][0]
+        return all(np.array_equal(rowTimes, times) for rowTimes, _ in rows) and np.all(times[1:] > times[:-1])
+
+    def updateEstimator(self, time):
+        if time != self.crossSectionTime:
+            # a new cross section starts before the last one was completed
+            if self.crossSectionTime is not None and (time < self.crossSectionTime or self.crossSectionCount < len(self.rowBySymbol)):
+                self.estimatorIsValid = False
+            self.crossSectionTime = time
+            self.crossSectionCount = 0
+        self.crossSectionCount += 1
+
+        if self.estimatorIsValid and self.crossSectionCount == len(self.rowBySymbol):
+            rows = self.estimatorRows
+            self.estimator.Update(self.values[rows, (self.heads[rows] - 1) % self.period])
+
+    def rebuildEstimator(self):
+        # the symbols are sorted by row, so the estimator index of a row is found with a binary search
+        symbols = sorted(self.rowBySymbol, key = self.rowBySymbol.get)
+        rows = [self.GetRow(symbol) for symbol in symbols]
+        if not rows or not self.isAligned(rows):
+            return False
+
+        self.estimatorRows = np.array([self.rowBySymbol[symbol] for symbol in symbols], dtype=np.int64)
+        self.estimator.Rebuild(np.column_stack([values for _, values in rows]))
+        self.crossSectionTime = rows[0][0][-1] if len(rows[0][0]) > 0 else None
+        self.crossSectionCount = len(rows)
+        self.estimatorIsValid = True
+        return True
+
+    def grow(self):
+        capacity = len(self.counts)
+        self.values = np.vstack([self.values, np.full((capacity, self.period), np.nan)])
+        self.times = np.vstack([self.times, np.zeros((capacity, self.period), dtype='datetime64[ns]')])
+        self.counts = np.concatenate([self.counts, np.zeros(capacity, dtype=np.int64)])
+        self.heads = np.concatenate([self.heads, np.zeros(capacity, dtype=np.int64)])
+        self.freeRows.extend(range(2 * capacity - 1, capacity - 1, -1))
+        self.estimatorIsValid = False
@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+from Portfolio.ReturnsMatrix import ReturnsMatrix
 
 ### <summary>
 ### Risk Parity Portfolio Construction Model
@@ -51,6 +52,7 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
         self.optimizer = RiskParityPortfolioOptimizer() if optimizer is None else optimizer
 
         self.symbolDataBySymbol = {}
+        self.returnsMatrix = ReturnsMatrix(period)
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancingFunc
@@ -77,12 +79,18 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
 
         symbols = [insight.Symbol for insight in activeInsights]
 
-        # Create a dictionary keyed by the symbols in the insights with an pandas.Series as value to create a data frame
-        returns = { str(symbol) : data.Return for symbol, data in self.symbolDataBySymbol.items() if symbol in symbols }
-        returns = pd.DataFrame(returns)
-
-        # The portfolio optimizer finds the optional weights for the given data
-        weights = self.optimizer.Optimize(returns)
+        # Create a data frame with a column per symbol in the insights from the shared returns matrix
+        symbols = [symbol for symbol in self.symbolDataBySymbol if symbol in symbols]
+        columns = [str(symbol) for symbol in symbols]
+        returns = self.returnsMatrix.GetReturns(symbols, columns)
+
+        # The portfolio optimizer finds the optional weights for the given data,
+        # using the covariance kept up to date by the returns matrix when available
+        moments = None if getattr(self.optimizer, 'covariance_estimator', None) is not None else self.returnsMatrix.GetMoments(symbols, columns)
+        if moments is None:
+            weights = self.optimizer.Optimize(returns)
+        else:
+            weights = self.optimizer.Optimize(returns, covariance = moments[1].to_numpy())
         weights = pd.Series(weights, index = returns.columns)
 
         # Create portfolio targets from the specified insights
@@ -105,52 +113,49 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
 
         # initialize data for added securities
         symbols = [ x.Symbol for x in changes.AddedSecurities ]
-        history = algorithm.History(symbols, self.lookback * self.period, self.resolution)
-        if history.empty: return
-
-        tickers = history.index.levels[0]
-        for ticker in tickers:
-            symbol = SymbolCache.GetSymbol(ticker)
+        closes, historySymbols, times = algorithm.HistoryArray(symbols, self.lookback * self.period, self.resolution)
+        times = pd.DatetimeIndex(times).to_pydatetime()
 
+        for symbol, close in zip(historySymbols, closes):
             if symbol not in self.symbolDataBySymbol:
-                symbolData = self.RiskParitySymbolData(symbol, self.lookback, self.period)
-                symbolData.WarmUpIndicators(history.loc[ticker])
+                symbolData = self.RiskParitySymbolData(symbol, self.lookback, self.returnsMatrix)
+                symbolData.WarmUpIndicators(times, close)
                 self.symbolDataBySymbol[symbol] = symbolData
 
     class RiskParitySymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, returnsMatrix):
             self.symbol = symbol
             self.roc = RateOfChange(f'{symbol}.ROC({lookback})', lookback)
             self.roc.Updated += self.OnRateOfChangeUpdated
-            self.window = RollingWindow[IndicatorDataPoint](period)
+            self.returnsMatrix = returnsMatrix
+            self.returnsMatrix.Add(symbol)
 
         def Reset(self):
             self.roc.Updated -= self.OnRateOfChangeUpdated
             self.roc.Reset()
-            self.window.Reset()
+            self.returnsMatrix.Remove(self.symbol)
 
-        def WarmUpIndicators(self, history):
-            for tuple in history.itertuples():
-                self.roc.Update(tuple.Index, tuple.close)
+        def WarmUpIndicators(self, times, closes):
+            for time, close in zip(times, closes):
+                if not np.isnan(close):
+                    self.roc.Update(time, close)
 
         def OnRateOfChangeUpdated(self, roc, value):
             if roc.IsReady:
-                self.window.Add(value)
+                self.returnsMatrix.Update(self.symbol, value.EndTime, value.Value)
 
         def Add(self, time, value):
-            item = IndicatorDataPoint(self.symbol, time, value)
-            self.window.Add(item)
+            self.returnsMatrix.Update(self.symbol, time, value)
 
         @property
         def Return(self):
-            return pd.Series(
-                data = [x.Value for x in self.window],
-                index = [x.EndTime for x in self.window])
+            times, values = self.returnsMatrix.GetRow(self.symbol)
+            return pd.Series(data = values, index = pd.DatetimeIndex(times))
 
         @property
         def IsReady(self):
-            return self.window.IsReady
+            return self.returnsMatrix.IsReady(self.symbol)
 
         def __str__(self, **kwargs):
-            return '{}: {:.2%}'.format(self.roc.Name, self.window[0])
+            return '{}: {:.2%}'.format(self.roc.Name, self.returnsMatrix.Latest(self.symbol)[1])
@@ -22,13 +22,16 @@ class RiskParityPortfolioOptimizer:
     
     def __init__(self, 
                  minimum_weight = 1e-05, 
-                 maximum_weight = sys.float_info.max):
+                 maximum_weight = sys.float_info.max,
+                 covariance_estimator = None):
         '''Initialize the RiskParityPortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
-            maximum_weight(float): The upper bounds on portfolio weights'''
+            maximum_weight(float): The upper bounds on portfolio weights
+            covariance_estimator: Estimates the covariance of the historical returns when it is not given, like LedoitWolfCovarianceEstimator. If None, the sample covariance is used'''
         self.minimum_weight = minimum_weight if minimum_weight >= 1e-05 else 1e-05
         self.maximum_weight = maximum_weight if maximum_weight >= minimum_weight else minimum_weight
+        self.covariance_estimator = covariance_estimator
 
     def Optimize(self, historicalReturns, budget = None, covariance = None):
         '''
@@ -41,7 +44,7 @@ class RiskParityPortfolioOptimizer:
             Array of double with the portfolio weights (size: K x 1)
         '''
         if covariance is None:
-            covariance = np.cov(historicalReturns.T)
+            covariance = np.cov(historicalReturns.T) if self.covariance_estimator is None else self.covariance_estimator.Estimate(historicalReturns)
 
         size = historicalReturns.columns.size   # K x 1
         
@@ -53,10 +56,11 @@ class RiskParityPortfolioOptimizer:
         # lw <= x <= up
         x0 = np.array(size * [1. / size])
         budget = budget if budget is not None else x0
-        objective = lambda weights: 0.5 * weights.T @ covariance @ weights - budget.T @ np.log(weights)
+        objective = lambda weights: 0.5 * weights.T @ (covariance @ weights) - budget.T @ np.log(weights)
         gradient = lambda weights: covariance @ weights - budget / weights
-        hessian = lambda weights: covariance + np.diag((budget / weights**2).flatten())
-        solver = minimize(objective, jac=gradient, hess=hessian, x0=x0, method="Newton-CG")
+        # Newton-CG only needs the products of the hessian, so a low rank covariance is never made dense
+        hessianProduct = lambda weights, p: covariance @ p + (budget / weights**2).flatten() * p
+        solver = minimize(objective, jac=gradient, hessp=hessianProduct, x0=x0, method="Newton-CG")
 
         if not solver["success"]: return x0
         # Normalize weights: w = x / x^T.1
@@ -11,7 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from numpy import dot
+from numpy import asarray, dot
 from numpy.linalg import inv
 
 ### <summary>
@@ -19,6 +19,15 @@ from numpy.linalg import inv
 ### </summary>
 class UnconstrainedMeanVariancePortfolioOptimizer:
     '''Provides an implementation of a portfolio optimizer with unconstrained mean variance.'''
+    def __init__(self, covariance_estimator = None, solver = None):
+        '''Initialize the UnconstrainedMeanVariancePortfolioOptimizer
+        Args:
+            covariance_estimator: Estimates the covariance of the historical returns when it is not given, like LedoitWolfCovarianceEstimator. If None, the sample covariance is used
+            solver: Solves the optimization as a quadratic program, like QuadraticProgramSolver. Without constraints it is a least squares
+                    solution of S.w = µ, which also handles a singular covariance. If None, the covariance is inverted'''
+        self.covariance_estimator = covariance_estimator
+        self.solver = solver
+
     def Optimize(self, historicalReturns, expectedReturns = None, covariance = None):
         '''
         Perform portfolio optimization for a provided matrix of historical returns and an array of expected returns
@@ -32,6 +41,10 @@ class UnconstrainedMeanVariancePortfolioOptimizer:
         if expectedReturns is None:
             expectedReturns = historicalReturns.mean()
         if covariance is None:
-            covariance = historicalReturns.cov()
+            covariance = historicalReturns.cov() if self.covariance_estimator is None else self.covariance_estimator.Estimate(historicalReturns)
+
+        if self.solver is not None:
+            # maximize µ^T.w - 1/2 w^T.S.w
+            return self.solver.Solve(covariance, -asarray(expectedReturns, dtype = float))[0]
 
         return expectedReturns.dot(inv(covariance))
\ No newline at end of file
@@ -0,0 +1,37 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Alphas.HistoricalReturnsAlphaModel import HistoricalReturnsAlphaModel
+from Portfolio.BlackLittermanOptimizationPortfolioConstructionModel import *
+
+class BlackLittermanOptimizationPortfolioConstructionBenchmark(QCAlgorithm):
+    '''Benchmark of the python BlackLittermanOptimizationPortfolioConstructionModel over a several hundred symbol universe'''
+
+    def Initialize(self):
+        self.SetStartDate(2018, 1, 1)
+        self.SetEndDate(2018, 4, 1)
+        self.SetCash(1000000)
+
+        self.UniverseSettings.Resolution = Resolution.Daily
+        self.numberOfSymbols = 300
+
+        self.SetUniverseSelection(CoarseFundamentalUniverseSelectionModel(self.CoarseSelectionFunction))
+        self.SetAlpha(HistoricalReturnsAlphaModel(resolution = Resolution.Daily))
+        self.SetPortfolioConstruction(BlackLittermanOptimizationPortfolioConstructionModel(Expiry.EndOfWeek))
+
+    # sort the data by daily dollar volume and take the top 'NumberOfSymbols'
+    def CoarseSelectionFunction(self, coarse):
+        selected = [x for x in coarse if (x.HasFundamentalData)]
+        sortedByDollarVolume = sorted(selected, key=lambda x: x.DollarVolume, reverse=True)
+        return [ x.Symbol for x in sortedByDollarVolume[:self.numberOfSymbols] ]
@@ -0,0 +1,43 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Alphas.RsiAlphaModel import RsiAlphaModel
+from Portfolio.EqualWeightingPortfolioConstructionModel import EqualWeightingPortfolioConstructionModel
+from Execution.VolumeWeightedAveragePriceExecutionModel import VolumeWeightedAveragePriceExecutionModel
+from Risk.TrailingStopRiskManagementModel import TrailingStopRiskManagementModel
+
+class ExecutionAndRiskManagementModelsBenchmark(QCAlgorithm):
+    '''Benchmark of the python VolumeWeightedAveragePriceExecutionModel and TrailingStopRiskManagementModel over a several hundred symbol universe'''
+
+    def Initialize(self):
+        self.SetStartDate(2018, 1, 1)
+        self.SetEndDate(2018, 2, 1)
+        self.SetCash(10000000)
+
+        # the execution model splits orders intraday so we need minute data
+        self.UniverseSettings.Resolution = Resolution.Minute
+        self.numberOfSymbols = 300
+
+        self.SetUniverseSelection(CoarseFundamentalUniverseSelectionModel(self.CoarseSelectionFunction))
+        # using hourly rsi to generate more insights
+        self.SetAlpha(RsiAlphaModel(14, Resolution.Hour))
+        self.SetPortfolioConstruction(EqualWeightingPortfolioConstructionModel())
+        self.SetExecution(VolumeWeightedAveragePriceExecutionModel())
+        self.SetRiskManagement(TrailingStopRiskManagementModel(0.01))
+
+    # sort the data by daily dollar volume and take the top 'NumberOfSymbols'
+    def CoarseSelectionFunction(self, coarse):
+        selected = [x for x in coarse if (x.HasFundamentalData)]
+        sortedByDollarVolume = sorted(selected, key=lambda x: x.DollarVolume, reverse=True)
+        return [ x.Symbol for x in sortedByDollarVolume[:self.numberOfSymbols] ]
@@ -0,0 +1,40 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Alphas.EmaCrossAlphaModel import EmaCrossAlphaModel
+from Alphas.MacdAlphaModel import MacdAlphaModel
+from Alphas.RsiAlphaModel import RsiAlphaModel
+from Portfolio.NullPortfolioConstructionModel import NullPortfolioConstructionModel
+
+class FrameworkAlphaModelsBenchmark(QCAlgorithm):
+    '''Benchmark of the python EmaCrossAlphaModel, MacdAlphaModel and RsiAlphaModel over a several hundred symbol universe'''
+
+    def Initialize(self):
+        self.SetStartDate(2018, 1, 1)
+        self.SetEndDate(2018, 7, 1)
+        self.SetCash(100000)
+
+        self.UniverseSettings.Resolution = Resolution.Daily
+        self.numberOfSymbols = 300
+
+        self.SetUniverseSelection(CoarseFundamentalUniverseSelectionModel(self.CoarseSelectionFunction))
+        self.SetAlpha(CompositeAlphaModel(EmaCrossAlphaModel(), MacdAlphaModel(), RsiAlphaModel()))
+        # we only want to measure the alpha models
+        self.SetPortfolioConstruction(NullPortfolioConstructionModel())
+
+    # sort the data by daily dollar volume and take the top 'NumberOfSymbols'
+    def CoarseSelectionFunction(self, coarse):
+        selected = [x for x in coarse if (x.HasFundamentalData)]
+        sortedByDollarVolume = sorted(selected, key=lambda x: x.DollarVolume, reverse=True)
+        return [ x.Symbol for x in sortedByDollarVolume[:self.numberOfSymbols] ]
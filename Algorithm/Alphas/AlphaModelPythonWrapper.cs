@@ -19,6 +19,7 @@ using QuantConnect.Data.UniverseSelection;
 using System;
 using System.Collections.Generic;
 using QuantConnect.Python;
+using QuantConnect.Util;
 
 namespace QuantConnect.Algorithm.Framework.Alphas
 {
@@ -80,7 +81,11 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         {
             using (Py.GIL())
             {
-                var insights = _model.Update(algorithm, new PythonSlice(data)) as PyObject;
+                PyObject insights;
+                using (PerformanceTracker.Track(PerformanceTarget.PythonAlphaUpdate))
+                {
+                    insights = _model.Update(algorithm, new PythonSlice(data)) as PyObject;
+                }
                 var iterator = insights.GetIterator();
                 foreach (PyObject insight in iterator)
                 {
@@ -18,6 +18,7 @@ using QuantConnect.Algorithm.Framework.Alphas;
 using QuantConnect.Data.UniverseSelection;
 using System;
 using System.Collections.Generic;
+using QuantConnect.Util;
 
 namespace QuantConnect.Algorithm.Framework.Portfolio
 {
@@ -104,7 +105,12 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
         {
             using (Py.GIL())
             {
-                foreach (var target in _model.CreateTargets(algorithm, insights))
+                dynamic targets;
+                using (PerformanceTracker.Track(PerformanceTarget.PythonPortfolioConstruction))
+                {
+                    targets = _model.CreateTargets(algorithm, insights);
+                }
+                foreach (var target in targets)
                 {
                     yield return target;
                 }
@@ -40,6 +40,28 @@ namespace QuantConnect.Algorithm
             set;
         }
 
+        /// <summary>
+        /// Gets the cache of history results, null unless enabled by <see cref="SetHistoryCache(int)"/>.
+        /// Exposes the cache hits, misses and evictions
+        /// </summary>
+        [DocumentationAttribute(HistoricalData)]
+        public HistoryCache HistoryCache
+        {
+            get;
+            private set;
+        }
+
+        /// <summary>
+        /// Enables caching the results of the history requests so repeated identical requests, same symbols, resolution,
+        /// range and normalization, don't read the data again. The least recently used results are evicted first
+        /// </summary>
+        /// <param name="maximumDataPoints">The maximum number of data points to keep cached, zero disables the cache</param>
+        [DocumentationAttribute(HistoricalData)]
+        public void SetHistoryCache(int maximumDataPoints)
+        {
+            HistoryCache = maximumDataPoints > 0 ? new HistoryCache(maximumDataPoints) : null;
+        }
+
         /// <summary>
         /// Gets whether or not this algorithm is still warming up
         /// </summary>
@@ -843,7 +865,9 @@ namespace QuantConnect.Algorithm
             }
 
             // filter out future data to prevent look ahead bias
-            var history = HistoryProvider.GetHistory(filteredRequests, timeZone);
+            var history = HistoryCache == null
+                ? ReadHistory(filteredRequests, timeZone)
+                : HistoryCache.GetHistory(filteredRequests, timeZone, () => ReadHistory(filteredRequests, timeZone));
 
             if (hasPythonDataRequest && PythonEngine.IsInitialized)
             {
@@ -854,6 +878,11 @@ namespace QuantConnect.Algorithm
             return history;
         }
 
+        private IEnumerable<Slice> ReadHistory(List<HistoryRequest> requests, DateTimeZone timeZone)
+        {
+            return PerformanceTracker.Track(HistoryProvider.GetHistory(requests, timeZone), PerformanceTarget.HistoryRequest);
+        }
+
         /// <summary>
         /// Helper method to create history requests from a date range
         /// </summary>
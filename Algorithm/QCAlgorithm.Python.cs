@@ -846,15 +846,16 @@ namespace QuantConnect.Algorithm
         /// <param name="dataNormalizationMode">The price scaling mode to use for the securities history</param>
         /// <param name="contractDepthOffset">The continuous contract desired offset from the current front month.
         /// For example, 0 will use the front month, 1 will use the back month contract</param>
+        /// <param name="columns">Optional columns of the data frame to convert, e.g. ["close"], by default all the columns with data are converted</param>
         /// <returns>A python dictionary with pandas DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject tickers, int periods, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null)
+            int? contractDepthOffset = null, string[] columns = null)
         {
             var symbols = tickers.ConvertToSymbolEnumerable();
             return GetDataFrame(History(symbols, periods, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode,
-                contractDepthOffset));
+                contractDepthOffset), columns: columns);
         }
 
         /// <summary>
@@ -870,15 +871,16 @@ namespace QuantConnect.Algorithm
         /// <param name="dataNormalizationMode">The price scaling mode to use for the securities history</param>
         /// <param name="contractDepthOffset">The continuous contract desired offset from the current front month.
         /// For example, 0 will use the front month, 1 will use the back month contract</param>
+        /// <param name="columns">Optional columns of the data frame to convert, e.g. ["close"], by default all the columns with data are converted</param>
         /// <returns>A python dictionary with pandas DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject tickers, TimeSpan span, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null)
+            int? contractDepthOffset = null, string[] columns = null)
         {
             var symbols = tickers.ConvertToSymbolEnumerable();
             return GetDataFrame(History(symbols, span, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode,
-                contractDepthOffset));
+                contractDepthOffset), columns: columns);
         }
 
         /// <summary>
@@ -894,15 +896,16 @@ namespace QuantConnect.Algorithm
         /// <param name="dataNormalizationMode">The price scaling mode to use for the securities history</param>
         /// <param name="contractDepthOffset">The continuous contract desired offset from the current front month.
         /// For example, 0 will use the front month, 1 will use the back month contract</param>
+        /// <param name="columns">Optional columns of the data frame to convert, e.g. ["close"], by default all the columns with data are converted</param>
         /// <returns>A python dictionary with a pandas DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null)
+            int? contractDepthOffset = null, string[] columns = null)
         {
             var symbols = tickers.ConvertToSymbolEnumerable();
             return GetDataFrame(History(symbols, start, end, resolution, fillForward, extendedMarketHours, dataMappingMode,
-                dataNormalizationMode, contractDepthOffset));
+                dataNormalizationMode, contractDepthOffset), columns: columns);
         }
 
         /// <summary>
@@ -920,6 +923,143 @@ namespace QuantConnect.Algorithm
             return GetDataFrame(History(symbols, start, end, resolution));
         }
 
+        /// <summary>
+        /// Gets the historical data for the specified symbols between the specified dates as a sequence of pandas DataFrames,
+        /// one per period of time or number of data points, so long ranges can be processed in constant memory.
+        /// The data is read as the DataFrames are requested. The symbols must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="start">The start time in the algorithm's time zone</param>
+        /// <param name="end">The end time in the algorithm's time zone</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <param name="period">The period of time of each DataFrame. Defaults to one day if no maximum number of rows is given</param>
+        /// <param name="rows">The maximum number of data points of each DataFrame</param>
+        /// <param name="fillForward">True to fill forward missing data, false otherwise</param>
+        /// <param name="extendedMarketHours">True to include extended market hours data, false otherwise</param>
+        /// <param name="dataMappingMode">The contract mapping mode to use for the security history request</param>
+        /// <param name="dataNormalizationMode">The price scaling mode to use for the securities history</param>
+        /// <param name="contractDepthOffset">The continuous contract desired offset from the current front month.
+        /// For example, 0 will use the front month, 1 will use the back month contract</param>
+        /// <returns>An iterable of pandas DataFrames containing the requested historical data</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public IEnumerable<PyObject> HistoryChunks(PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null,
+            TimeSpan? period = null, int? rows = null, bool? fillForward = null, bool? extendedMarketHours = null,
+            DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null, int? contractDepthOffset = null)
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            var history = History(symbols, start, end, resolution, fillForward, extendedMarketHours, dataMappingMode,
+                dataNormalizationMode, contractDepthOffset);
+            if (history is MemoizingEnumerable<Slice> memoizingEnumerable)
+            {
+                // memoizing would keep every slice alive, defeating the purpose of the chunks
+                memoizingEnumerable.Enabled = false;
+            }
+            return PandasConverter.GetDataFrames(history, period, rows);
+        }
+
+        /// <summary>
+        /// Gets the historical data of a single field for the specified symbols as a dense numpy array, without creating a pandas DataFrame.
+        /// The exact number of bars will be returned. The symbols must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="periods">The number of bars to request</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <param name="field">The field to retrieve: open, high, low, close, volume or value</param>
+        /// <returns>A python tuple of the symbols by time float64 array, with NaN where a symbol has no data,
+        /// the list of symbols of its rows and the datetime64 array of the end times of its columns</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject HistoryArray(PyObject tickers, int periods, Resolution? resolution = null, string field = "close")
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return GetNumpyArray(History(symbols, periods, resolution), field);
+        }
+
+        /// <summary>
+        /// Gets the historical data of a single field for the specified symbols over the requested span as a dense numpy array,
+        /// without creating a pandas DataFrame. The symbols must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="span">The span over which to retrieve recent historical data</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <param name="field">The field to retrieve: open, high, low, close, volume or value</param>
+        /// <returns>A python tuple of the symbols by time float64 array, with NaN where a symbol has no data,
+        /// the list of symbols of its rows and the datetime64 array of the end times of its columns</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject HistoryArray(PyObject tickers, TimeSpan span, Resolution? resolution = null, string field = "close")
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return GetNumpyArray(History(symbols, span, resolution), field);
+        }
+
+        /// <summary>
+        /// Gets the historical data of a single field for the specified symbols between the specified dates as a dense numpy array,
+        /// without creating a pandas DataFrame. The symbols must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="start">The start time in the algorithm's time zone</param>
+        /// <param name="end">The end time in the algorithm's time zone</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <param name="field">The field to retrieve: open, high, low, close, volume or value</param>
+        /// <returns>A python tuple of the symbols by time float64 array, with NaN where a symbol has no data,
+        /// the list of symbols of its rows and the datetime64 array of the end times of its columns</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject HistoryArray(PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null, string field = "close")
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return GetNumpyArray(History(symbols, start, end, resolution), field);
+        }
+
+        /// <summary>
+        /// Gets the historical data for the specified symbols as a lazy pandas DataFrame that only converts the columns that are accessed,
+        /// e.g. history.close. Any other use converts the whole DataFrame. The exact number of bars will be returned.
+        /// The symbols must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="periods">The number of bars to request</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <returns>A lazy pandas DataFrame containing the requested historical data</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject HistoryLazy(PyObject tickers, int periods, Resolution? resolution = null)
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return GetLazyDataFrame(History(symbols, periods, resolution));
+        }
+
+        /// <summary>
+        /// Gets the historical data for the specified symbols over the requested span as a lazy pandas DataFrame that only converts
+        /// the columns that are accessed, e.g. history.close. Any other use converts the whole DataFrame. The result is not a
+        /// pandas.DataFrame instance, call to_frame() to pass it to code that checks the type, e.g. pd.concat.
+        /// The symbols must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="span">The span over which to retrieve recent historical data</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <returns>A lazy pandas DataFrame containing the requested historical data</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject HistoryLazy(PyObject tickers, TimeSpan span, Resolution? resolution = null)
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return GetLazyDataFrame(History(symbols, span, resolution));
+        }
+
+        /// <summary>
+        /// Gets the historical data for the specified symbols between the specified dates as a lazy pandas DataFrame that only converts
+        /// the columns that are accessed, e.g. history.close. Any other use converts the whole DataFrame. The result is not a
+        /// pandas.DataFrame instance, call to_frame() to pass it to code that checks the type, e.g. pd.concat.
+        /// The symbols must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="start">The start time in the algorithm's time zone</param>
+        /// <param name="end">The end time in the algorithm's time zone</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <returns>A lazy pandas DataFrame containing the requested historical data</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject HistoryLazy(PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null)
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return GetLazyDataFrame(History(symbols, start, end, resolution));
+        }
+
         /// <summary>
         /// Gets the historical data for the specified symbols between the specified dates. The symbols must exist in the Securities collection.
         /// </summary>
@@ -1446,7 +1586,30 @@ namespace QuantConnect.Algorithm
             return pythonIndicator;
         }
 
-        private PyObject GetDataFrame(IEnumerable<Slice> data, Type dataType = null)
+        private PyObject GetLazyDataFrame(IEnumerable<Slice> data)
+        {
+            if (data is MemoizingEnumerable<Slice> memoizingEnumerable)
+            {
+                // the data is kept by the lazy data frame, we don't need another buffer
+                memoizingEnumerable.Enabled = false;
+            }
+            using (PerformanceTracker.Track(PerformanceTarget.PythonHistoryDataFrame))
+            {
+                return PandasConverter.GetLazyDataFrame(data);
+            }
+        }
+
+        private PyObject GetNumpyArray(IEnumerable<Slice> data, string field)
+        {
+            if (data is MemoizingEnumerable<Slice> memoizingEnumerable)
+            {
+                // like for the data frame, the user only has access to the final array
+                memoizingEnumerable.Enabled = false;
+            }
+            return PandasConverter.GetNumpyArray(data, field);
+        }
+
+        private PyObject GetDataFrame(IEnumerable<Slice> data, Type dataType = null, IEnumerable<string> columns = null)
         {
             var memoizingEnumerable = data as MemoizingEnumerable<Slice>;
             if (memoizingEnumerable != null)
@@ -1455,7 +1618,10 @@ namespace QuantConnect.Algorithm
                 // the user will only have access to the final pandas data frame object
                 memoizingEnumerable.Enabled = false;
             }
-            return PandasConverter.GetDataFrame(data, dataType);
+            using (PerformanceTracker.Track(PerformanceTarget.PythonHistoryDataFrame))
+            {
+                return PandasConverter.GetDataFrame(data, dataType, columns);
+            }
         }
     }
 }
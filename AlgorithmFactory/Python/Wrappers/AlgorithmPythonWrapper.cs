@@ -26,6 +26,7 @@ using QuantConnect.Interfaces;
 using QuantConnect.Notifications;
 using QuantConnect.Orders;
 using QuantConnect.Python;
+using QuantConnect.Util;
 using QuantConnect.Scheduling;
 using QuantConnect.Securities;
 using QuantConnect.Securities.Future;
@@ -639,6 +640,7 @@ namespace QuantConnect.AlgorithmFactory.Python.Wrappers
             if (_onData != null)
             {
                 using (Py.GIL())
+                using (PerformanceTracker.Track(PerformanceTarget.PythonOnData))
                 {
                     _onData(new PythonSlice(slice));
                 }
@@ -0,0 +1,221 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Linq;
+using System.Threading;
+using System.Collections.Generic;
+using NodaTime;
+
+namespace QuantConnect.Data
+{
+    /// <summary>
+    /// Process local cache of history results keyed by their requests, evicts the least recently used results
+    /// once the cached data points exceed the maximum
+    /// </summary>
+    /// <remarks>The cached slices are shared between the requests that hit them, they should not be modified</remarks>
+    public class HistoryCache
+    {
+        private readonly object _lock = new();
+        private readonly Dictionary<string, LinkedListNode<Entry>> _entries = new();
+        // most recently used first
+        private readonly LinkedList<Entry> _recentlyUsed = new();
+        private long _hits;
+        private long _misses;
+        private long _evictions;
+
+        /// <summary>
+        /// The maximum number of data points held by the cache
+        /// </summary>
+        public int MaximumDataPoints { get; }
+
+        /// <summary>
+        /// The number of data points currently held by the cache
+        /// </summary>
+        public int DataPoints { get; private set; }
+
+        /// <summary>
+        /// The number of cached history results
+        /// </summary>
+        public int Count
+        {
+            get
+            {
+                lock (_lock)
+                {
+                    return _entries.Count;
+                }
+            }
+        }
+
+        /// <summary>
+        /// The number of history requests served from the cache
+        /// </summary>
+        public long Hits => Interlocked.Read(ref _hits);
+
+        /// <summary>
+        /// The number of history requests that were not in the cache
+        /// </summary>
+        public long Misses => Interlocked.Read(ref _misses);
+
+        /// <summary>
+        /// The number of history results evicted to make room for newer ones
+        /// </summary>
+        public long Evictions => Interlocked.Read(ref _evictions);
+
+        /// <summary>
+        /// Creates a new instance
+        /// </summary>
+        /// <param name="maximumDataPoints">The maximum number of data points held by the cache</param>
+        public HistoryCache(int maximumDataPoints)
+        {
+            if (maximumDataPoints <= 0)
+            {
+                throw new ArgumentException($"HistoryCache(): the maximum data points should be positive, was {maximumDataPoints}");
+            }
+            MaximumDataPoints = maximumDataPoints;
+        }
+
+        /// <summary>
+        /// Gets the history of the given requests from the cache or, if missing, from the given factory.
+        /// The history is read lazily and stored once it's fully enumerated, unless it holds more data points than the cache
+        /// </summary>
+        /// <param name="requests">The history requests</param>
+        /// <param name="sliceTimeZone">The time zone of the history slices</param>
+        /// <param name="getHistory">Produces the history of the requests if they are not cached</param>
+        /// <returns>The history of the requests</returns>
+        public IEnumerable<Slice> GetHistory(IEnumerable<HistoryRequest> requests, DateTimeZone sliceTimeZone, Func<IEnumerable<Slice>> getHistory)
+        {
+            var key = $"{sliceTimeZone.Id}|{GetKey(requests)}";
+            lock (_lock)
+            {
+                if (_entries.TryGetValue(key, out var node))
+                {
+                    _recentlyUsed.Remove(node);
+                    _recentlyUsed.AddFirst(node);
+                    Interlocked.Increment(ref _hits);
+                    return node.Value.Slices;
+                }
+            }
+
+            Interlocked.Increment(ref _misses);
+            return Store(key, getHistory());
+        }
+
+        /// <summary>
+        /// Removes all the cached history
+        /// </summary>
+        public void Clear()
+        {
+            lock (_lock)
+            {
+                _entries.Clear();
+                _recentlyUsed.Clear();
+                DataPoints = 0;
+            }
+        }
+
+        /// <summary>
+        /// Returns a string that represents the current object
+        /// </summary>
+        public override string ToString()
+        {
+            return $"Hits: {Hits} Misses: {Misses} Evictions: {Evictions} Count: {Count} DataPoints: {DataPoints}/{MaximumDataPoints}";
+        }
+
+        private IEnumerable<Slice> Store(string key, IEnumerable<Slice> history)
+        {
+            var slices = new List<Slice>();
+            var dataPoints = 0;
+            foreach (var slice in history)
+            {
+                if (slices != null)
+                {
+                    dataPoints += slice.AllData.Count;
+                    if (dataPoints > MaximumDataPoints)
+                    {
+                        // too large to be cached, stop buffering so we don't hold the whole history in memory
+                        slices = null;
+                    }
+                    else
+                    {
+                        slices.Add(slice);
+                    }
+                }
+                yield return slice;
+            }
+
+            if (slices != null)
+            {
+                Add(key, slices, dataPoints);
+            }
+        }
+
+        private void Add(string key, List<Slice> slices, int dataPoints)
+        {
+            lock (_lock)
+            {
+                if (_entries.ContainsKey(key))
+                {
+                    return;
+                }
+                while (DataPoints + dataPoints > MaximumDataPoints)
+                {
+                    var leastRecentlyUsed = _recentlyUsed.Last;
+                    _recentlyUsed.RemoveLast();
+                    _entries.Remove(leastRecentlyUsed.Value.Key);
+                    DataPoints -= leastRecentlyUsed.Value.DataPoints;
+                    Interlocked.Increment(ref _evictions);
+                }
+                _entries[key] = _recentlyUsed.AddFirst(new Entry(key, slices, dataPoints));
+                DataPoints += dataPoints;
+            }
+        }
+
+        /// <summary>
+        /// Creates the cache key of the given requests, every request property that can change the history is part of it
+        /// </summary>
+        private static string GetKey(IEnumerable<HistoryRequest> requests)
+        {
+            return string.Join(";", requests.Select(request => string.Join(",",
+                request.Symbol.ID,
+                request.Symbol.Value,
+                request.DataType.FullName,
+                request.Resolution,
+                request.StartTimeUtc.Ticks,
+                request.EndTimeUtc.Ticks,
+                request.FillForwardResolution,
+                request.IncludeExtendedMarketHours,
+                request.TickType,
+                request.DataNormalizationMode,
+                request.DataMappingMode,
+                request.ContractDepthOffset)));
+        }
+
+        private class Entry
+        {
+            public string Key { get; }
+            public List<Slice> Slices { get; }
+            public int DataPoints { get; }
+
+            public Entry(string key, List<Slice> slices, int dataPoints)
+            {
+                Key = key;
+                Slices = slices;
+                DataPoints = dataPoints;
+            }
+        }
+    }
+}
@@ -2661,7 +2661,11 @@ namespace QuantConnect
         {
             return data =>
             {
-                var result = selector(data);
+                object result;
+                using (PerformanceTracker.Track(PerformanceTarget.PythonSelection))
+                {
+                    result = selector(data);
+                }
                 return ReferenceEquals(result, Universe.Unchanged)
                     ? Universe.Unchanged : ((object[])result).Select(x => (Symbol)x);
             };
@@ -16,43 +16,220 @@ Lean Pandas Remapper
 Wraps key indexing functions of Pandas to remap keys to SIDs when accessing dataframes.
 Allowing support for indexing of Lean created Indexes with tickers like "SPY", Symbol objs, and SIDs
 
+By default every pandas object is remapped. Use set_remapping_scope('lean') to only remap objects created by
+Lean (see is_lean_object) and the disable_remapping() context manager to run third party pandas code at native speed.
 '''
 
+import threading
+import numpy as np
 import pandas as pd
+from functools import lru_cache
+from contextlib import contextmanager
 from pandas.core.indexes.frozen import FrozenList as pdFrozenList
 
 from clr import AddReference
 AddReference("QuantConnect.Common")
 from QuantConnect import *
 
-def mapper(key):
-    '''Maps a Symbol object or a Symbol Ticker (string) to the string representation of
-    Symbol SecurityIdentifier.If cannot map, returns the object
+reserved = frozenset(['high', 'low', 'open', 'close'])
+symbolCacheVersion = None
+
+# attrs flag set on the data frames created by the PandasConverter
+LEAN_ATTRIBUTE = 'lean'
+remapOnlyLeanObjects = False
+remappingState = threading.local()
+
+def set_remapping_scope(scope):
+    '''Sets which pandas objects are remapped: 'all' (default) or 'lean' to only remap objects created by Lean'''
+    global remapOnlyLeanObjects
+    if scope not in ('all', 'lean'):
+        raise ValueError(f"PandasMapper.set_remapping_scope(): scope should be 'all' or 'lean', was '{scope}'")
+    remapOnlyLeanObjects = scope == 'lean'
+
+@contextmanager
+def disable_remapping():
+    '''Context manager that disables the remapping for the current thread, pandas indexing runs natively within it'''
+    remappingState.disabled = getattr(remappingState, 'disabled', 0) + 1
+    try:
+        yield
+    finally:
+        remappingState.disabled -= 1
+
+def tag_lean_object(obj):
+    '''Flags a pandas object as created by Lean, used by the PandasConverter'''
+    obj.attrs[LEAN_ATTRIBUTE] = True
+    return obj
+
+def categorize_symbols(obj):
+    '''Stores the 'symbol' index level of a pandas object as a pandas.Categorical, in place, so the level keeps
+    its integer codes when it becomes a column, e.g. with reset_index or unstack'''
+    index = obj.index
+    if 'symbol' not in index.names:
+        return obj
+    if isinstance(index, pd.MultiIndex):
+        position = index.names.index('symbol')
+        obj.index = index.set_levels(pd.CategoricalIndex(index.levels[position]), level=position)
+    elif not isinstance(index, pd.CategoricalIndex):
+        obj.index = pd.CategoricalIndex(index, name=index.name)
+    return obj
+
+class LazyDataFrame:
+    '''History result that converts the columns of its pandas.DataFrame the first time they are accessed.
+    Column access, e.g. history.close, history['close'] or history[['open', 'close']], only converts the requested columns
+    and returns the rows that have them. Any other attribute, indexing, assignment, operator or numpy conversion converts
+    the whole pandas.DataFrame and applies to it. It is not a pandas.DataFrame instance, so code that checks the type,
+    e.g. isinstance or pd.concat, should be given the pandas.DataFrame returned by to_frame'''
+
+    def __init__(self, source):
+        self._source = source
+        self._columns = list(source.Columns)
+        self._series = {}
+        self._frame = None
+
+    def _load(self, columns):
+        missing = [column for column in columns if column not in self._series]
+        if missing:
+            frame = self._source.Load(missing)
+            for column in missing:
+                self._series[column] = frame[column]
+        return [self._series[column] for column in columns]
+
+    def _is_column(self, key):
+        return self._frame is None and isinstance(key, str) and key in self._columns
+
+    def to_frame(self):
+        '''Converts all the columns and returns the pandas.DataFrame'''
+        if self._frame is None:
+            self._frame = self._source.LoadAll()
+            self._source = None
+            self._series = None
+        return self._frame
+
+    @property
+    def columns(self):
+        if self._frame is None:
+            return pd.Index(self._columns)
+        return self._frame.columns
+
+    @property
+    def empty(self):
+        if self._frame is None:
+            return len(self._columns) == 0
+        return self._frame.empty
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        if self._is_column(name):
+            return self._load([name])[0]
+        return getattr(self.to_frame(), name)
+
+    def __getitem__(self, key):
+        if self._is_column(key):
+            return self._load([key])[0]
+        if type(key) is list and key and all(self._is_column(column) for column in key):
+            return tag_lean_object(pd.concat(self._load(key), axis=1))
+        return self.to_frame()[key]
+
+    def __contains__(self, key):
+        return key in self.columns
+
+    def __len__(self):
+        return len(self.to_frame())
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __repr__(self):
+        return repr(self.to_frame())
+
+    # the pandas.DataFrame is unhashable, like the data frame we forward the comparison operators to
+    __hash__ = None
+
+def forward_to_frame(name):
+    '''Creates a LazyDataFrame method that calls the given method of the converted pandas.DataFrame.
+    Python looks up special methods on the type, so they can't be forwarded by __getattr__'''
+    def forward(self, *args, **kwargs):
+        return getattr(self.to_frame(), name)(*args, **kwargs)
+    forward.__name__ = name
+    return forward
+
+for name in ['__array__', '__setitem__', '__delitem__', '__bool__', '__neg__', '__pos__', '__abs__', '__invert__',
+             '__eq__', '__ne__', '__lt__', '__le__', '__gt__', '__ge__',
+             '__add__', '__sub__', '__mul__', '__truediv__', '__floordiv__', '__mod__', '__pow__', '__matmul__',
+             '__and__', '__or__', '__xor__', '__radd__', '__rsub__', '__rmul__', '__rtruediv__', '__rfloordiv__',
+             '__rmod__', '__rpow__', '__rmatmul__', '__rand__', '__ror__', '__rxor__']:
+    setattr(LazyDataFrame, name, forward_to_frame(name))
+
+def is_lean_object(obj):
+    '''True if the pandas object was created by Lean or derives from one, e.g. with unstack, which keeps the 'symbol' level'''
+    if isinstance(obj, (pd.core.indexing._LocationIndexer, pd.core.indexing._ScalarAccessIndexer)):
+        obj = obj.obj
+    if isinstance(obj, pd.DataFrame):
+        return obj.attrs.get(LEAN_ATTRIBUTE, False) or 'symbol' in obj.index.names or 'symbol' in obj.columns.names
+    if isinstance(obj, pd.Series):
+        return obj.attrs.get(LEAN_ATTRIBUTE, False) or 'symbol' in obj.index.names
+    if isinstance(obj, pd.Index):
+        return 'symbol' in obj.names
+    return False
+
+def should_remap(obj):
+    '''True if lookups on the given pandas object should be remapped'''
+    if getattr(remappingState, 'disabled', 0):
+        return False
+    return not remapOnlyLeanObjects or is_lean_object(obj)
+
+@lru_cache(maxsize=4096)
+def map_string(key):
+    '''Maps a Symbol Ticker (string) to the string representation of the Symbol SecurityIdentifier.
+    Results are memoized, the cache is cleared by mapper when the SymbolCache changes
     '''
+    if key in reserved:
+        return key
+    kvp = SymbolCache.TryGetSymbol(key, None)
+    if kvp[0]:
+        return str(kvp[1].ID)
+    return key
+
+def map_key(key):
+    '''Maps a key without checking the SymbolCache version, see mapper'''
     keyType = type(key)
+    if keyType is str:
+        return map_string(key)
     if keyType is Symbol:
         return str(key.ID)
-    if keyType is str:
-        reserved = ['high', 'low', 'open', 'close']
-        if key in reserved:
-            return key
-        kvp = SymbolCache.TryGetSymbol(key, None)
-        if kvp[0]:
-            return str(kvp[1].ID)
     if keyType is list:
-        return [mapper(x) for x in key]
+        return [map_key(x) for x in key]
     if keyType is tuple:
-        return tuple([mapper(x) for x in key])
+        return tuple([map_key(x) for x in key])
     if keyType is dict:
-        return { k: mapper(v) for k, v in key.items()}
+        return { k: map_key(v) for k, v in key.items()}
+    if keyType is np.ndarray and key.dtype.kind in 'OU':
+        # only object and string arrays can hold tickers, boolean masks and positions are returned as is
+        return np.array(map_key(key.tolist()), dtype=object)
     return key
 
+def mapper(key):
+    '''Maps a Symbol object or a Symbol Ticker (string) to the string representation of
+    Symbol SecurityIdentifier.If cannot map, returns the object
+    '''
+    global symbolCacheVersion
+    # a single call into the SymbolCache per lookup, no matter how many keys are mapped
+    version = SymbolCache.Version
+    if version != symbolCacheVersion:
+        map_string.cache_clear()
+        symbolCacheVersion = version
+    return map_key(key)
+
 def wrap_keyerror_function(f):
     '''Wraps function f with wrapped_function, used for functions that throw KeyError when not found.
     wrapped_function converts the args / kwargs to use alternative index keys and then calls the function. 
     If this fails we fall back to the original key and try it as well, if they both fail we throw our error.
     '''
     def wrapped_function(*args, **kwargs):
+        if not should_remap(args[0]):
+            return f(*args, **kwargs)
+
         # Map args & kwargs and execute function
         try:
             newargs = args
@@ -87,7 +264,7 @@ def wrap_bool_function(f):
 
         # Try the original args; if true just return true
         originalResult = f(*args, **kwargs)
-        if originalResult:
+        if originalResult or not should_remap(args[0]):
             return originalResult
 
         # Try our mapped args; return this result regardless
@@ -99,6 +276,10 @@ def wrap_bool_function(f):
         if len(kwargs) > 0:
             newkwargs = mapper(kwargs)
 
+        # nothing was mapped, the result would be the same
+        if all(x is y for x, y in zip(newargs, args)) and all(newkwargs[k] is v for k, v in kwargs.items()):
+            return originalResult
+
         return f(*newargs, **newkwargs)
 
     wrapped_function.__name__ = f.__name__
@@ -0,0 +1,167 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using Newtonsoft.Json;
+using Python.Runtime;
+using QuantConnect.Util;
+
+namespace QuantConnect
+{
+    /// <summary>
+    /// Machine readable report of the engine throughput and the time spent per engine stage of a backtest
+    /// </summary>
+    public class PerformanceReport
+    {
+        /// <summary>
+        /// Gets the total run time of the algorithm in seconds
+        /// </summary>
+        [JsonProperty(PropertyName = "total-seconds")]
+        public double TotalSeconds { get; set; }
+
+        /// <summary>
+        /// Gets the total number of data points processed, including history requests
+        /// </summary>
+        [JsonProperty(PropertyName = "data-points")]
+        public long DataPoints { get; set; }
+
+        /// <summary>
+        /// Gets the number of data points processed per second
+        /// </summary>
+        [JsonProperty(PropertyName = "data-points-per-second")]
+        public double DataPointsPerSecond
+        {
+            get { return TotalSeconds == 0 ? 0 : DataPoints / TotalSeconds; }
+        }
+
+        /// <summary>
+        /// Gets the time spent and number of calls per <see cref="PerformanceTarget"/>
+        /// </summary>
+        [JsonProperty(PropertyName = "stages")]
+        public Dictionary<string, PerformanceStage> Stages { get; set; }
+
+        /// <summary>
+        /// Gets the number of garbage collections per generation
+        /// </summary>
+        [JsonProperty(PropertyName = "gc-collections")]
+        public int[] GarbageCollections { get; set; }
+
+        /// <summary>
+        /// Gets the total number of bytes allocated in the managed heap
+        /// </summary>
+        [JsonProperty(PropertyName = "total-allocated-bytes")]
+        public long TotalAllocatedBytes { get; set; }
+
+        /// <summary>
+        /// Gets the size of the managed heap in bytes at the end of the run
+        /// </summary>
+        [JsonProperty(PropertyName = "managed-heap-bytes")]
+        public long ManagedHeapBytes { get; set; }
+
+        /// <summary>
+        /// Gets the peak working set of the process in bytes
+        /// </summary>
+        [JsonProperty(PropertyName = "peak-working-set-bytes")]
+        public long PeakWorkingSetBytes { get; set; }
+
+        /// <summary>
+        /// Gets the size in bytes of the python memory blocks traced by tracemalloc at the end of the run.
+        /// Null if python tracemalloc is not tracing, it can be enabled with the PYTHONTRACEMALLOC environment variable
+        /// </summary>
+        [JsonProperty(PropertyName = "python-traced-bytes", NullValueHandling = NullValueHandling.Ignore)]
+        public long? PythonTracedBytes { get; set; }
+
+        /// <summary>
+        /// Gets the peak size in bytes of the python memory blocks traced by tracemalloc
+        /// </summary>
+        [JsonProperty(PropertyName = "python-peak-traced-bytes", NullValueHandling = NullValueHandling.Ignore)]
+        public long? PythonPeakTracedBytes { get; set; }
+
+        /// <summary>
+        /// Creates a new report using the current <see cref="PerformanceTracker"/> timings and garbage collector counters
+        /// </summary>
+        /// <param name="totalSeconds">The total run time of the algorithm in seconds</param>
+        /// <param name="dataPoints">The total number of data points processed</param>
+        public static PerformanceReport Create(double totalSeconds, long dataPoints)
+        {
+            var stages = new Dictionary<string, PerformanceStage>();
+            foreach (PerformanceTarget target in Enum.GetValues(typeof(PerformanceTarget)))
+            {
+                stages[target.ToString()] = new PerformanceStage
+                {
+                    Seconds = PerformanceTracker.GetElapsed(target).TotalSeconds,
+                    Calls = PerformanceTracker.GetCalls(target)
+                };
+            }
+
+            var garbageCollections = new int[GC.MaxGeneration + 1];
+            for (var generation = 0; generation <= GC.MaxGeneration; generation++)
+            {
+                garbageCollections[generation] = GC.CollectionCount(generation);
+            }
+
+            var report = new PerformanceReport
+            {
+                TotalSeconds = totalSeconds,
+                DataPoints = dataPoints,
+                Stages = stages,
+                GarbageCollections = garbageCollections,
+                TotalAllocatedBytes = GC.GetTotalAllocatedBytes(),
+                ManagedHeapBytes = GC.GetTotalMemory(false)
+            };
+
+            using (var process = Process.GetCurrentProcess())
+            {
+                report.PeakWorkingSetBytes = process.PeakWorkingSet64;
+            }
+
+            if (PythonEngine.IsInitialized)
+            {
+                using (Py.GIL())
+                {
+                    using dynamic tracemalloc = Py.Import("tracemalloc");
+                    if ((tracemalloc.is_tracing() as PyObject).GetAndDispose<bool>())
+                    {
+                        using var tracedMemory = tracemalloc.get_traced_memory() as PyObject;
+                        report.PythonTracedBytes = tracedMemory[0].GetAndDispose<long>();
+                        report.PythonPeakTracedBytes = tracedMemory[1].GetAndDispose<long>();
+                    }
+                }
+            }
+
+            return report;
+        }
+    }
+
+    /// <summary>
+    /// Time spent and number of calls of a single engine stage
+    /// </summary>
+    public class PerformanceStage
+    {
+        /// <summary>
+        /// Gets the total time spent in seconds
+        /// </summary>
+        [JsonProperty(PropertyName = "seconds")]
+        public double Seconds { get; set; }
+
+        /// <summary>
+        /// Gets the number of calls
+        /// </summary>
+        [JsonProperty(PropertyName = "calls")]
+        public long Calls { get; set; }
+    }
+}
@@ -0,0 +1,72 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Python.Runtime;
+
+namespace QuantConnect.Python
+{
+    /// <summary>
+    /// Holds the data of a history request grouped by security so the columns of its pandas.DataFrame can be converted on demand.
+    /// Used by the PandasMapper LazyDataFrame
+    /// </summary>
+    public class LazyPandasData
+    {
+        private readonly PandasConverter _converter;
+        private readonly int _maxLevels;
+        private IDictionary<SecurityIdentifier, PandasData> _sliceDataDict;
+
+        /// <summary>
+        /// The sorted names of the columns with data
+        /// </summary>
+        public string[] Columns { get; }
+
+        internal LazyPandasData(PandasConverter converter, IDictionary<SecurityIdentifier, PandasData> sliceDataDict, int maxLevels)
+        {
+            _converter = converter;
+            _sliceDataDict = sliceDataDict;
+            _maxLevels = maxLevels;
+            Columns = sliceDataDict.Values.SelectMany(x => x.Columns).Distinct().OrderBy(x => x, StringComparer.Ordinal).ToArray();
+        }
+
+        /// <summary>
+        /// Converts the given columns into a pandas.DataFrame, the data is kept so other columns can be loaded later
+        /// </summary>
+        /// <param name="columns">The columns to convert</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        public PyObject Load(string[] columns)
+        {
+            return _converter.MakeDataFrame(GetData(), _maxLevels, columns.Select(x => x.ToLowerInvariant()).ToHashSet());
+        }
+
+        /// <summary>
+        /// Converts all the columns into a pandas.DataFrame and releases the data
+        /// </summary>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        public PyObject LoadAll()
+        {
+            var data = GetData();
+            _sliceDataDict = null;
+            return _converter.MakeDataFrame(data, _maxLevels, null);
+        }
+
+        private IDictionary<SecurityIdentifier, PandasData> GetData()
+        {
+            return _sliceDataDict ?? throw new InvalidOperationException("LazyPandasData: the data was released after loading all the columns");
+        }
+    }
+}
@@ -0,0 +1,246 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Runtime.InteropServices;
+using Python.Runtime;
+
+namespace QuantConnect.Python
+{
+    /// <summary>
+    /// Creates numpy arrays from managed buffers, and reads them back, copying straight from one memory into the other instead of converting each value
+    /// </summary>
+    /// <remarks>Requires the GIL to be held</remarks>
+    public static class NumpyArray
+    {
+        private static readonly long _epochTicks = new DateTime(1970, 1, 1).Ticks;
+
+        // numpy stores NaT as the smallest int64
+        private const long NotATime = long.MinValue;
+        // the range of ticks from the epoch that fit in int64 nanoseconds
+        private const long MinimumTicks = long.MinValue / 100;
+        private const long MaximumTicks = long.MaxValue / 100;
+
+        // we keep these so we don't need to ask for them each time
+        private static PyObject _empty;
+        private static PyObject _zeros;
+        private static PyObject _ascontiguousarray;
+        private static PyString _float64;
+        private static PyString _float32;
+        private static PyString _int64;
+        private static PyString _datetime64;
+
+        /// <summary>
+        /// Creates a float64 numpy array holding the given values
+        /// </summary>
+        public static PyObject Create(IList<double> values)
+        {
+            return Create(values, GetDType(ref _float64, "float64"));
+        }
+
+        /// <summary>
+        /// Creates a float32 numpy array holding the given values, with half the memory of float64 and about 7 significant digits
+        /// </summary>
+        public static PyObject CreateFloat32(IList<double> values)
+        {
+            return Create<float>(values.Count, GetDType(ref _float32, "float32"), destination =>
+            {
+                for (var i = 0; i < destination.Length; i++)
+                {
+                    destination[i] = (float)values[i];
+                }
+            });
+        }
+
+        /// <summary>
+        /// Creates a two dimensional float64 numpy array holding the given values
+        /// </summary>
+        public static PyObject Create(double[,] values)
+        {
+            var rows = values.GetLength(0);
+            var columns = values.GetLength(1);
+            using var array = Create<double>(values.Length, GetDType(ref _float64, "float64"),
+                destination => MemoryMarshal.CreateReadOnlySpan(ref values[0, 0], values.Length).CopyTo(destination));
+            using var reshape = array.GetAttr("reshape");
+            using var pyRows = rows.ToPython();
+            using var pyColumns = columns.ToPython();
+            return reshape.Invoke(pyRows, pyColumns);
+        }
+
+        /// <summary>
+        /// Creates an int64 numpy array holding the given values
+        /// </summary>
+        public static PyObject Create(IList<long> values)
+        {
+            return Create(values, GetDType(ref _int64, "int64"));
+        }
+
+        /// <summary>
+        /// Creates a datetime64[ns] numpy array holding the given times
+        /// </summary>
+        /// <remarks>Times numpy can't represent, before 1677 or after 2262 like <see cref="DateTime.MinValue"/>, are stored as NaT</remarks>
+        public static PyObject Create(IList<DateTime> times)
+        {
+            // numpy does not expose datetime64 arrays through the buffer protocol, so we fill an int64 array and view it as datetime64
+            using var int64Array = Create<long>(times.Count, GetDType(ref _int64, "int64"), destination =>
+            {
+                for (var i = 0; i < destination.Length; i++)
+                {
+                    destination[i] = ToNanoseconds(times[i]);
+                }
+            });
+            using var view = int64Array.GetAttr("view");
+            return view.Invoke(GetDType(ref _datetime64, "datetime64[ns]"));
+        }
+
+        /// <summary>
+        /// Creates an int8 numpy array of the given length filled with zeros, useful as codes of a single value index level
+        /// </summary>
+        public static PyObject Zeros(int length)
+        {
+            Initialize();
+            using var pyLength = length.ToPython();
+            using var dtype = new PyString("int8");
+            return _zeros.Invoke(pyLength, dtype);
+        }
+
+        /// <summary>
+        /// Reads the given numpy array, or any object numpy can convert into one, as float64 values
+        /// </summary>
+        public static double[] ToDoubleArray(PyObject values)
+        {
+            return Read<double, double>(values, GetDType(ref _float64, "float64"), (source, result) => source.CopyTo(result));
+        }
+
+        /// <summary>
+        /// Reads the given numpy array, or any object numpy can convert into one, as datetime64[ns] times
+        /// </summary>
+        /// <remarks>Time zone aware times are converted into UTC. Missing times, NaT, are read as <see cref="DateTime.MinValue"/></remarks>
+        public static DateTime[] ToDateTimeArray(PyObject values)
+        {
+            Initialize();
+            using var times = _ascontiguousarray.Invoke(values, GetDType(ref _datetime64, "datetime64[ns]"));
+            using var view = times.GetAttr("view");
+            using var int64Array = view.Invoke(GetDType(ref _int64, "int64"));
+            return Read<long, DateTime>(int64Array, GetDType(ref _int64, "int64"), (nanoseconds, result) =>
+            {
+                for (var i = 0; i < result.Length; i++)
+                {
+                    result[i] = nanoseconds[i] == NotATime ? DateTime.MinValue : new DateTime(nanoseconds[i] / 100 + _epochTicks);
+                }
+            });
+        }
+
+        private static long ToNanoseconds(DateTime time)
+        {
+            var ticks = time.Ticks - _epochTicks;
+            if (ticks < MinimumTicks || ticks > MaximumTicks)
+            {
+                return NotATime;
+            }
+            return ticks * 100;
+        }
+
+        /// <summary>
+        /// Reads the memory of the numpy array, converting it into the given dtype first if needed, into a new managed array
+        /// </summary>
+        private static TResult[] Read<T, TResult>(PyObject values, PyObject dtype, ReadAction<T, TResult> read)
+            where T : unmanaged
+        {
+            Initialize();
+            using var array = _ascontiguousarray.Invoke(values, dtype);
+            using var buffer = array.GetBuffer(PyBUF.C_CONTIGUOUS);
+            var source = GetSpan<T>(buffer);
+            var result = new TResult[source.Length];
+            read(source, result);
+            return result;
+        }
+
+        private static PyObject Create<T>(IList<T> values, PyObject dtype)
+            where T : unmanaged
+        {
+            return Create<T>(values.Count, dtype, destination =>
+            {
+                switch (values)
+                {
+                    case T[] array:
+                        array.CopyTo(destination);
+                        break;
+                    case List<T> list:
+                        CollectionsMarshal.AsSpan(list).CopyTo(destination);
+                        break;
+                    default:
+                        for (var i = 0; i < destination.Length; i++)
+                        {
+                            destination[i] = values[i];
+                        }
+                        break;
+                }
+            });
+        }
+
+        /// <summary>
+        /// Creates a numpy array of the given length and lets the caller write the values straight into its memory
+        /// </summary>
+        private static PyObject Create<T>(int length, PyObject dtype, WriteAction<T> write)
+            where T : unmanaged
+        {
+            Initialize();
+            using var pyLength = length.ToPython();
+            var array = _empty.Invoke(pyLength, dtype);
+            if (length > 0)
+            {
+                using var buffer = array.GetBuffer(PyBUF.C_CONTIGUOUS | PyBUF.WRITABLE);
+                write(GetSpan<T>(buffer));
+            }
+            return array;
+        }
+
+        /// <summary>
+        /// Gets the memory of the given C contiguous buffer, valid while the buffer is not disposed
+        /// </summary>
+        private static unsafe Span<T> GetSpan<T>(PyBuffer buffer)
+            where T : unmanaged
+        {
+            var length = (int)(buffer.Length / sizeof(T));
+            if (length == 0)
+            {
+                return Span<T>.Empty;
+            }
+            return new Span<T>((void*)buffer.GetPointer(new long[buffer.Dimensions]), length);
+        }
+
+        private delegate void WriteAction<T>(Span<T> destination);
+
+        private delegate void ReadAction<T, TResult>(ReadOnlySpan<T> source, TResult[] result);
+
+        private static PyObject GetDType(ref PyString dtype, string name)
+        {
+            return dtype ??= new PyString(name);
+        }
+
+        private static void Initialize()
+        {
+            if (_empty == null)
+            {
+                using var numpy = Py.Import("numpy");
+                _zeros = numpy.GetAttr("zeros");
+                _empty = numpy.GetAttr("empty");
+                _ascontiguousarray = numpy.GetAttr("ascontiguousarray");
+            }
+        }
+    }
+}
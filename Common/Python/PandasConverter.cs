@@ -31,6 +31,30 @@ namespace QuantConnect.Python
     {
         private static dynamic _pandas;
         private static PyObject _concat;
+        private static PyObject _tagLeanObject;
+        private static PyObject _categorizeSymbols;
+        private static PyObject _lazyDataFrame;
+        private static PyModule _arrow;
+
+        private static readonly string[] _sliceColumns = { "open", "high", "low", "close", "volume", "bidclose", "bidsize", "askclose", "asksize" };
+        private static readonly string[] _sliceTradeBarColumns = { "open", "high", "low", "close", "volume" };
+        private static readonly string[] _sliceQuoteBarColumns =
+        {
+            "bidopen", "bidhigh", "bidlow", "bidclose", "bidsize", "askopen", "askhigh", "asklow", "askclose", "asksize"
+        };
+        private static readonly string[] _sliceTickColumns = { "lastprice", "quantity", "bidprice", "bidsize", "askprice", "asksize" };
+
+        /// <summary>
+        /// True to store the symbol index level of the data frames as a pandas.Categorical, so it keeps its integer codes
+        /// when it becomes a column, e.g. with reset_index or unstack
+        /// </summary>
+        public bool CategoricalSymbols { get; set; }
+
+        /// <summary>
+        /// True to store the price columns of the data frames as float32 instead of float64, halving their memory.
+        /// Sizes, volumes and custom data columns are kept as float64
+        /// </summary>
+        public bool Float32Prices { get; set; }
 
         /// <summary>
         /// Creates an instance of <see cref="PandasConverter"/>.
@@ -45,6 +69,11 @@ namespace QuantConnect.Python
                     _pandas = pandas;
                     // keep it so we don't need to ask for it each time
                     _concat = pandas.GetAttr("concat");
+                    // flags the data frames we create so the PandasMapper can limit the remapping to them
+                    using var pandasMapper = Py.Import("PandasMapper");
+                    _tagLeanObject = pandasMapper.GetAttr("tag_lean_object");
+                    _categorizeSymbols = pandasMapper.GetAttr("categorize_symbols");
+                    _lazyDataFrame = pandasMapper.GetAttr("LazyDataFrame");
                 }
             }
         }
@@ -54,37 +83,337 @@ namespace QuantConnect.Python
         /// </summary>
         /// <param name="data">Enumerable of <see cref="Slice"/></param>
         /// <param name="dataType">Optional type of bars to add to the data frame</param>
+        /// <param name="columns">Optional columns to add to the data frame, by default all the columns with data are added</param>
         /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
-        public PyObject GetDataFrame(IEnumerable<Slice> data, Type dataType = null)
+        public PyObject GetDataFrame(IEnumerable<Slice> data, Type dataType = null, IEnumerable<string> columns = null)
         {
-            var maxLevels = 0;
-            var sliceDataDict = new Dictionary<SecurityIdentifier, PandasData>();
+            var sliceDataDict = GetPandasData(data, dataType, out var maxLevels);
+            return MakeDataFrame(sliceDataDict, maxLevels, columns?.Select(x => x.ToLowerInvariant()).ToHashSet());
+        }
 
-            // if no data type is requested we check all
-            var requestedTick = dataType == null || dataType == typeof(Tick) || dataType == typeof(OpenInterest);
-            var requestedTradeBar = dataType == null || dataType == typeof(TradeBar);
-            var requestedQuoteBar = dataType == null || dataType == typeof(QuoteBar);
+        /// <summary>
+        /// Converts an enumerable of <see cref="Slice"/> in a lazy pandas.DataFrame proxy that only converts the columns that are accessed,
+        /// e.g. history.close or history[['open', 'close']]. Any other use converts the whole pandas.DataFrame
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <param name="dataType">Optional type of bars to add to the data frame</param>
+        /// <returns><see cref="PyObject"/> containing the lazy data frame</returns>
+        public PyObject GetLazyDataFrame(IEnumerable<Slice> data, Type dataType = null)
+        {
+            var sliceDataDict = GetPandasData(data, dataType, out var maxLevels);
+            using (Py.GIL())
+            {
+                using var source = new LazyPandasData(this, sliceDataDict, maxLevels).ToPython();
+                return _lazyDataFrame.Invoke(source);
+            }
+        }
 
-            foreach (var slice in data)
+        /// <summary>
+        /// Converts the data of a single <see cref="Slice"/> in a compact pandas.DataFrame indexed by symbol, built from a numpy array per column.
+        /// Bars have a row per symbol, ticks a row per tick. Fields a symbol does not have are NaN
+        /// </summary>
+        /// <param name="slice">The <see cref="Slice"/> to convert</param>
+        /// <param name="dataType">Optional type of data to add to the data frame: <see cref="TradeBar"/>, <see cref="QuoteBar"/> or <see cref="Tick"/>.
+        /// By default the trade bar fields and the closing bid and ask of the quote bars are added</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        public PyObject GetSliceDataFrame(Slice slice, Type dataType = null)
+        {
+            var symbols = new List<Symbol>();
+            string[] names;
+            List<double>[] columns;
+
+            if (dataType == typeof(Tick))
             {
-                AddSliceDataTypeDataToDict(slice, requestedTick, requestedTradeBar, requestedQuoteBar, sliceDataDict, ref maxLevels);
+                names = _sliceTickColumns;
+                columns = names.Select(_ => new List<double>()).ToArray();
+                foreach (var ticks in slice.Ticks.Values)
+                {
+                    foreach (var tick in ticks)
+                    {
+                        if (tick.TickType == TickType.OpenInterest)
+                        {
+                            continue;
+                        }
+                        symbols.Add(tick.Symbol);
+                        for (var i = 0; i < names.Length; i++)
+                        {
+                            columns[i].Add(GetSliceValue(names[i], tick));
+                        }
+                    }
+                }
+            }
+            else
+            {
+                if (dataType != null && dataType != typeof(TradeBar) && dataType != typeof(QuoteBar))
+                {
+                    throw new ArgumentException($"PandasConverter.GetSliceDataFrame(): data type should be TradeBar, QuoteBar or Tick, was {dataType.Name}");
+                }
+                names = dataType == null ? _sliceColumns : dataType == typeof(TradeBar) ? _sliceTradeBarColumns : _sliceQuoteBarColumns;
+                if (dataType == typeof(QuoteBar))
+                {
+                    symbols.AddRange(slice.QuoteBars.Keys);
+                }
+                else
+                {
+                    symbols.AddRange(slice.Bars.Keys);
+                    if (dataType == null)
+                    {
+                        symbols.AddRange(slice.QuoteBars.Keys.Where(symbol => !slice.Bars.ContainsKey(symbol)));
+                    }
+                }
+
+                columns = names.Select(_ => new List<double>(symbols.Count)).ToArray();
+                foreach (var symbol in symbols)
+                {
+                    slice.Bars.TryGetValue(symbol, out var tradeBar);
+                    slice.QuoteBars.TryGetValue(symbol, out var quoteBar);
+                    for (var i = 0; i < names.Length; i++)
+                    {
+                        columns[i].Add(GetSliceValue(names[i], tradeBar, quoteBar));
+                    }
+                }
             }
 
             using (Py.GIL())
             {
-                if (sliceDataDict.Count == 0)
+                using var pyColumns = new PyDict();
+                for (var i = 0; i < names.Length; i++)
                 {
-                    return _pandas.DataFrame();
+                    using var column = NumpyArray.Create(columns[i]);
+                    pyColumns.SetItem(names[i], column);
                 }
-                using var dataFrames = sliceDataDict.Select(x => x.Value.ToPandasDataFrame(maxLevels)).ToPyListUnSafe();
-                using var sortDic = Py.kw("sort", true);
-                var result = _concat.Invoke(new[] { dataFrames }, sortDic);
+                using var pySymbols = symbols.Select(symbol => symbol.ID.ToString()).ToPyListUnSafe();
+                using var index = _pandas.Index(pySymbols, name: "symbol") as PyObject;
+                using var dataFrame = _pandas.DataFrame(pyColumns, index: index) as PyObject;
+                return _tagLeanObject.Invoke(dataFrame);
+            }
+        }
 
-                foreach (var df in dataFrames)
+        /// <summary>
+        /// Converts an enumerable of <see cref="Slice"/> in a pyarrow.Table, with the index levels of the pandas.DataFrame as columns
+        /// and the symbol column dictionary encoded
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <param name="dataType">Optional type of bars to add to the table</param>
+        /// <returns><see cref="PyObject"/> containing a pyarrow.Table</returns>
+        /// <remarks>Requires the pyarrow package</remarks>
+        public PyObject GetArrowTable(IEnumerable<Slice> data, Type dataType = null)
+        {
+            using (Py.GIL())
+            {
+                using var dataFrame = GetDataFrame(data, dataType);
+                return GetArrowTable(dataFrame);
+            }
+        }
+
+        /// <summary>
+        /// Converts a pandas.DataFrame created by Lean, like the python history, in a pyarrow.Table
+        /// </summary>
+        /// <param name="dataFrame">The pandas.DataFrame to convert</param>
+        /// <returns><see cref="PyObject"/> containing a pyarrow.Table</returns>
+        /// <remarks>Requires the pyarrow package</remarks>
+        public PyObject GetArrowTable(PyObject dataFrame)
+        {
+            using (Py.GIL())
+            {
+                return GetArrowModule().InvokeMethod("to_arrow_table", dataFrame);
+            }
+        }
+
+        /// <summary>
+        /// Writes an enumerable of <see cref="Slice"/> into a Parquet file
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <param name="path">The path of the file to write</param>
+        /// <param name="dataType">Optional type of bars to write</param>
+        /// <remarks>Requires the pyarrow package</remarks>
+        public void WriteParquet(IEnumerable<Slice> data, string path, Type dataType = null)
+        {
+            WriteArrowTable(GetArrowTable(data, dataType), path, "write_parquet");
+        }
+
+        /// <summary>
+        /// Writes a pandas.DataFrame created by Lean into a Parquet file
+        /// </summary>
+        /// <param name="dataFrame">The pandas.DataFrame to write</param>
+        /// <param name="path">The path of the file to write</param>
+        /// <remarks>Requires the pyarrow package</remarks>
+        public void WriteParquet(PyObject dataFrame, string path)
+        {
+            WriteArrowTable(GetArrowTable(dataFrame), path, "write_parquet");
+        }
+
+        /// <summary>
+        /// Writes an enumerable of <see cref="Slice"/> into a Feather file
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <param name="path">The path of the file to write</param>
+        /// <param name="dataType">Optional type of bars to write</param>
+        /// <remarks>Requires the pyarrow package</remarks>
+        public void WriteFeather(IEnumerable<Slice> data, string path, Type dataType = null)
+        {
+            WriteArrowTable(GetArrowTable(data, dataType), path, "write_feather");
+        }
+
+        /// <summary>
+        /// Writes a pandas.DataFrame created by Lean into a Feather file
+        /// </summary>
+        /// <param name="dataFrame">The pandas.DataFrame to write</param>
+        /// <param name="path">The path of the file to write</param>
+        /// <remarks>Requires the pyarrow package</remarks>
+        public void WriteFeather(PyObject dataFrame, string path)
+        {
+            WriteArrowTable(GetArrowTable(dataFrame), path, "write_feather");
+        }
+
+        /// <summary>
+        /// Reads a Parquet file written by <see cref="WriteParquet(IEnumerable{Slice}, string, Type)"/> into a pandas.DataFrame
+        /// with the same index as the history data frames
+        /// </summary>
+        /// <param name="path">The path of the file to read</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        /// <remarks>Requires the pyarrow package</remarks>
+        public PyObject ReadParquet(string path)
+        {
+            return ReadArrowTable(path, "read_parquet");
+        }
+
+        /// <summary>
+        /// Reads a Feather file written by <see cref="WriteFeather(IEnumerable{Slice}, string, Type)"/> into a pandas.DataFrame
+        /// with the same index as the history data frames
+        /// </summary>
+        /// <param name="path">The path of the file to read</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        /// <remarks>Requires the pyarrow package</remarks>
+        public PyObject ReadFeather(string path)
+        {
+            return ReadArrowTable(path, "read_feather");
+        }
+
+        /// <summary>
+        /// Converts an enumerable of <see cref="Slice"/> in a sequence of pandas.DataFrame, each one holding the data of a period of time
+        /// or at most a number of data points. The slices are only read as the data frames are requested, so the memory used is bounded by a chunk
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <param name="period">The period of time of each data frame, aligned to multiples of it. Defaults to one day if no maximum data points is given</param>
+        /// <param name="maxDataPoints">The maximum number of data points of each data frame</param>
+        /// <param name="dataType">Optional type of bars to add to the data frames</param>
+        /// <returns>Enumerable of <see cref="PyObject"/> containing a pandas.DataFrame each</returns>
+        public IEnumerable<PyObject> GetDataFrames(IEnumerable<Slice> data, TimeSpan? period = null, int? maxDataPoints = null, Type dataType = null)
+        {
+            if (period <= TimeSpan.Zero || maxDataPoints <= 0)
+            {
+                throw new ArgumentException("PandasConverter.GetDataFrames(): the period and the maximum data points should be positive");
+            }
+            if (period == null && maxDataPoints == null)
+            {
+                period = Time.OneDay;
+            }
+
+            var chunk = new List<Slice>();
+            var dataPoints = 0;
+            var chunkStart = DateTime.MinValue;
+            foreach (var slice in data)
+            {
+                if (period.HasValue)
                 {
-                    df.Dispose();
+                    var sliceStart = slice.Time.RoundDown(period.Value);
+                    if (chunk.Count > 0 && sliceStart != chunkStart)
+                    {
+                        yield return GetDataFrame(chunk, dataType);
+                        chunk.Clear();
+                        dataPoints = 0;
+                    }
+                    chunkStart = sliceStart;
+                }
+
+                chunk.Add(slice);
+                dataPoints += slice.AllData.Count;
+
+                if (dataPoints >= maxDataPoints)
+                {
+                    yield return GetDataFrame(chunk, dataType);
+                    chunk.Clear();
+                    dataPoints = 0;
                 }
-                return result;
+            }
+
+            if (chunk.Count > 0)
+            {
+                yield return GetDataFrame(chunk, dataType);
+            }
+        }
+
+        /// <summary>
+        /// Converts an enumerable of <see cref="Slice"/> in a dense symbols by time numpy array of a single field,
+        /// without creating the intermediate pandas.DataFrame
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <param name="field">The field to take from each data point: open, high, low, close, volume or value</param>
+        /// <returns><see cref="PyObject"/> containing a python tuple of the float64 values array, with NaN where a symbol has no data at a time,
+        /// the list of symbols of its rows and the datetime64 array of the end times of its columns</returns>
+        public PyObject GetNumpyArray(IEnumerable<Slice> data, string field = "close")
+        {
+            field = field.ToLowerInvariant();
+            if (field is not ("open" or "high" or "low" or "close" or "volume" or "value"))
+            {
+                throw new ArgumentException($"PandasConverter.GetNumpyArray(): field should be one of open, high, low, close, volume or value, was '{field}'");
+            }
+
+            var symbols = new List<Symbol>();
+            var rowBySymbol = new Dictionary<Symbol, int>();
+            var points = new List<(DateTime EndTime, int Row, double Value)>();
+
+            foreach (var slice in data)
+            {
+                for (var i = 0; i < slice.AllData.Count; i++)
+                {
+                    var baseData = slice.AllData[i];
+                    // trade bars take precedence over quote bars, like in the data frame
+                    if (baseData is QuoteBar && slice.Bars.ContainsKey(baseData.Symbol))
+                    {
+                        continue;
+                    }
+                    if (!TryGetFieldValue(baseData, field, out var value))
+                    {
+                        continue;
+                    }
+
+                    if (!rowBySymbol.TryGetValue(baseData.Symbol, out var row))
+                    {
+                        rowBySymbol[baseData.Symbol] = row = symbols.Count;
+                        symbols.Add(baseData.Symbol);
+                    }
+                    points.Add((baseData.EndTime, row, value));
+                }
+            }
+
+            var times = points.Select(x => x.EndTime).Distinct().OrderBy(x => x).ToList();
+            var columnByTime = new Dictionary<DateTime, int>(times.Count);
+            for (var i = 0; i < times.Count; i++)
+            {
+                columnByTime[times[i]] = i;
+            }
+
+            var values = new double[symbols.Count, times.Count];
+            for (var row = 0; row < symbols.Count; row++)
+            {
+                for (var column = 0; column < times.Count; column++)
+                {
+                    values[row, column] = double.NaN;
+                }
+            }
+            foreach (var point in points)
+            {
+                values[point.Row, columnByTime[point.EndTime]] = point.Value;
+            }
+
+            using (Py.GIL())
+            {
+                using var pyValues = NumpyArray.Create(values);
+                using var pySymbols = symbols.ToPyListUnSafe();
+                using var pyTimes = NumpyArray.Create(times);
+                return new PyTuple(new PyObject[] { pyValues, pySymbols, pyTimes });
             }
         }
 
@@ -116,7 +445,8 @@ namespace QuantConnect.Python
                 {
                     return _pandas.DataFrame();
                 }
-                return sliceData.ToPandasDataFrame();
+                using var dataFrame = sliceData.ToPandasDataFrame(float32Prices: Float32Prices);
+                return TagLeanObject(dataFrame);
             }
         }
 
@@ -127,16 +457,10 @@ namespace QuantConnect.Python
         /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
         public PyObject GetIndicatorDataFrame(IDictionary<string, List<IndicatorDataPoint>> data)
         {
+            var block = new IndicatorBlock(data);
             using (Py.GIL())
             {
-                var pyDict = new PyDict();
-
-                foreach (var kvp in data)
-                {
-                    AddSeriesToPyDict(kvp.Key, kvp.Value, pyDict);
-                }
-
-                return MakeIndicatorDataFrame(pyDict);
+                return MakeIndicatorDataFrame(block);
             }
         }
 
@@ -153,21 +477,19 @@ namespace QuantConnect.Python
                 var inputTypeStr = inputPythonType.ToString();
                 var targetTypeStr = nameof(PyDict);
                 PyObject currentKvp = null;
+                var series = new Dictionary<string, List<IndicatorDataPoint>>();
 
                 try
                 {
                     using var pyDictData = new PyDict(data);
-                    using var seriesPyDict = new PyDict();
 
                     targetTypeStr = $"{nameof(String)}: {nameof(List<IndicatorDataPoint>)}";
 
                     foreach (var kvp in pyDictData.Items())
                     {
                         currentKvp = kvp;
-                        AddSeriesToPyDict(kvp[0].As<string>(), kvp[1].As<List<IndicatorDataPoint>>(), seriesPyDict);
+                        series[kvp[0].As<string>()] = kvp[1].As<List<IndicatorDataPoint>>();
                     }
-
-                    return MakeIndicatorDataFrame(seriesPyDict);
                 }
                 catch (Exception e)
                 {
@@ -178,6 +500,27 @@ namespace QuantConnect.Python
 
                     throw new ArgumentException(Messages.PandasConverter.ConvertToDictionaryFailed(inputTypeStr, targetTypeStr, e.Message), e);
                 }
+
+                return MakeIndicatorDataFrame(new IndicatorBlock(series));
+            }
+        }
+
+        /// <summary>
+        /// Converts a dictionary with a list of <see cref="IndicatorDataPoint"/> in a times by series numpy array,
+        /// the same values of <see cref="GetIndicatorDataFrame(IDictionary{string, List{IndicatorDataPoint}})"/> without the pandas.DataFrame
+        /// </summary>
+        /// <param name="data">Dictionary with a list of <see cref="IndicatorDataPoint"/></param>
+        /// <returns><see cref="PyObject"/> containing a python tuple of the float64 values array, with NaN where a series has no value at a time,
+        /// the list of the lower case names of its columns and the datetime64 array of the end times of its rows</returns>
+        public PyObject GetIndicatorArray(IDictionary<string, List<IndicatorDataPoint>> data)
+        {
+            var block = new IndicatorBlock(data);
+            using (Py.GIL())
+            {
+                using var values = NumpyArray.Create(block.Values);
+                using var names = block.Names.ToPyListUnSafe();
+                using var times = NumpyArray.Create(block.Times);
+                return new PyTuple(new PyObject[] { values, names, times });
             }
         }
 
@@ -193,33 +536,215 @@ namespace QuantConnect.Python
         }
 
         /// <summary>
-        /// Creates a series from a list of <see cref="IndicatorDataPoint"/> and adds it to the
-        /// <see cref="PyDict"/> as the value of the given <paramref name="key"/>
+        /// Converts the values of the indicator series in a pandas.DataFrame with a column per series
         /// </summary>
-        /// <param name="key">Key to insert in the <see cref="PyDict"/></param>
-        /// <param name="points">List of <see cref="IndicatorDataPoint"/> that will make up the resulting series</param>
-        /// <param name="pyDict"><see cref="PyDict"/> where the resulting key-value pair will be inserted into</param>
-        private void AddSeriesToPyDict(string key, List<IndicatorDataPoint> points, PyDict pyDict)
+        /// <param name="block">The values of the indicator series</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        private PyObject MakeIndicatorDataFrame(IndicatorBlock block)
         {
-            var index = new List<DateTime>();
-            var values = new List<double>();
+            using var values = NumpyArray.Create(block.Values);
+            using var index = NumpyArray.Create(block.Times);
+            using var columns = block.Names.ToPyListUnSafe();
+            return _pandas.DataFrame(values, index: index, columns: columns);
+        }
 
-            foreach (var point in points)
+        /// <summary>
+        /// Groups the data of the given slices by security
+        /// </summary>
+        private Dictionary<SecurityIdentifier, PandasData> GetPandasData(IEnumerable<Slice> data, Type dataType, out int maxLevels)
+        {
+            maxLevels = 0;
+            var sliceDataDict = new Dictionary<SecurityIdentifier, PandasData>();
+
+            // if no data type is requested we check all
+            var requestedTick = dataType == null || dataType == typeof(Tick) || dataType == typeof(OpenInterest);
+            var requestedTradeBar = dataType == null || dataType == typeof(TradeBar);
+            var requestedQuoteBar = dataType == null || dataType == typeof(QuoteBar);
+
+            foreach (var slice in data)
             {
-                index.Add(point.EndTime);
-                values.Add((double) point.Value);
+                AddSliceDataTypeDataToDict(slice, requestedTick, requestedTradeBar, requestedQuoteBar, sliceDataDict, ref maxLevels);
             }
-            pyDict.SetItem(key.ToLowerInvariant(), _pandas.Series(values, index));
+            return sliceDataDict;
         }
 
         /// <summary>
-        /// Converts a <see cref="PyDict"/> of string to pandas.Series in a pandas.DataFrame
+        /// Creates the pandas.DataFrame of the given data grouped by security
         /// </summary>
-        /// <param name="pyDict"><see cref="PyDict"/> of string to pandas.Series</param>
-        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
-        private PyObject MakeIndicatorDataFrame(PyDict pyDict)
+        /// <param name="sliceDataDict">The data of each security</param>
+        /// <param name="maxLevels">The number of levels of the index</param>
+        /// <param name="columns">The columns to convert, the data is kept so other columns can be converted later. Null converts and releases all of them</param>
+        internal PyObject MakeDataFrame(IDictionary<SecurityIdentifier, PandasData> sliceDataDict, int maxLevels, ICollection<string> columns)
+        {
+            using (Py.GIL())
+            {
+                if (sliceDataDict.Count == 0)
+                {
+                    return _pandas.DataFrame();
+                }
+                using var dataFrames = sliceDataDict.Select(x => x.Value.ToPandasDataFrame(maxLevels, Float32Prices, columns)).ToPyListUnSafe();
+                using var sortDic = Py.kw("sort", true);
+                using var concatenated = _concat.Invoke(new[] { dataFrames }, sortDic);
+                var result = TagLeanObject(concatenated);
+
+                foreach (var df in dataFrames)
+                {
+                    df.Dispose();
+                }
+                return result;
+            }
+        }
+
+        /// <summary>
+        /// Flags the given data frame as created by Lean and applies the symbol level option
+        /// </summary>
+        private PyObject TagLeanObject(PyObject dataFrame)
         {
-            return _pandas.DataFrame(pyDict, columns: pyDict.Keys().Select(x => x.As<string>().ToLowerInvariant()).OrderBy(x => x));
+            var result = _tagLeanObject.Invoke(dataFrame);
+            if (!CategoricalSymbols)
+            {
+                return result;
+            }
+            using (result)
+            {
+                return _categorizeSymbols.Invoke(result);
+            }
+        }
+
+        private static void WriteArrowTable(PyObject table, string path, string function)
+        {
+            using (Py.GIL())
+            {
+                using (table)
+                using (var pyPath = path.ToPython())
+                {
+                    GetArrowModule().InvokeMethod(function, table, pyPath).Dispose();
+                }
+            }
+        }
+
+        private static PyObject ReadArrowTable(string path, string function)
+        {
+            using (Py.GIL())
+            {
+                using var pyPath = path.ToPython();
+                return GetArrowModule().InvokeMethod(function, pyPath);
+            }
+        }
+
+        /// <summary>
+        /// Gets the python helpers between Lean data frames and pyarrow tables, pyarrow is only imported when they are used
+        /// </summary>
+        /// <remarks>Requires the GIL to be held</remarks>
+        private static PyModule GetArrowModule()
+        {
+            return _arrow ??= PyModule.FromString("LeanArrow",
+                "from PandasMapper import tag_lean_object\n" +
+                "indexNames = ['expiry', 'strike', 'type', 'symbol', 'time']\n" +
+                "def to_arrow_table(dataFrame):\n" +
+                "    import pyarrow as pa\n" +
+                "    table = pa.Table.from_pandas(dataFrame.reset_index(), preserve_index=False)\n" +
+                "    if 'symbol' in table.column_names:\n" +
+                "        table = table.set_column(table.column_names.index('symbol'), 'symbol', table.column('symbol').dictionary_encode())\n" +
+                "    return table\n" +
+                "def from_arrow_table(table):\n" +
+                "    dataFrame = table.to_pandas()\n" +
+                "    if 'symbol' in dataFrame.columns:\n" +
+                "        dataFrame['symbol'] = dataFrame['symbol'].astype(str)\n" +
+                "    index = [name for name in indexNames if name in dataFrame.columns]\n" +
+                "    if index:\n" +
+                "        dataFrame = dataFrame.set_index(index)\n" +
+                "    return tag_lean_object(dataFrame)\n" +
+                "def write_parquet(table, path):\n" +
+                "    import pyarrow.parquet\n" +
+                "    pyarrow.parquet.write_table(table, path)\n" +
+                "def write_feather(table, path):\n" +
+                "    import pyarrow.feather\n" +
+                "    pyarrow.feather.write_feather(table, path)\n" +
+                "def read_parquet(path):\n" +
+                "    import pyarrow.parquet\n" +
+                "    return from_arrow_table(pyarrow.parquet.read_table(path))\n" +
+                "def read_feather(path):\n" +
+                "    import pyarrow.feather\n" +
+                "    return from_arrow_table(pyarrow.feather.read_table(path))\n");
+        }
+
+        /// <summary>
+        /// Gets the value of the requested column of <see cref="GetSliceDataFrame"/> from the bars of a symbol
+        /// </summary>
+        private static double GetSliceValue(string column, TradeBar tradeBar, QuoteBar quoteBar)
+        {
+            decimal? value = column switch
+            {
+                "open" => tradeBar?.Open,
+                "high" => tradeBar?.High,
+                "low" => tradeBar?.Low,
+                "close" => tradeBar?.Close,
+                "volume" => tradeBar?.Volume,
+                "bidopen" => quoteBar?.Bid?.Open,
+                "bidhigh" => quoteBar?.Bid?.High,
+                "bidlow" => quoteBar?.Bid?.Low,
+                "bidclose" => quoteBar?.Bid?.Close,
+                "bidsize" => quoteBar?.LastBidSize,
+                "askopen" => quoteBar?.Ask?.Open,
+                "askhigh" => quoteBar?.Ask?.High,
+                "asklow" => quoteBar?.Ask?.Low,
+                "askclose" => quoteBar?.Ask?.Close,
+                "asksize" => quoteBar?.LastAskSize,
+                _ => null
+            };
+            return value.HasValue ? (double)value.Value : double.NaN;
+        }
+
+        /// <summary>
+        /// Gets the value of the requested column of <see cref="GetSliceDataFrame"/> from a tick, trade ticks only have
+        /// a last price and quantity and quote ticks only have bid and ask prices and sizes
+        /// </summary>
+        private static double GetSliceValue(string column, Tick tick)
+        {
+            decimal? value = tick.TickType == TickType.Trade
+                ? column switch
+                {
+                    "lastprice" => tick.LastPrice,
+                    "quantity" => tick.Quantity,
+                    _ => null
+                }
+                : column switch
+                {
+                    "bidprice" => tick.BidPrice,
+                    "bidsize" => tick.BidSize,
+                    "askprice" => tick.AskPrice,
+                    "asksize" => tick.AskSize,
+                    _ => null
+                };
+            return value.HasValue ? (double)value.Value : double.NaN;
+        }
+
+        /// <summary>
+        /// Gets the value of the requested field of a data point, data that is not a bar only provides its value, also as close
+        /// </summary>
+        private static bool TryGetFieldValue(BaseData baseData, string field, out double value)
+        {
+            decimal? result = null;
+            if (baseData is IBaseDataBar bar)
+            {
+                result = field switch
+                {
+                    "open" => bar.Open,
+                    "high" => bar.High,
+                    "low" => bar.Low,
+                    "close" => bar.Close,
+                    "volume" => (baseData as TradeBar)?.Volume,
+                    _ => bar.Value
+                };
+            }
+            else if (field is "close" or "value")
+            {
+                result = baseData.Value;
+            }
+
+            value = result.HasValue ? (double)result.Value : double.NaN;
+            return result.HasValue;
         }
 
         /// <summary>
@@ -293,5 +818,56 @@ namespace QuantConnect.Python
                 }
             }
         }
+
+        /// <summary>
+        /// The values of a set of indicator series in a single block, with a row per distinct end time and a column per series
+        /// </summary>
+        private class IndicatorBlock
+        {
+            /// <summary>
+            /// The lower case names of the series, sorted
+            /// </summary>
+            public List<string> Names { get; }
+
+            /// <summary>
+            /// The sorted end times of the values
+            /// </summary>
+            public List<DateTime> Times { get; }
+
+            /// <summary>
+            /// The values of the series, NaN where a series has no value at a time
+            /// </summary>
+            public double[,] Values { get; }
+
+            public IndicatorBlock(IDictionary<string, List<IndicatorDataPoint>> data)
+            {
+                var series = new Dictionary<string, List<IndicatorDataPoint>>();
+                foreach (var kvp in data)
+                {
+                    series[kvp.Key.ToLowerInvariant()] = kvp.Value;
+                }
+                Names = series.Keys.OrderBy(x => x).ToList();
+                Times = series.Values.SelectMany(points => points.Select(point => point.EndTime)).Distinct().OrderBy(x => x).ToList();
+
+                var rowByTime = new Dictionary<DateTime, int>(Times.Count);
+                for (var i = 0; i < Times.Count; i++)
+                {
+                    rowByTime[Times[i]] = i;
+                }
+
+                Values = new double[Times.Count, Names.Count];
+                for (var column = 0; column < Names.Count; column++)
+                {
+                    for (var row = 0; row < Times.Count; row++)
+                    {
+                        Values[row, column] = double.NaN;
+                    }
+                    foreach (var point in series[Names[column]])
+                    {
+                        Values[rowByTime[point.EndTime], column] = (double)point.Value;
+                    }
+                }
+            }
+        }
     }
 }
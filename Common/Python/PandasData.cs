@@ -78,6 +78,12 @@ namespace QuantConnect.Python
             BidOpen, BidHigh, BidLow, BidClose,  BidPrice, BidSize, Exchange, OpenInterest
         };
 
+        // the price columns that can be stored as float32, sizes and volumes keep float64 so large integers are exact
+        private readonly static HashSet<string> _priceColumns = new()
+        {
+            Open, High, Low, Close, LastPrice, AskOpen, AskHigh, AskLow, AskClose, AskPrice, BidOpen, BidHigh, BidLow, BidClose, BidPrice
+        };
+
         private readonly Symbol _symbol;
         private readonly Dictionary<string, Serie> _series;
 
@@ -93,6 +99,11 @@ namespace QuantConnect.Python
         /// </summary>
         public int Levels { get; } = 2;
 
+        /// <summary>
+        /// The names of the columns that have data and will be part of the pandas.DataFrame
+        /// </summary>
+        public IEnumerable<string> Columns => _series.Where(x => !x.Value.ShouldFilter).Select(x => x.Key);
+
         /// <summary>
         /// Initializes an instance of <see cref="PandasData"/>
         /// </summary>
@@ -106,8 +117,7 @@ namespace QuantConnect.Python
                     _pandas = Py.Import("PandasMapper");
                     _seriesFactory = _pandas.GetAttr("Series");
                     _dataFrameFactory = _pandas.GetAttr("DataFrame");
-                    using var multiIndex = _pandas.GetAttr("MultiIndex");
-                    _multiIndexFactory = multiIndex.GetAttr("from_tuples");
+                    _multiIndexFactory = _pandas.GetAttr("MultiIndex");
                     _empty = new PyString(string.Empty);
 
                     var time = new PyString("time");
@@ -326,29 +336,31 @@ namespace QuantConnect.Python
         /// Get the pandas.DataFrame of the current <see cref="PandasData"/> state
         /// </summary>
         /// <param name="levels">Number of levels of the multi index</param>
+        /// <param name="float32Prices">True to store the price columns of Lean data as float32 instead of float64</param>
+        /// <param name="columns">Optional columns to convert, when given the data is kept so other columns can be converted later</param>
         /// <returns>pandas.DataFrame object</returns>
-        public PyObject ToPandasDataFrame(int levels = 2)
+        public PyObject ToPandasDataFrame(int levels = 2, bool float32Prices = false, ICollection<string> columns = null)
         {
             List<PyObject> list;
             var symbol = _symbol.ID.ToString().ToPython();
 
-            // Create the index labels
+            // Create the values of the levels other than time, each one holds a single value
             var names = _defaultNames;
             if (levels == 2)
             {
                 // symbol, time
                 names = _level2Names;
-                list = new List<PyObject> { symbol, _empty };
+                list = new List<PyObject> { symbol };
             }
             else if (levels == 3)
             {
                 // expiry, symbol, time
                 names = _level3Names;
-                list = new List<PyObject> { _symbol.ID.Date.ToPython(), symbol, _empty };
+                list = new List<PyObject> { _symbol.ID.Date.ToPython(), symbol };
             }
             else
             {
-                list = new List<PyObject> { _empty, _empty, _empty, symbol, _empty };
+                list = new List<PyObject> { _empty, _empty, _empty, symbol };
                 if (_symbol.SecurityType == SecurityType.Future)
                 {
                     list[0] = _symbol.ID.Date.ToPython();
@@ -367,32 +379,22 @@ namespace QuantConnect.Python
             using var pyDict = new PyDict();
             foreach (var kvp in _series)
             {
-                if (kvp.Value.ShouldFilter) continue;
+                if (kvp.Value.ShouldFilter || columns != null && !columns.Contains(kvp.Key)) continue;
 
                 if (!indexCache.TryGetValue(kvp.Value.Times, out var index))
                 {
-                    using var tuples = kvp.Value.Times.Select(time => CreateTupleIndex(time, list)).ToPyListUnSafe();
-                    using var namesDic = Py.kw("names", names);
-
-                    indexCache[kvp.Value.Times] = index = _multiIndexFactory.Invoke(new[] { tuples }, namesDic);
-
-                    foreach (var pyObject in tuples)
-                    {
-                        pyObject.Dispose();
-                    }
+                    indexCache[kvp.Value.Times] = index = CreateMultiIndex(kvp.Value.Times, list, names);
                 }
 
                 // Adds pandas.Series value keyed by the column name
-                using var pyvalues = new PyList();
-                for (var i = 0; i < kvp.Value.Values.Count; i++)
-                {
-                    using var pyObject = kvp.Value.Values[i].ToPython();
-                    pyvalues.Append(pyObject);
-                }
+                using var pyvalues = kvp.Value.ToPython(float32Prices && !IsCustomData && _priceColumns.Contains(kvp.Key));
                 using var series = _seriesFactory.Invoke(pyvalues, index);
                 pyDict.SetItem(kvp.Key, series);
             }
-            _series.Clear();
+            if (columns == null)
+            {
+                _series.Clear();
+            }
             foreach (var kvp in indexCache)
             {
                 kvp.Value.Dispose();
@@ -426,13 +428,63 @@ namespace QuantConnect.Python
         }
 
         /// <summary>
-        /// Create a new tuple index
+        /// Creates the pandas.MultiIndex from its levels and codes, the last level holds the times and the others a single value each
         /// </summary>
-        private static PyTuple CreateTupleIndex(DateTime index, List<PyObject> list)
+        /// <remarks>Builds the same index as pandas.MultiIndex.from_tuples without creating a python tuple per time</remarks>
+        private static PyObject CreateMultiIndex(List<DateTime> times, List<PyObject> values, PyList names)
         {
-            DisposeIfNotEmpty(list[list.Count - 1]);
-            list[list.Count - 1] = index.ToPython();
-            return new PyTuple(list.ToArray());
+            // the time level holds the sorted distinct times, like pandas would factorize them
+            var timeLevel = new List<DateTime>(times.Count);
+            var sorted = true;
+            for (var i = 0; i < times.Count; i++)
+            {
+                if (i == 0 || times[i] != times[i - 1])
+                {
+                    sorted &= i == 0 || times[i] > times[i - 1];
+                    timeLevel.Add(times[i]);
+                }
+            }
+            var timeCodes = new long[times.Count];
+            if (sorted)
+            {
+                // the common case, each time is the code of the previous one or the next level value
+                for (int i = 1, code = 0; i < times.Count; i++)
+                {
+                    if (times[i] != times[i - 1]) code++;
+                    timeCodes[i] = code;
+                }
+            }
+            else
+            {
+                timeLevel = timeLevel.Distinct().OrderBy(x => x).ToList();
+                var codeByTime = new Dictionary<DateTime, long>(timeLevel.Count);
+                for (var i = 0; i < timeLevel.Count; i++)
+                {
+                    codeByTime[timeLevel[i]] = i;
+                }
+                for (var i = 0; i < times.Count; i++)
+                {
+                    timeCodes[i] = codeByTime[times[i]];
+                }
+            }
+
+            using var levels = new PyList();
+            using var codes = new PyList();
+            using var zeros = NumpyArray.Zeros(times.Count);
+            foreach (var value in values)
+            {
+                using var level = new PyList(new[] { value });
+                levels.Append(level);
+                codes.Append(zeros);
+            }
+            using var pyTimeLevel = NumpyArray.Create(timeLevel);
+            using var pyTimeCodes = NumpyArray.Create(timeCodes);
+            levels.Append(pyTimeLevel);
+            codes.Append(pyTimeCodes);
+
+            // the levels and codes are valid by construction
+            using var kwargs = Py.kw("names", names, "verify_integrity", false);
+            return _multiIndexFactory.Invoke(new PyObject[] { levels, codes }, kwargs);
         }
 
         /// <summary>
@@ -472,9 +524,15 @@ namespace QuantConnect.Python
         private class Serie
         {
             private static readonly IFormatProvider InvariantCulture = CultureInfo.InvariantCulture;
+
+            // values are kept unboxed while they are all numeric so they can be handed to numpy in one shot,
+            // the first non numeric value moves them into _values
+            private List<double> _numericValues = new();
+            private List<int> _nullIndexes;
+            private List<object> _values;
+
             public bool ShouldFilter { get; set; } = true;
             public List<DateTime> Times { get; set; } = new();
-            public List<object> Values { get; set; } = new();
 
             public void Add(DateTime time, object input)
             {
@@ -509,7 +567,36 @@ namespace QuantConnect.Python
                     }
                 }
 
-                Values.Add(value);
+                if (_values == null)
+                {
+                    if (value is double doubleValue)
+                    {
+                        _numericValues.Add(doubleValue);
+                        Times.Add(time);
+                        return;
+                    }
+                    if (value == null)
+                    {
+                        // pandas turns None into NaN in a float64 series, we remember it in case the series stops being numeric
+                        (_nullIndexes ??= new()).Add(_numericValues.Count);
+                        _numericValues.Add(double.NaN);
+                        Times.Add(time);
+                        return;
+                    }
+
+                    _values = _numericValues.Select(x => (object)x).ToList();
+                    if (_nullIndexes != null)
+                    {
+                        foreach (var index in _nullIndexes)
+                        {
+                            _values[index] = null;
+                        }
+                    }
+                    _numericValues = null;
+                    _nullIndexes = null;
+                }
+
+                _values.Add(value);
                 Times.Add(time);
             }
 
@@ -521,9 +608,35 @@ namespace QuantConnect.Python
                     ShouldFilter = false;
                 }
 
-                Values.Add(value);
+                if (_values == null)
+                {
+                    _numericValues.Add(value);
+                }
+                else
+                {
+                    _values.Add(value);
+                }
                 Times.Add(time);
             }
+
+            /// <summary>
+            /// Gets the values as a float64, or float32, numpy array if they are all numeric, else as a python list
+            /// </summary>
+            public PyObject ToPython(bool float32 = false)
+            {
+                if (_values == null)
+                {
+                    return float32 ? NumpyArray.CreateFloat32(_numericValues) : NumpyArray.Create(_numericValues);
+                }
+
+                var pyvalues = new PyList();
+                for (var i = 0; i < _values.Count; i++)
+                {
+                    using var pyObject = _values[i].ToPython();
+                    pyvalues.Append(pyObject);
+                }
+                return pyvalues;
+            }
         }
     }
 }
@@ -16,6 +16,7 @@
 using Python.Runtime;
 using QuantConnect.Data;
 using System;
+using System.Linq;
 using System.Collections.Generic;
 
 namespace QuantConnect.Python
@@ -32,8 +33,12 @@ namespace QuantConnect.Python
         private readonly dynamic _supportedResolutions;
         private readonly dynamic _isSparseData;
         private readonly dynamic _requiresMapping;
+        private readonly dynamic _readerBatch;
+        private readonly dynamic _schema;
         private DateTime _endTime;
 
+        private static PyModule _timeZoneModule;
+
         /// <summary>
         /// The end time of this data. Some data covers spans (trade bars)
         /// and as such we want to know the entire time span covered
@@ -59,6 +64,12 @@ namespace QuantConnect.Python
             }
         }
 
+        /// <summary>
+        /// True if the python type implements <see cref="Schema"/> or <see cref="ReaderBatch"/>,
+        /// so its source can be read in batches of lines instead of calling the python Reader for each line
+        /// </summary>
+        public bool SupportsBatchReading => _schema != null || _readerBatch != null;
+
         /// <summary>
         /// Constructor for initializing the PythonData class
         /// </summary>
@@ -81,6 +92,8 @@ namespace QuantConnect.Python
                 _isSparseData = pythonData.GetPythonMethod("IsSparseData");
                 _defaultResolution = pythonData.GetPythonMethod("DefaultResolution");
                 _supportedResolutions = pythonData.GetPythonMethod("SupportedResolutions");
+                _readerBatch = pythonData.GetPythonMethod("ReaderBatch");
+                _schema = pythonData.GetPythonMethod("Schema");
                 _pythonTypeName = pythonData.GetPythonType().GetAssemblyName().Name;
             }
         }
@@ -122,6 +135,193 @@ namespace QuantConnect.Python
             }
         }
 
+        /// <summary>
+        /// Describes the columns of the source so Lean can parse its lines without calling python.
+        /// Python custom data types can override it instead of implementing Reader
+        /// </summary>
+        /// <param name="config">Subscription configuration</param>
+        /// <param name="date">Date of the requested data</param>
+        /// <param name="isLiveMode">true if we're in live mode, false for backtesting mode</param>
+        /// <returns>The schema of the source, null if the lines should be read by the python Reader</returns>
+        public PythonDataSchema Schema(SubscriptionDataConfig config, DateTime date, bool isLiveMode)
+        {
+            if (_schema == null)
+            {
+                return null;
+            }
+            using (Py.GIL())
+            {
+                var schema = _schema(config, date, isLiveMode);
+                return (schema as PyObject).GetAndDispose<PythonDataSchema>();
+            }
+        }
+
+        /// <summary>
+        /// Reads a batch of lines of the source at once. Python custom data types can override it instead of implementing Reader,
+        /// returning either an iterable of data points or a pandas DataFrame indexed by time, where the columns are
+        /// the properties of the data points and the 'value' column, or else the 'close' column, is their value
+        /// </summary>
+        /// <param name="config">Subscription configuration</param>
+        /// <param name="lines">The lines of data from the source</param>
+        /// <param name="date">Date of the requested lines</param>
+        /// <param name="isLiveMode">true if we're in live mode, false for backtesting mode</param>
+        /// <returns>The data points of the lines</returns>
+        public List<BaseData> ReaderBatch(SubscriptionDataConfig config, IReadOnlyList<string> lines, DateTime date, bool isLiveMode)
+        {
+            var schema = Schema(config, date, isLiveMode);
+            if (schema != null)
+            {
+                var result = new List<BaseData>(lines.Count);
+                foreach (var line in lines)
+                {
+                    var data = schema.Parse(config, line, _pythonTypeName);
+                    if (data != null)
+                    {
+                        result.Add(data);
+                    }
+                }
+                return result;
+            }
+
+            if (_readerBatch == null)
+            {
+                return lines.Select(line => Reader(config, line, date, isLiveMode)).ToList();
+            }
+
+            using (Py.GIL())
+            {
+                using var pyLines = lines.ToPyList();
+                using PyObject data = _readerBatch(config, pyLines, date, isLiveMode);
+                if (data.HasAttr("columns") && data.HasAttr("index"))
+                {
+                    return FromDataFrame(config, data);
+                }
+
+                var result = new List<BaseData>(lines.Count);
+                using var iterator = data.GetIterator();
+                foreach (PyObject item in iterator)
+                {
+                    using (item)
+                    {
+                        var instance = item.As<BaseData>();
+                        (instance as PythonData)?.SetProperty("__typename", _pythonTypeName);
+                        result.Add(instance);
+                    }
+                }
+                return result;
+            }
+        }
+
+        /// <summary>
+        /// Creates a data point for each row of the given data frame, reading each of its columns at once.
+        /// Rows without a time are skipped and time zone aware times are converted into the data time zone
+        /// </summary>
+        private List<BaseData> FromDataFrame(SubscriptionDataConfig config, PyObject dataFrame)
+        {
+            using var index = dataFrame.GetAttr("index");
+            var times = ToDataTimeZone(index, config);
+
+            // the positions of the rows that have a time
+            var rows = Enumerable.Range(0, times.Length).Where(i => times[i] != DateTime.MinValue).ToArray();
+            var result = new PythonData[rows.Length];
+            for (var r = 0; r < result.Length; r++)
+            {
+                result[r] = new PythonData { Symbol = config.Symbol, Time = times[rows[r]] };
+                result[r].SetProperty("__typename", _pythonTypeName);
+            }
+
+            using var columns = dataFrame.GetAttr("columns");
+            var keys = columns.Select(column => column.ToString().ToLowerInvariant()).ToList();
+            var valueKey = keys.Contains("value") ? "value" : "close";
+            for (var j = 0; j < keys.Count; j++)
+            {
+                var key = keys[j];
+                using var name = columns[j];
+                using var column = dataFrame.GetItem(name);
+                using var dtype = column.GetAttr("dtype");
+                using var kind = dtype.GetAttr("kind");
+                switch (kind.ToString())
+                {
+                    case "b":
+                    case "i":
+                    case "u":
+                    case "f":
+                        var values = NumpyArray.ToDoubleArray(column);
+                        for (var r = 0; r < result.Length; r++)
+                        {
+                            var i = rows[r];
+                            if (double.IsNaN(values[i]))
+                            {
+                                continue;
+                            }
+                            var value = values[i].SafeDecimalCast();
+                            result[r].SetProperty(key, value);
+                            if (key == valueKey)
+                            {
+                                result[r].Value = value;
+                            }
+                        }
+                        break;
+
+                    case "M":
+                        var dates = ToDataTimeZone(column, config);
+                        for (var r = 0; r < result.Length; r++)
+                        {
+                            var date = dates[rows[r]];
+                            if (date == DateTime.MinValue)
+                            {
+                                continue;
+                            }
+                            if (key == "endtime")
+                            {
+                                result[r].EndTime = date;
+                            }
+                            else
+                            {
+                                result[r].SetProperty(key, date);
+                            }
+                        }
+                        break;
+
+                    default:
+                        using (var list = column.InvokeMethod("tolist"))
+                        {
+                            var i = 0;
+                            var r = 0;
+                            foreach (PyObject item in list)
+                            {
+                                using (item)
+                                {
+                                    if (r < rows.Length && rows[r] == i)
+                                    {
+                                        result[r++].SetProperty(key, item.AsManagedObject(typeof(object)));
+                                    }
+                                    i++;
+                                }
+                            }
+                        }
+                        break;
+                }
+            }
+            return result.ToList<BaseData>();
+        }
+
+        /// <summary>
+        /// Reads the given times in the data time zone, time zone aware times are converted into it
+        /// </summary>
+        private static DateTime[] ToDataTimeZone(PyObject times, SubscriptionDataConfig config)
+        {
+            // numpy would read time zone aware times in UTC, so we convert them and drop the time zone first
+            _timeZoneModule ??= PyModule.FromString("LeanDataTimeZone",
+                "import pandas as pd\n" +
+                "def to_time_zone(times, timeZone):\n" +
+                "    index = pd.DatetimeIndex(times)\n" +
+                "    return index if index.tz is None else index.tz_convert(timeZone).tz_localize(None)\n");
+            using var timeZone = new PyString(config.DataTimeZone.Id);
+            using var local = _timeZoneModule.InvokeMethod("to_time_zone", times, timeZone);
+            return NumpyArray.ToDateTimeArray(local);
+        }
+
         /// <summary>
         /// Indicates if there is support for mapping
         /// </summary>
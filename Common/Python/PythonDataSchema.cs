@@ -0,0 +1,149 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Linq;
+using QuantConnect.Data;
+
+namespace QuantConnect.Python
+{
+    /// <summary>
+    /// Describes the columns of a delimited custom data source so Lean can parse it without calling the python Reader for each line.
+    /// Returned by the Schema method of a <see cref="PythonData"/> type
+    /// </summary>
+    /// <remarks>Fields are split on the delimiter, quoted fields are not supported. Lines whose time can not be parsed,
+    /// like headers, are skipped</remarks>
+    public class PythonDataSchema
+    {
+        private readonly int _timeIndex;
+        private readonly int _valueIndex;
+        private readonly string[] _keys;
+
+        /// <summary>
+        /// The names of the columns of the source, in order
+        /// </summary>
+        public IReadOnlyList<string> Columns { get; }
+
+        /// <summary>
+        /// The column holding the time of each data point
+        /// </summary>
+        public string TimeColumn { get; }
+
+        /// <summary>
+        /// The column holding the value of each data point, if null the value is zero
+        /// </summary>
+        public string ValueColumn { get; }
+
+        /// <summary>
+        /// The exact format of the time column, if null the time is parsed with the invariant culture
+        /// </summary>
+        public string TimeFormat { get; }
+
+        /// <summary>
+        /// The character separating the columns
+        /// </summary>
+        public char Delimiter { get; }
+
+        /// <summary>
+        /// The period covered by each data point, the end time of the data point is its time plus the period
+        /// </summary>
+        public TimeSpan Period { get; }
+
+        /// <summary>
+        /// Creates a new instance
+        /// </summary>
+        /// <param name="columns">The names of the columns of the source, in order</param>
+        /// <param name="timeColumn">The column holding the time of each data point</param>
+        /// <param name="valueColumn">The column holding the value of each data point</param>
+        /// <param name="timeFormat">The exact format of the time column, if null the time is parsed with the invariant culture</param>
+        /// <param name="delimiter">The character separating the columns</param>
+        /// <param name="period">The period covered by each data point</param>
+        public PythonDataSchema(string[] columns, string timeColumn, string valueColumn = null, string timeFormat = null,
+            char delimiter = ',', TimeSpan? period = null)
+        {
+            Columns = columns;
+            TimeColumn = timeColumn;
+            ValueColumn = valueColumn;
+            TimeFormat = timeFormat;
+            Delimiter = delimiter;
+            Period = period ?? TimeSpan.Zero;
+
+            _keys = columns.Select(x => x.ToLowerInvariant()).ToArray();
+            _timeIndex = Array.IndexOf(_keys, timeColumn.ToLowerInvariant());
+            if (_timeIndex < 0)
+            {
+                throw new ArgumentException($"PythonDataSchema(): the time column '{timeColumn}' is not one of the columns");
+            }
+            _valueIndex = valueColumn == null ? -1 : Array.IndexOf(_keys, valueColumn.ToLowerInvariant());
+            if (valueColumn != null && _valueIndex < 0)
+            {
+                throw new ArgumentException($"PythonDataSchema(): the value column '{valueColumn}' is not one of the columns");
+            }
+        }
+
+        /// <summary>
+        /// Parses a line of the source into a new data point, numeric columns are stored as decimals and the others as strings
+        /// </summary>
+        /// <param name="config">The subscription configuration</param>
+        /// <param name="line">The line to parse</param>
+        /// <param name="typeName">The name of the python type of the data</param>
+        /// <returns>The data point or null if the line does not have all the columns or its time can not be parsed</returns>
+        public PythonData Parse(SubscriptionDataConfig config, string line, string typeName)
+        {
+            if (string.IsNullOrWhiteSpace(line))
+            {
+                return null;
+            }
+            var fields = line.Split(Delimiter);
+            if (fields.Length < _keys.Length || !TryParseTime(fields[_timeIndex].Trim(), out var time))
+            {
+                return null;
+            }
+
+            var data = new PythonData { Symbol = config.Symbol, Time = time, EndTime = time + Period };
+            for (var i = 0; i < _keys.Length; i++)
+            {
+                if (i == _timeIndex)
+                {
+                    continue;
+                }
+                var field = fields[i].Trim();
+                if (decimal.TryParse(field, NumberStyles.Any, CultureInfo.InvariantCulture, out var number))
+                {
+                    data.SetProperty(_keys[i], number);
+                    if (i == _valueIndex)
+                    {
+                        data.Value = number;
+                    }
+                }
+                else
+                {
+                    data.SetProperty(_keys[i], field);
+                }
+            }
+            data.SetProperty("__typename", typeName);
+            return data;
+        }
+
+        private bool TryParseTime(string value, out DateTime time)
+        {
+            return TimeFormat == null
+                ? DateTime.TryParse(value, CultureInfo.InvariantCulture, DateTimeStyles.None, out time)
+                : DateTime.TryParseExact(value, TimeFormat, CultureInfo.InvariantCulture, DateTimeStyles.None, out time);
+        }
+    }
+}
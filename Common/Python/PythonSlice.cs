@@ -28,6 +28,7 @@ namespace QuantConnect.Python
     {
         private Slice _slice;
         private static readonly PyObject _converter;
+        private static PandasConverter _pandasConverter;
 
         static PythonSlice()
         {
@@ -83,6 +84,23 @@ namespace QuantConnect.Python
             }
         }
 
+        /// <summary>
+        /// Gets the bars or ticks of this slice as a pandas.DataFrame indexed by symbol, built in a single call
+        /// instead of reading each data point from python
+        /// </summary>
+        /// <param name="type">Optional type of data we seek: TradeBar, QuoteBar or Tick.
+        /// By default the trade bar fields and the closing bid and ask of the quote bars are returned</param>
+        /// <returns>The pandas.DataFrame with a row per symbol, or per tick</returns>
+        public PyObject ToDataFrame(PyObject type = null)
+        {
+            var dataType = type?.CreateType();
+            using (Py.GIL())
+            {
+                _pandasConverter ??= new PandasConverter();
+                return _pandasConverter.GetSliceDataFrame(_slice, dataType);
+            }
+        }
+
         /// <summary>
         /// Gets the number of symbols held in this slice
         /// </summary>
@@ -17,6 +17,7 @@
 using System;
 using System.Collections.Concurrent;
 using System.Linq;
+using System.Threading;
 
 namespace QuantConnect
 {
@@ -29,6 +30,13 @@ namespace QuantConnect
     {
         // we aggregate the two maps into a class so we can assign a new one as an atomic operation
         private static Cache _cache = new Cache();
+        private static int _version;
+
+        /// <summary>
+        /// Gets a number that changes every time a mapping is added, changed or removed.
+        /// Allows consumers, like the python pandas mapper, to cache lookups and invalidate them when the cache changes
+        /// </summary>
+        public static int Version => _version;
 
         /// <summary>
         /// Adds a mapping for the specified ticker
@@ -37,8 +45,17 @@ namespace QuantConnect
         /// <param name="symbol">The symbol object that maps to the string ticker symbol</param>
         public static void Set(string ticker, Symbol symbol)
         {
+            Symbol existing;
+            if (_cache.Symbols.TryGetValue(ticker, out existing) && existing == symbol)
+            {
+                // mapping already present, don't invalidate consumer caches
+                _cache.Tickers[symbol] = ticker;
+                return;
+            }
+
             _cache.Symbols[ticker] = symbol;
             _cache.Tickers[symbol] = ticker;
+            Interlocked.Increment(ref _version);
         }
 
         /// <summary>
@@ -107,7 +124,14 @@ namespace QuantConnect
         public static bool TryRemove(Symbol symbol)
         {
             string ticker;
-            return _cache.Tickers.TryRemove(symbol, out ticker) && _cache.Symbols.TryRemove(ticker, out symbol);
+            var removedTicker = _cache.Tickers.TryRemove(symbol, out ticker);
+            var removed = removedTicker && _cache.Symbols.TryRemove(ticker, out symbol);
+            // the version changes once the mapping is gone, so a reader that sees it can't cache the removed mapping
+            if (removedTicker)
+            {
+                Interlocked.Increment(ref _version);
+            }
+            return removed;
         }
 
         /// <summary>
@@ -118,7 +142,14 @@ namespace QuantConnect
         public static bool TryRemove(string ticker)
         {
             Symbol symbol;
-            return _cache.Symbols.TryRemove(ticker, out symbol) && _cache.Tickers.TryRemove(symbol, out ticker);
+            var removedSymbol = _cache.Symbols.TryRemove(ticker, out symbol);
+            var removed = removedSymbol && _cache.Tickers.TryRemove(symbol, out ticker);
+            // the version changes once the mapping is gone, so a reader that sees it can't cache the removed mapping
+            if (removedSymbol)
+            {
+                Interlocked.Increment(ref _version);
+            }
+            return removed;
         }
 
         /// <summary>
@@ -127,6 +158,7 @@ namespace QuantConnect
         public static void Clear()
         {
             _cache = new Cache();
+            Interlocked.Increment(ref _version);
         }
 
         private static Tuple<bool, Symbol, InvalidOperationException> TryGetSymbol(string ticker)
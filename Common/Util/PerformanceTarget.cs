@@ -0,0 +1,53 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+namespace QuantConnect.Util
+{
+    /// <summary>
+    /// The engine stages timed by the <see cref="PerformanceTracker"/>
+    /// </summary>
+    public enum PerformanceTarget
+    {
+        /// <summary>
+        /// Time spent in the python algorithm OnData method (0)
+        /// </summary>
+        PythonOnData,
+
+        /// <summary>
+        /// Time spent in python alpha model Update methods (1)
+        /// </summary>
+        PythonAlphaUpdate,
+
+        /// <summary>
+        /// Time spent in python portfolio construction model CreateTargets methods (2)
+        /// </summary>
+        PythonPortfolioConstruction,
+
+        /// <summary>
+        /// Time spent in python universe selection functions (3)
+        /// </summary>
+        PythonSelection,
+
+        /// <summary>
+        /// Time spent reading the data of history requests (4)
+        /// </summary>
+        HistoryRequest,
+
+        /// <summary>
+        /// Time spent converting history requests into pandas data frames, includes the time reading the data (5)
+        /// </summary>
+        PythonHistoryDataFrame
+    }
+}
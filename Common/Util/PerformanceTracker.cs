@@ -0,0 +1,142 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Threading;
+using QuantConnect.Configuration;
+
+namespace QuantConnect.Util
+{
+    /// <summary>
+    /// Accumulates the time spent and the number of calls for each <see cref="PerformanceTarget"/>
+    /// </summary>
+    /// <remarks>Used to produce the <see cref="PerformanceReport"/> so regressions can be attributed to an engine stage</remarks>
+    public static class PerformanceTracker
+    {
+        private static readonly int TargetCount = Enum.GetValues(typeof(PerformanceTarget)).Length;
+        private static readonly long[] ElapsedTicks = new long[TargetCount];
+        private static readonly long[] Calls = new long[TargetCount];
+
+        /// <summary>
+        /// True if the targets are timed, only when the performance report was requested by default
+        /// </summary>
+        public static bool Enabled { get; set; } = Config.GetBool("performance-report");
+
+        /// <summary>
+        /// Starts timing the given target, the time is accumulated when the returned scope is disposed
+        /// </summary>
+        /// <param name="target">The target being timed</param>
+        /// <returns>The scope to dispose once the timed operation ends, does nothing if tracking is not enabled</returns>
+        public static Scope Track(PerformanceTarget target)
+        {
+            return Enabled ? new Scope(target, Stopwatch.GetTimestamp()) : default;
+        }
+
+        /// <summary>
+        /// Wraps the given enumerable so the time spent producing each item is accumulated into the target
+        /// </summary>
+        /// <param name="enumerable">The enumerable to time</param>
+        /// <param name="target">The target being timed</param>
+        /// <returns>An enumerable yielding the same items, the given enumerable if tracking is not enabled</returns>
+        public static IEnumerable<T> Track<T>(IEnumerable<T> enumerable, PerformanceTarget target)
+        {
+            return Enabled ? TrackMoveNext(enumerable, target) : enumerable;
+        }
+
+        private static IEnumerable<T> TrackMoveNext<T>(IEnumerable<T> enumerable, PerformanceTarget target)
+        {
+            using (var enumerator = enumerable.GetEnumerator())
+            {
+                while (true)
+                {
+                    bool moveNext;
+                    using (Track(target))
+                    {
+                        moveNext = enumerator.MoveNext();
+                    }
+                    if (!moveNext)
+                    {
+                        yield break;
+                    }
+                    yield return enumerator.Current;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Gets the total time spent in the given target
+        /// </summary>
+        public static TimeSpan GetElapsed(PerformanceTarget target)
+        {
+            var ticks = Interlocked.Read(ref ElapsedTicks[(int)target]);
+            return TimeSpan.FromSeconds(ticks / (double)Stopwatch.Frequency);
+        }
+
+        /// <summary>
+        /// Gets the number of times the given target was timed
+        /// </summary>
+        public static long GetCalls(PerformanceTarget target)
+        {
+            return Interlocked.Read(ref Calls[(int)target]);
+        }
+
+        /// <summary>
+        /// Resets all the accumulated timings
+        /// </summary>
+        public static void Reset()
+        {
+            for (var i = 0; i < TargetCount; i++)
+            {
+                Interlocked.Exchange(ref ElapsedTicks[i], 0);
+                Interlocked.Exchange(ref Calls[i], 0);
+            }
+        }
+
+        /// <summary>
+        /// Timing scope returned by <see cref="Track(PerformanceTarget)"/>
+        /// </summary>
+        public readonly struct Scope : IDisposable
+        {
+            private readonly PerformanceTarget _target;
+            private readonly long _start;
+            private readonly bool _tracking;
+
+            /// <summary>
+            /// Creates a new instance
+            /// </summary>
+            public Scope(PerformanceTarget target, long start)
+            {
+                _target = target;
+                _start = start;
+                _tracking = true;
+            }
+
+            /// <summary>
+            /// Accumulates the elapsed time into the target, unless this is the default scope returned when tracking is not enabled
+            /// </summary>
+            public void Dispose()
+            {
+                if (!_tracking)
+                {
+                    return;
+                }
+                Interlocked.Add(ref ElapsedTicks[(int)_target], Stopwatch.GetTimestamp() - _start);
+                Interlocked.Increment(ref Calls[(int)_target]);
+            }
+        }
+    }
+}
@@ -91,6 +91,9 @@ namespace QuantConnect.Configuration
                 // save list of transactions to the specified csv file
                 new CommandLineOption("transaction-log", CommandOptionType.SingleValue),
 
+                // true will store a json report with the time spent per engine stage in the results destination folder
+                new CommandLineOption("performance-report", CommandOptionType.SingleValue),
+
                 // To get your api access token go to quantconnect.com/account
                 new CommandLineOption("job-user-id", CommandOptionType.SingleValue),
                 new CommandLineOption("api-access-token", CommandOptionType.SingleValue),
@@ -16,6 +16,7 @@
 using System;
 using System.Linq;
 using QuantConnect.Data;
+using QuantConnect.Python;
 using QuantConnect.Logging;
 using QuantConnect.Interfaces;
 using System.Collections.Generic;
@@ -37,6 +38,7 @@ namespace QuantConnect.Lean.Engine.DataFeeds
         private BaseData _factory;
         private bool _shouldCacheDataPoints;
 
+        private static int BatchSize = 10000;
         private static int CacheSize = 100;
         private static volatile Dictionary<string, List<BaseData>> BaseDataSourceCache = new Dictionary<string, List<BaseData>>(100);
         private static Queue<string> CacheKeys = new Queue<string>(100);
@@ -100,6 +102,17 @@ namespace QuantConnect.Lean.Engine.DataFeeds
                         // only create a factory if the stream isn't null
                         _factory = _config.GetBaseDataInstance();
                     }
+
+                    if (_factory is PythonData { SupportsBatchReading: true } pythonFactory && !_implementsStreamReader && !reader.ShouldBeRateLimited)
+                    {
+                        // custom data is never cached, so we can emit the batches directly
+                        foreach (var instance in ReadBatches(reader, pythonFactory))
+                        {
+                            yield return instance;
+                        }
+                        yield break;
+                    }
+
                     // while the reader has data
                     while (!reader.EndOfStream)
                     {
@@ -188,6 +201,41 @@ namespace QuantConnect.Lean.Engine.DataFeeds
             }
         }
 
+        /// <summary>
+        /// Reads the lines of the given reader in batches, so python custom data is parsed without a python call per line
+        /// </summary>
+        private IEnumerable<BaseData> ReadBatches(IStreamReader reader, PythonData factory)
+        {
+            var lines = new List<string>(BatchSize);
+            while (!reader.EndOfStream)
+            {
+                lines.Clear();
+                while (lines.Count < BatchSize && !reader.EndOfStream)
+                {
+                    lines.Add(reader.ReadLine());
+                }
+
+                List<BaseData> batch;
+                try
+                {
+                    batch = factory.ReaderBatch(_config, lines, _date, IsLiveMode);
+                }
+                catch (Exception err)
+                {
+                    OnReaderError(lines[0], err);
+                    continue;
+                }
+
+                foreach (var instance in batch)
+                {
+                    if (instance != null && instance.EndTime != default(DateTime))
+                    {
+                        yield return instance;
+                    }
+                }
+            }
+        }
+
         /// <summary>
         /// Event invocator for the <see cref="ReaderError"/> event
         /// </summary>
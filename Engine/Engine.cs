@@ -20,6 +20,7 @@ using System.Linq;
 using System.Runtime.CompilerServices;
 using System.Threading;
 using System.Threading.Tasks;
+using Newtonsoft.Json;
 using QuantConnect.Brokerages;
 using QuantConnect.Configuration;
 using QuantConnect.Data;
@@ -376,6 +377,11 @@ namespace QuantConnect.Lean.Engine
                             var dataPoints = algorithmManager.DataPoints + algorithm.HistoryProvider.DataPointCount;
                             var kps = dataPoints / (double) 1000 / totalSeconds;
                             AlgorithmHandlers.Results.DebugMessage($"Algorithm Id:({job.AlgorithmId}) completed in {totalSeconds:F2} seconds at {kps:F0}k data points per second. Processing total of {dataPoints:N0} data points.");
+
+                            if (Config.GetBool("performance-report"))
+                            {
+                                StorePerformanceReport(job.AlgorithmId, PerformanceReport.Create(totalSeconds, dataPoints));
+                            }
                         }
                     }
                     catch (Exception err)
@@ -522,6 +528,18 @@ namespace QuantConnect.Lean.Engine
             }
         }
 
+        /// <summary>
+        /// Save the performance report of the algorithm as json into the results destination folder
+        /// </summary>
+        /// <param name="algorithmId">The algorithm id, used as the file name prefix</param>
+        /// <param name="report">The report to store</param>
+        private static void StorePerformanceReport(string algorithmId, PerformanceReport report)
+        {
+            var folder = Config.Get("results-destination-folder", Directory.GetCurrentDirectory());
+            var path = Path.Combine(folder, $"{algorithmId}-performance.json");
+            File.WriteAllText(path, JsonConvert.SerializeObject(report, Formatting.Indented));
+        }
+
         /// <summary>
         /// Initialize slow static variables
         /// </summary>
@@ -1739,6 +1739,29 @@ tradeBar = TradeBar
             }
         }
 
+        [TestCase(true, 960)]
+        [TestCase(false, 390)]
+        public void PythonHistoryChunksForwardTheHistoryOptions(bool extendedMarket, int expectedHistoryCount)
+        {
+            var start = new DateTime(2013, 10, 07);
+            var end = new DateTime(2013, 10, 08);
+            var algorithm = GetAlgorithm(end);
+            var symbol = algorithm.AddEquity("SPY").Symbol;
+
+            using (Py.GIL())
+            {
+                algorithm.SetPandasConverter();
+                using var pySymbols = new PyList(new[] { symbol.ToPython() });
+
+                var history = algorithm.History(pySymbols, start, end, Resolution.Minute, extendedMarketHours: extendedMarket);
+                var chunks = algorithm.HistoryChunks(pySymbols, start, end, Resolution.Minute, rows: 100,
+                    extendedMarketHours: extendedMarket).ToList();
+
+                AssertHistoryResultCount(history, expectedHistoryCount);
+                Assert.AreEqual(expectedHistoryCount, chunks.Sum(chunk => chunk.GetAttr("shape")[0].As<int>()));
+            }
+        }
+
         // C#
         [TestCase(Language.CSharp, Resolution.Minute, true, 960)]
         [TestCase(Language.CSharp, Resolution.Minute, false, 390)]
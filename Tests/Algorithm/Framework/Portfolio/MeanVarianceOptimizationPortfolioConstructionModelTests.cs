@@ -263,6 +263,123 @@ class CustomPortfolioOptimizer:
             }
         }
 
+        [TestCase("LedoitWolfCovarianceEstimator()")]
+        [TestCase("ConstantCorrelationCovarianceEstimator()")]
+        [TestCase("FactorModelCovarianceEstimator(3)")]
+        public void PythonCovarianceEstimatorsAreWellConditionedWithMoreSecuritiesThanReturns(string estimator)
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    $@"from AlgorithmImports import *
+from Portfolio.LedoitWolfCovarianceEstimator import LedoitWolfCovarianceEstimator
+from Portfolio.ConstantCorrelationCovarianceEstimator import ConstantCorrelationCovarianceEstimator
+from Portfolio.FactorModelCovarianceEstimator import FactorModelCovarianceEstimator
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+
+random = np.random.default_rng(0)
+factors = random.normal(0, 0.01, (63, 3))
+returns = pd.DataFrame(factors @ random.normal(1, 0.5, (100, 3)).T + random.normal(0, 0.01, (63, 100)))
+
+estimator = {estimator}
+covariance = np.asarray(estimator.Estimate(returns))
+condition = np.linalg.cond(covariance)
+sampleCondition = np.linalg.cond(returns.cov())
+weights = MinimumVariancePortfolioOptimizer(covariance_estimator = estimator).Optimize(returns)
+isEqualWeighting = bool(np.allclose(weights, 1 / 100))");
+
+                Assert.Less(module.GetAttr("condition").As<double>(), 1e6);
+                Assert.Greater(module.GetAttr("sampleCondition").As<double>(), 1e12);
+                Assert.IsFalse(module.GetAttr("isEqualWeighting").As<bool>());
+            }
+        }
+
+        [Test]
+        public void PythonRiskParityKeepsTheFactorModelCovarianceLowRank()
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    $@"from AlgorithmImports import *
+from Portfolio.FactorModelCovarianceEstimator import FactorModelCovarianceEstimator, LowRankCovariance
+from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+
+random = np.random.default_rng(0)
+factors = random.normal(0, 0.01, (63, 3))
+returns = pd.DataFrame(factors @ random.normal(1, 0.5, (200, 3)).T + random.normal(0, 0.01, (63, 200)))
+estimator = FactorModelCovarianceEstimator(3)
+denseWeights = RiskParityPortfolioOptimizer().Optimize(returns, covariance = estimator.Estimate(returns).to_numpy())
+
+# the optimizer should only use products with the covariance, never the dense matrix
+def fail(self, dtype = None, copy = None):
+    raise Exception('The low rank covariance was made dense')
+toArray = LowRankCovariance.__array__
+LowRankCovariance.__array__ = fail
+try:
+    weights = RiskParityPortfolioOptimizer(covariance_estimator = estimator).Optimize(returns)
+finally:
+    LowRankCovariance.__array__ = toArray
+error = float(np.abs(weights - denseWeights).max())");
+
+                Assert.AreEqual(0, module.GetAttr("error").As<double>(), 1e-10);
+            }
+        }
+
+        [TestCase("MinimumVariancePortfolioOptimizer")]
+        [TestCase("MaximumSharpeRatioPortfolioOptimizer")]
+        public void PythonOptimizersVarianceGradientMatchesFiniteDifferences(string optimizer)
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    $@"from AlgorithmImports import *
+from scipy.optimize import approx_fprime
+from Portfolio.{optimizer} import {optimizer}
+
+random = np.random.default_rng(0)
+returns = random.normal(0, 0.01, (63, 10))
+covariance = np.cov(returns.T)
+weights = random.uniform(-1, 1, 10)
+
+optimizer = {optimizer}()
+variance, gradient = optimizer.portfolio_variance_and_gradient(weights, covariance)
+expected = approx_fprime(weights, lambda x: optimizer.portfolio_variance(x, covariance), 1e-8)
+error = float(np.max(np.abs(gradient - expected)))");
+
+                Assert.AreEqual(0, module.GetAttr("error").As<double>(), 1e-6);
+            }
+        }
+
+        [TestCase("MinimumVariancePortfolioOptimizer(target_return = 0.05)", "MinimumVariancePortfolioOptimizer(target_return = 0.0005, solver = solver)")]
+        [TestCase("MaximumSharpeRatioPortfolioOptimizer()", "MaximumSharpeRatioPortfolioOptimizer(solver = solver)")]
+        public void PythonQuadraticProgramSolverMatchesSlsqp(string slsqpOptimizer, string quadraticProgramOptimizer)
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    $@"from AlgorithmImports import *
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
+from Portfolio.QuadraticProgramSolver import QuadraticProgramSolver
+
+random = np.random.default_rng(0)
+returns = pd.DataFrame(random.normal(0.0005, 0.01, (252, 20)) + random.normal(0, 0.01, (252, 1)))
+
+# SLSQP stops early on variances this small, so its reference solution uses returns in percent
+expected = {slsqpOptimizer}.Optimize(returns * 100)
+solver = QuadraticProgramSolver()
+actual = {quadraticProgramOptimizer}.Optimize(returns)
+error = float(np.max(np.abs(actual - expected)))
+
+# the next rebalance starts from the previous solution
+nextRebalance = {quadraticProgramOptimizer}.Optimize(returns.iloc[1:])
+nextError = float(np.max(np.abs(nextRebalance - {slsqpOptimizer}.Optimize(returns.iloc[1:] * 100))))");
+
+                Assert.AreEqual(0, module.GetAttr("error").As<double>(), 1e-3);
+                Assert.AreEqual(0, module.GetAttr("nextError").As<double>(), 1e-3);
+            }
+        }
+
         protected void SetPortfolioConstruction(Language language, PortfolioBias bias)
         {
             var model = GetPortfolioConstructionModel(language, Resolution.Daily, bias);
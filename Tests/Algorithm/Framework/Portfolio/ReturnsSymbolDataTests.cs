@@ -109,6 +109,81 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             Assert.AreEqual(expected, actual, 0.000001);
         }
 
+        [Test]
+        public void PythonReturnsMatrixIsSimilarToPandasDataFrame()
+        {
+            var code = @"
+from AlgorithmImports import *
+from ReturnsMatrix import ReturnsMatrix
+
+def GetReturns(odd):
+    returnsMatrix = ReturnsMatrix(3, capacity = 1)
+    series = dict()
+    reference = datetime(2020, 2, 1)
+    for i in range(5):
+        for symbol in ['A', 'B']:
+            time = reference + timedelta(i, minutes = 10 if odd and symbol == 'B' else 0)
+            returnsMatrix.Update(symbol, time, i / 100)
+            series.setdefault(symbol, {})[time] = i / 100
+
+    expected = pd.DataFrame({ symbol: pd.Series(values).iloc[-3:] for symbol, values in series.items() })
+    return returnsMatrix.GetReturns(['A', 'B']).equals(expected)";
+
+            using (Py.GIL())
+            {
+                dynamic getReturns = PyModule.FromString("GetReturns", code).GetAttr("GetReturns");
+                Assert.IsTrue((bool)getReturns(false));
+                Assert.IsTrue((bool)getReturns(true));
+            }
+        }
+
+        [Test]
+        public void PythonReturnsMatrixMomentsMatchPandas()
+        {
+            var code = @"
+from AlgorithmImports import *
+from ReturnsMatrix import ReturnsMatrix
+
+def GetMaximumErrors():
+    returnsMatrix = ReturnsMatrix(10, capacity = 2)
+    symbols = ['A', 'B', 'C']
+    random = np.random.default_rng(1)
+    reference = datetime(2020, 2, 1)
+    for i in range(25):
+        for symbol in symbols:
+            returnsMatrix.Update(symbol, reference + timedelta(i), random.normal(0, 0.01))
+
+    mean, covariance = returnsMatrix.GetMoments(symbols)
+    returns = returnsMatrix.GetReturns(symbols)
+    return [np.abs(mean - returns.mean()).max(), np.abs(covariance - returns.cov()).max().max()]
+
+def GetMomentsOfMisalignedReturns():
+    returnsMatrix = ReturnsMatrix(10)
+    returnsMatrix.Update('A', datetime(2020, 2, 1), 0.01)
+    returnsMatrix.Update('B', datetime(2020, 2, 2), 0.01)
+    return returnsMatrix.GetMoments(['A', 'B'])
+
+def GetCapacityAndEstimatorSize():
+    returnsMatrix = ReturnsMatrix(10, capacity = 2)
+    for i in range(12):
+        for symbol in ['A', 'B', 'C']:
+            returnsMatrix.Update(symbol, datetime(2020, 2, 1) + timedelta(i), 0.01 * i)
+    returnsMatrix.Remove('B')
+    returnsMatrix.GetMoments(['A', 'C'])
+    return [len(returnsMatrix.counts), len(returnsMatrix.estimator.mean)]";
+
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString("GetMaximumErrors", code);
+                var errors = module.GetAttr("GetMaximumErrors").Invoke().As<double[]>();
+                Assert.AreEqual(0, errors[0], 1e-12);
+                Assert.AreEqual(0, errors[1], 1e-12);
+                Assert.IsTrue(module.GetAttr("GetMomentsOfMisalignedReturns").Invoke().IsNone());
+                // the moments only follow the symbols there are, not the capacity of the matrix
+                CollectionAssert.AreEqual(new[] { 4, 2 }, module.GetAttr("GetCapacityAndEstimatorSize").Invoke().As<int[]>());
+            }
+        }
+
         [Test]
         public void DuplicateKeyPortfolioConstructionModelDoesNotThrow()
         {
@@ -179,13 +254,15 @@ import numpy as np
 import pandas as pd
 import math
 from BlackLittermanOptimizationPortfolioConstructionModel import BlackLittermanOptimizationPortfolioConstructionModel as blopcm
+from ReturnsMatrix import ReturnsMatrix
 
 def GetDeterminantFromHistory(history):
     returns = dict()
     history = history.lastprice.unstack(0)
+    returnsMatrix = ReturnsMatrix(5)
 
     for symbol, df in history.items():
-        symbolData = blopcm.BlackLittermanSymbolData(symbol, 1, 5)
+        symbolData = blopcm.BlackLittermanSymbolData(symbol, 1, returnsMatrix)
         for time, close in df.dropna().items():
             symbolData.Update(time, close)
 
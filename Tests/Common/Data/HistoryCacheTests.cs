@@ -0,0 +1,125 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+using QuantConnect.Data;
+using QuantConnect.Data.Market;
+using QuantConnect.Securities;
+
+namespace QuantConnect.Tests.Common.Data
+{
+    [TestFixture]
+    public class HistoryCacheTests
+    {
+        private static readonly DateTime Start = new DateTime(2020, 1, 2);
+
+        [Test]
+        public void ServesRepeatedRequestsFromTheCache()
+        {
+            var cache = new HistoryCache(100);
+            var reads = 0;
+
+            for (var i = 0; i < 3; i++)
+            {
+                var history = cache.GetHistory(GetRequests(Symbols.SPY, Start), TimeZones.NewYork, () => { reads++; return GetHistory(Symbols.SPY, 5); });
+                Assert.AreEqual(5, history.Count());
+            }
+
+            Assert.AreEqual(1, reads);
+            Assert.AreEqual(1, cache.Misses);
+            Assert.AreEqual(2, cache.Hits);
+            Assert.AreEqual(5, cache.DataPoints);
+        }
+
+        [Test]
+        public void DifferentRequestsAreNotShared()
+        {
+            var cache = new HistoryCache(100);
+
+            cache.GetHistory(GetRequests(Symbols.SPY, Start), TimeZones.NewYork, () => GetHistory(Symbols.SPY, 5)).ToList();
+            cache.GetHistory(GetRequests(Symbols.SPY, Start.AddDays(1)), TimeZones.NewYork, () => GetHistory(Symbols.SPY, 5)).ToList();
+            cache.GetHistory(GetRequests(Symbols.AAPL, Start), TimeZones.NewYork, () => GetHistory(Symbols.AAPL, 5)).ToList();
+            cache.GetHistory(GetRequests(Symbols.SPY, Start), TimeZones.Utc, () => GetHistory(Symbols.SPY, 5)).ToList();
+
+            Assert.AreEqual(4, cache.Misses);
+            Assert.AreEqual(0, cache.Hits);
+            Assert.AreEqual(4, cache.Count);
+        }
+
+        [Test]
+        public void EvictsTheLeastRecentlyUsed()
+        {
+            var cache = new HistoryCache(10);
+
+            cache.GetHistory(GetRequests(Symbols.SPY, Start), TimeZones.NewYork, () => GetHistory(Symbols.SPY, 5)).ToList();
+            cache.GetHistory(GetRequests(Symbols.AAPL, Start), TimeZones.NewYork, () => GetHistory(Symbols.AAPL, 5)).ToList();
+            // SPY becomes the most recently used
+            cache.GetHistory(GetRequests(Symbols.SPY, Start), TimeZones.NewYork, () => GetHistory(Symbols.SPY, 5)).ToList();
+            cache.GetHistory(GetRequests(Symbols.IBM, Start), TimeZones.NewYork, () => GetHistory(Symbols.IBM, 5)).ToList();
+
+            Assert.AreEqual(1, cache.Evictions);
+            Assert.AreEqual(10, cache.DataPoints);
+
+            cache.GetHistory(GetRequests(Symbols.SPY, Start), TimeZones.NewYork, () => GetHistory(Symbols.SPY, 5)).ToList();
+            cache.GetHistory(GetRequests(Symbols.AAPL, Start), TimeZones.NewYork, () => GetHistory(Symbols.AAPL, 5)).ToList();
+            Assert.AreEqual(2, cache.Hits);
+            Assert.AreEqual(4, cache.Misses);
+        }
+
+        [Test]
+        public void DoesNotCacheHistoryLargerThanTheCache()
+        {
+            var cache = new HistoryCache(10);
+
+            var history = cache.GetHistory(GetRequests(Symbols.SPY, Start), TimeZones.NewYork, () => GetHistory(Symbols.SPY, 20));
+
+            Assert.AreEqual(20, history.Count());
+            Assert.AreEqual(0, cache.Count);
+            Assert.AreEqual(0, cache.DataPoints);
+        }
+
+        [Test]
+        public void DoesNotCachePartiallyEnumeratedHistory()
+        {
+            var cache = new HistoryCache(100);
+
+            cache.GetHistory(GetRequests(Symbols.SPY, Start), TimeZones.NewYork, () => GetHistory(Symbols.SPY, 5)).Take(2).ToList();
+
+            Assert.AreEqual(0, cache.Count);
+        }
+
+        private static List<HistoryRequest> GetRequests(Symbol symbol, DateTime start)
+        {
+            return new List<HistoryRequest>
+            {
+                new HistoryRequest(start, start.AddDays(1), typeof(TradeBar), symbol, Resolution.Minute,
+                    SecurityExchangeHours.AlwaysOpen(TimeZones.NewYork), TimeZones.NewYork, null, false, false,
+                    DataNormalizationMode.Adjusted, TickType.Trade)
+            };
+        }
+
+        private static IEnumerable<Slice> GetHistory(Symbol symbol, int count)
+        {
+            for (var i = 0; i < count; i++)
+            {
+                var time = Start.AddMinutes(i);
+                yield return new Slice(time, new BaseData[] { new TradeBar(time, symbol, 1, 1, 1, 1, 1) }, time);
+            }
+        }
+    }
+}
@@ -199,5 +199,40 @@ namespace QuantConnect.Tests.Common
             Assert.IsFalse(SymbolCache.TryGetSymbol("SPY", out symbol));
             Assert.IsFalse(SymbolCache.TryGetTicker(Symbols.SPY, out ticker));
         }
+
+        [Test]
+        public void VersionChangesOnlyWhenMappingsChange()
+        {
+            var version = SymbolCache.Version;
+            SymbolCache.Set("SPY", Symbols.SPY);
+            Assert.AreNotEqual(version, SymbolCache.Version);
+
+            version = SymbolCache.Version;
+            SymbolCache.Set("SPY", Symbols.SPY);
+            Assert.AreEqual(version, SymbolCache.Version);
+
+            SymbolCache.Set("SPY", Symbols.AAPL);
+            Assert.AreNotEqual(version, SymbolCache.Version);
+
+            version = SymbolCache.Version;
+            Assert.IsTrue(SymbolCache.TryRemove("SPY"));
+            Assert.AreNotEqual(version, SymbolCache.Version);
+
+            // nothing was removed, so there is nothing for the readers to refresh
+            version = SymbolCache.Version;
+            Assert.IsFalse(SymbolCache.TryRemove("SPY"));
+            Assert.IsFalse(SymbolCache.TryRemove(Symbols.AAPL));
+            Assert.AreEqual(version, SymbolCache.Version);
+
+            SymbolCache.Set("AAPL", Symbols.AAPL);
+            version = SymbolCache.Version;
+            Assert.IsTrue(SymbolCache.TryRemove(Symbols.AAPL));
+            Assert.AreNotEqual(version, SymbolCache.Version);
+            Assert.IsFalse(SymbolCache.TryGetTicker(Symbols.AAPL, out _));
+
+            version = SymbolCache.Version;
+            SymbolCache.Clear();
+            Assert.AreNotEqual(version, SymbolCache.Version);
+        }
     }
 }
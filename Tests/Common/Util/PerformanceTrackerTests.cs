@@ -0,0 +1,108 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Linq;
+using System.Threading;
+using Newtonsoft.Json;
+using NUnit.Framework;
+using QuantConnect.Util;
+
+namespace QuantConnect.Tests.Common.Util
+{
+    [TestFixture]
+    public class PerformanceTrackerTests
+    {
+        private bool _enabled;
+
+        [SetUp]
+        public void SetUp()
+        {
+            _enabled = PerformanceTracker.Enabled;
+            PerformanceTracker.Enabled = true;
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            PerformanceTracker.Enabled = _enabled;
+            PerformanceTracker.Reset();
+        }
+
+        [Test]
+        public void AccumulatesElapsedTimeAndCalls()
+        {
+            PerformanceTracker.Reset();
+
+            for (var i = 0; i < 2; i++)
+            {
+                using (PerformanceTracker.Track(PerformanceTarget.PythonOnData))
+                {
+                    Thread.Sleep(10);
+                }
+            }
+
+            Assert.AreEqual(2, PerformanceTracker.GetCalls(PerformanceTarget.PythonOnData));
+            Assert.GreaterOrEqual(PerformanceTracker.GetElapsed(PerformanceTarget.PythonOnData), TimeSpan.FromMilliseconds(15));
+            Assert.AreEqual(0, PerformanceTracker.GetCalls(PerformanceTarget.PythonAlphaUpdate));
+        }
+
+        [Test]
+        public void TrackedEnumerableOnlyTimesMoveNext()
+        {
+            PerformanceTracker.Reset();
+
+            var items = PerformanceTracker.Track(Enumerable.Range(0, 3), PerformanceTarget.HistoryRequest).ToList();
+
+            CollectionAssert.AreEqual(new[] { 0, 1, 2 }, items);
+            // one call per item plus the final call returning false
+            Assert.AreEqual(4, PerformanceTracker.GetCalls(PerformanceTarget.HistoryRequest));
+        }
+
+        [Test]
+        public void DoesNotTrackWhenDisabled()
+        {
+            PerformanceTracker.Reset();
+            PerformanceTracker.Enabled = false;
+
+            using (PerformanceTracker.Track(PerformanceTarget.PythonOnData))
+            {
+            }
+            var enumerable = Enumerable.Range(0, 3);
+            var tracked = PerformanceTracker.Track(enumerable, PerformanceTarget.HistoryRequest);
+
+            Assert.AreSame(enumerable, tracked);
+            Assert.AreEqual(0, PerformanceTracker.GetCalls(PerformanceTarget.PythonOnData));
+            Assert.AreEqual(0, PerformanceTracker.GetCalls(PerformanceTarget.HistoryRequest));
+        }
+
+        [Test]
+        public void ReportContainsAllStages()
+        {
+            PerformanceTracker.Reset();
+            using (PerformanceTracker.Track(PerformanceTarget.PythonSelection))
+            {
+            }
+
+            var report = PerformanceReport.Create(2, 1000);
+            var serialized = JsonConvert.SerializeObject(report);
+
+            Assert.AreEqual(500, report.DataPointsPerSecond);
+            Assert.AreEqual(Enum.GetValues(typeof(PerformanceTarget)).Length, report.Stages.Count);
+            Assert.AreEqual(1, report.Stages[nameof(PerformanceTarget.PythonSelection)].Calls);
+            StringAssert.Contains("\"data-points-per-second\":500.0", serialized);
+        }
+    }
+}
@@ -0,0 +1,105 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Linq;
+using System.Collections.Generic;
+using System.Collections.ObjectModel;
+using Python.Runtime;
+using NUnit.Framework;
+using QuantConnect.Python;
+
+namespace QuantConnect.Tests.Python
+{
+    [TestFixture]
+    public class NumpyArrayTests
+    {
+        private static readonly double[] Values = { 1.5, -2.25, double.NaN, 1e-300, double.MaxValue };
+
+        private static IEnumerable<TestCaseData> ValueLists()
+        {
+            yield return new TestCaseData(Values.ToArray()).SetName("Array");
+            yield return new TestCaseData(Values.ToList()).SetName("List");
+            yield return new TestCaseData(new ReadOnlyCollection<double>(Values)).SetName("ReadOnlyCollection");
+            yield return new TestCaseData(new double[0]).SetName("Empty");
+        }
+
+        [TestCaseSource(nameof(ValueLists))]
+        public void DoublesRoundTrip(IList<double> values)
+        {
+            using (Py.GIL())
+            {
+                using var array = NumpyArray.Create(values);
+                Assert.AreEqual(values.Count, array.Length());
+                CollectionAssert.AreEqual(values, NumpyArray.ToDoubleArray(array));
+            }
+        }
+
+        [Test]
+        public void Float32KeepsSevenDigits()
+        {
+            using (Py.GIL())
+            {
+                using var array = NumpyArray.CreateFloat32(new ReadOnlyCollection<double>(new[] { 1.2345678, -100.5 }));
+                using var dtype = array.GetAttr("dtype");
+                Assert.AreEqual("float32", dtype.ToString());
+                var result = NumpyArray.ToDoubleArray(array);
+                Assert.AreEqual(1.2345678, result[0], 1e-6);
+                Assert.AreEqual(-100.5, result[1]);
+            }
+        }
+
+        [Test]
+        public void TwoDimensionalArrayKeepsTheRowOrder()
+        {
+            using (Py.GIL())
+            {
+                using var array = NumpyArray.Create(new double[,] { { 1, 2, 3 }, { 4, 5, 6 } });
+                using var shape = array.GetAttr("shape");
+                Assert.AreEqual("(2, 3)", shape.ToString());
+                CollectionAssert.AreEqual(new[] { 1d, 2d, 3d, 4d, 5d, 6d }, NumpyArray.ToDoubleArray(array));
+                using var transposed = array.GetAttr("T");
+                CollectionAssert.AreEqual(new[] { 1d, 4d, 2d, 5d, 3d, 6d }, NumpyArray.ToDoubleArray(transposed));
+            }
+        }
+
+        [Test]
+        public void TimesRoundTrip()
+        {
+            var times = new ReadOnlyCollection<DateTime>(new[] { new DateTime(1970, 1, 1), new DateTime(2020, 1, 2, 9, 30, 0, 123) });
+            using (Py.GIL())
+            {
+                using var array = NumpyArray.Create(times);
+                using var dtype = array.GetAttr("dtype");
+                Assert.AreEqual("datetime64[ns]", dtype.ToString());
+                CollectionAssert.AreEqual(times, NumpyArray.ToDateTimeArray(array));
+            }
+        }
+
+        [Test]
+        public void TimesOutsideOfTheNumpyRangeAreNotATime()
+        {
+            var times = new[] { DateTime.MinValue, new DateTime(1600, 1, 1), new DateTime(2020, 1, 2), new DateTime(2300, 1, 1), DateTime.MaxValue };
+            using (Py.GIL())
+            {
+                using var array = NumpyArray.Create(times);
+                using var isNaT = Py.Import("numpy").GetAttr("isnat").Invoke(array);
+                CollectionAssert.AreEqual(new[] { true, true, false, true, true }, isNaT.InvokeMethod("tolist").As<bool[]>());
+                CollectionAssert.AreEqual(new[] { DateTime.MinValue, DateTime.MinValue, new DateTime(2020, 1, 2), DateTime.MinValue, DateTime.MinValue },
+                    NumpyArray.ToDateTimeArray(array));
+            }
+        }
+    }
+}
@@ -26,6 +26,7 @@ using QuantConnect.Python;
 using QuantConnect.Securities;
 using System;
 using System.Globalization;
+using System.IO;
 using System.Collections.Generic;
 using System.Linq;
 using QuantConnect.Tests.Common.Data.UniverseSelection;
@@ -278,6 +279,295 @@ namespace QuantConnect.Tests.Python
             }
         }
 
+        [Test]
+        public void HandlesUnorderedTimes()
+        {
+            var converter = new PandasConverter();
+            var symbol = Symbols.SPY;
+            var start = new DateTime(2020, 1, 2, 9, 31, 0);
+
+            // the same end time appears twice and the times are not sorted
+            var rawBars = new[] { 3, 1, 2, 1, 0 }
+                .Select(i => new TradeBar(start.AddMinutes(i), symbol, i + 101m, i + 102m, i + 100m, i + 101m, 10m))
+                .ToArray();
+
+            dynamic dataFrame = converter.GetDataFrame(rawBars);
+
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+    $@"
+import pandas as pd
+def Test(dataFrame, symbol):
+    expected = pd.MultiIndex.from_tuples([(str(symbol.ID), pd.Timestamp(2020, 1, 2, 9, 32 + i)) for i in [3, 1, 2, 1, 0]], names=['symbol', 'time'])
+    if not dataFrame.index.equals(expected):
+        raise Exception(f'Unexpected index {{dataFrame.index}}')
+    if list(dataFrame.index.levels[1]) != sorted(set(expected.levels[1])):
+        raise Exception(f'Unexpected time level {{dataFrame.index.levels[1]}}')
+    if list(dataFrame.close) != [104, 102, 103, 102, 101]:
+        raise Exception(f'Unexpected close {{dataFrame.close}}')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test(dataFrame, symbol));
+            }
+        }
+
+        [TestCase(null, null, new[] { 3, 2 })]
+        [TestCase(null, 2, new[] { 2, 2, 1 })]
+        [TestCase(1, 2, new[] { 2, 1, 2 })]
+        public void GetDataFramesSplitsTheHistory(int? periodDays, int? maxDataPoints, int[] expectedRows)
+        {
+            var converter = new PandasConverter();
+            var times = new[]
+            {
+                new DateTime(2020, 1, 2, 10, 0, 0), new DateTime(2020, 1, 2, 11, 0, 0), new DateTime(2020, 1, 2, 12, 0, 0),
+                new DateTime(2020, 1, 3, 10, 0, 0), new DateTime(2020, 1, 3, 11, 0, 0)
+            };
+            var history = GetHistory(Symbols.SPY, Resolution.Hour, times
+                .Select((time, i) => new TradeBar(time, Symbols.SPY, i + 101m, i + 102m, i + 100m, i + 101m, 10m, Time.OneMinute)));
+
+            var period = periodDays.HasValue ? TimeSpan.FromDays(periodDays.Value) : (TimeSpan?)null;
+            var dataFrames = converter.GetDataFrames(history, period, maxDataPoints).ToList();
+
+            using (Py.GIL())
+            {
+                var rows = dataFrames.Select(x => x.GetAttr("__len__").Invoke().As<int>()).ToArray();
+                CollectionAssert.AreEqual(expectedRows, rows);
+
+                var closes = dataFrames.SelectMany(x => x.GetAttr("close").GetAttr("tolist").Invoke().As<double[]>());
+                CollectionAssert.AreEqual(new[] { 101d, 102d, 103d, 104d, 105d }, closes);
+            }
+        }
+
+        [TestCase("parquet")]
+        [TestCase("feather")]
+        public void ArrowFilesRoundTrip(string format)
+        {
+            var converter = new PandasConverter();
+            var history = GetHistory(Symbols.SPY, Resolution.Minute, Enumerable.Range(0, 10)
+                .Select(i => new TradeBar(new DateTime(2020, 1, 2, 9, 31, 0).AddMinutes(i), Symbols.SPY, i + 101m, i + 102m, i + 100m, i + 101m, 10m)))
+                .ToList();
+            var path = Path.Combine(Path.GetTempPath(), $"{Guid.NewGuid()}.{format}");
+
+            try
+            {
+                using (Py.GIL())
+                {
+                    var dataFrame = converter.GetDataFrame(history);
+                    if (format == "parquet")
+                    {
+                        converter.WriteParquet(history, path);
+                    }
+                    else
+                    {
+                        converter.WriteFeather(history, path);
+                    }
+                    var read = format == "parquet" ? converter.ReadParquet(path) : converter.ReadFeather(path);
+
+                    dynamic test = PyModule.FromString("testModule",
+    $@"
+def Test(dataFrame, read):
+    if not read.equals(dataFrame):
+        raise Exception(f'Unexpected data frame {{read}}')
+    if read.loc['SPY'].close.iloc[0] != 101:
+        raise Exception('Read data frame can not be indexed by ticker')").GetAttr("Test");
+
+                    SymbolCache.Set("SPY", Symbols.SPY);
+                    Assert.DoesNotThrow(() => test(dataFrame, read));
+                }
+            }
+            finally
+            {
+                File.Delete(path);
+            }
+        }
+
+        [TestCase("close")]
+        [TestCase("volume")]
+        public void GetNumpyArrayMatchesDataFrame(string field)
+        {
+            var converter = new PandasConverter();
+            var start = new DateTime(2020, 1, 2, 9, 31, 0);
+
+            // AAPL misses the first bar
+            var history = GetHistory(Symbols.SPY, Resolution.Minute, Enumerable.Range(0, 5)
+                    .Select(i => new TradeBar(start.AddMinutes(i), Symbols.SPY, i + 101m, i + 102m, i + 100m, i + 101m, i + 10m)))
+                .Concat(GetHistory(Symbols.AAPL, Resolution.Minute, Enumerable.Range(1, 4)
+                    .Select(i => new TradeBar(start.AddMinutes(i), Symbols.AAPL, i + 201m, i + 202m, i + 200m, i + 201m, i + 20m))))
+                .ToList();
+
+            using (Py.GIL())
+            {
+                var dataFrame = converter.GetDataFrame(history);
+                var array = converter.GetNumpyArray(history, field);
+
+                dynamic test = PyModule.FromString("testModule",
+    $@"
+import numpy as np
+def Test(dataFrame, array, field):
+    values, symbols, times = array
+    expected = dataFrame[field].unstack(level=0)
+    if values.shape != (2, 5):
+        raise Exception(f'Unexpected shape {{values.shape}}')
+    for row, symbol in enumerate(symbols):
+        if not np.array_equal(values[row], expected[str(symbol.ID)].values, equal_nan=True):
+            raise Exception(f'Unexpected values {{values[row]}} for {{symbol}}')
+    if not (times == expected.index.values).all():
+        raise Exception(f'Unexpected times {{times}}')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test(dataFrame, array, field));
+            }
+        }
+
+        [Test]
+        public void GetSliceDataFrameHasARowPerSymbol()
+        {
+            var converter = new PandasConverter();
+            var time = new DateTime(2020, 1, 2, 9, 31, 0);
+            var slice = new Slice(time, new BaseData[]
+            {
+                new TradeBar(time, Symbols.SPY, 101m, 102m, 100m, 101m, 1000m, Time.OneMinute),
+                new QuoteBar(time, Symbols.SPY, new Bar(100, 101, 99, 100.5m), 10, new Bar(101, 102, 100, 101.5m), 20, Time.OneMinute),
+                new QuoteBar(time, Symbols.AAPL, new Bar(200, 201, 199, 200.5m), 30, new Bar(201, 202, 200, 201.5m), 40, Time.OneMinute)
+            }, time.AddMinutes(1));
+
+            using (Py.GIL())
+            {
+                var dataFrame = converter.GetSliceDataFrame(slice);
+                var quoteBars = converter.GetSliceDataFrame(slice, typeof(QuoteBar));
+
+                dynamic test = PyModule.FromString("testModule",
+    $@"
+import numpy as np
+def Test(dataFrame, quoteBars):
+    if list(dataFrame.columns) != ['open', 'high', 'low', 'close', 'volume', 'bidclose', 'bidsize', 'askclose', 'asksize']:
+        raise Exception(f'Unexpected columns {{dataFrame.columns}}')
+    if dataFrame.loc['SPY'].close != 101 or dataFrame.loc['SPY'].askclose != 101.5:
+        raise Exception(f'Unexpected SPY row {{dataFrame.loc[""SPY""]}}')
+    if not np.isnan(dataFrame.loc['AAPL'].close) or dataFrame.loc['AAPL'].bidsize != 30:
+        raise Exception(f'Unexpected AAPL row {{dataFrame.loc[""AAPL""]}}')
+    if len(quoteBars) != 2 or quoteBars.loc['SPY'].bidhigh != 101:
+        raise Exception(f'Unexpected quote bars {{quoteBars}}')").GetAttr("Test");
+
+                SymbolCache.Set("SPY", Symbols.SPY);
+                SymbolCache.Set("AAPL", Symbols.AAPL);
+                Assert.DoesNotThrow(() => test(dataFrame, quoteBars));
+            }
+        }
+
+        [Test]
+        public void CategoricalSymbolsAndFloat32Prices()
+        {
+            var converter = new PandasConverter { CategoricalSymbols = true, Float32Prices = true };
+            var start = new DateTime(2020, 1, 2, 9, 31, 0);
+            var history = GetHistory(Symbols.SPY, Resolution.Minute, Enumerable.Range(0, 5)
+                    .Select(i => new TradeBar(start.AddMinutes(i), Symbols.SPY, i + 101m, i + 102m, i + 100m, i + 101.25m, 123456789m)))
+                .Concat(GetHistory(Symbols.AAPL, Resolution.Minute, Enumerable.Range(0, 5)
+                    .Select(i => new TradeBar(start.AddMinutes(i), Symbols.AAPL, i + 201m, i + 202m, i + 200m, i + 201m, i + 20m))))
+                .ToList();
+
+            using (Py.GIL())
+            {
+                var dataFrame = converter.GetDataFrame(history);
+
+                dynamic test = PyModule.FromString("testModule",
+    $@"
+import numpy as np
+def Test(dataFrame):
+    if dataFrame.close.dtype != np.float32 or dataFrame.volume.dtype != np.float64:
+        raise Exception(f'Unexpected types {{dataFrame.dtypes}}')
+    if dataFrame.reset_index().symbol.dtype != 'category':
+        raise Exception('The symbol level is not categorical')
+    if dataFrame.loc['SPY'].close.iloc[0] != 101.25 or dataFrame.loc['SPY'].volume.iloc[0] != 123456789:
+        raise Exception(f'Unexpected SPY values {{dataFrame.loc[""SPY""]}}')").GetAttr("Test");
+
+                SymbolCache.Set("SPY", Symbols.SPY);
+                Assert.DoesNotThrow(() => test(dataFrame));
+            }
+        }
+
+        [Test]
+        public void LazyDataFrameOnlyConvertsAccessedColumns()
+        {
+            var converter = new PandasConverter();
+            var start = new DateTime(2020, 1, 2, 9, 31, 0);
+            var history = GetHistory(Symbols.SPY, Resolution.Minute, Enumerable.Range(0, 5)
+                    .Select(i => new TradeBar(start.AddMinutes(i), Symbols.SPY, i + 101m, i + 102m, i + 100m, i + 101m, i + 10m)))
+                .Concat(GetHistory(Symbols.AAPL, Resolution.Minute, Enumerable.Range(1, 4)
+                    .Select(i => new TradeBar(start.AddMinutes(i), Symbols.AAPL, i + 201m, i + 202m, i + 200m, i + 201m, i + 20m))))
+                .ToList();
+
+            using (Py.GIL())
+            {
+                var dataFrame = converter.GetDataFrame(history);
+                var closes = converter.GetDataFrame(history, columns: new[] { "Close" });
+                var lazy = converter.GetLazyDataFrame(history);
+
+                dynamic test = PyModule.FromString("testModule",
+    $@"
+def Test(dataFrame, closes, lazy):
+    if closes.columns.tolist() != ['close'] or not closes.close.equals(dataFrame.close):
+        raise Exception(f'Unexpected closes {{closes}}')
+    if lazy.columns.tolist() != dataFrame.columns.tolist() or lazy.empty:
+        raise Exception(f'Unexpected lazy columns {{lazy.columns}}')
+    if not lazy.close.unstack(0).equals(dataFrame.close.unstack(0)):
+        raise Exception(f'Unexpected lazy closes {{lazy.close}}')
+    if not lazy[['open', 'close']].equals(dataFrame[['open', 'close']]):
+        raise Exception(f'Unexpected lazy columns {{lazy[[""open"", ""close""]]}}')
+    if lazy._frame is not None:
+        raise Exception('The lazy data frame was converted')
+    if not lazy.loc['SPY'].equals(dataFrame.loc['SPY']) or len(lazy) != len(dataFrame):
+        raise Exception(f'Unexpected lazy data frame {{lazy}}')").GetAttr("Test");
+
+                SymbolCache.Set("SPY", Symbols.SPY);
+                Assert.DoesNotThrow(() => test(dataFrame, closes, lazy));
+            }
+        }
+
+        [Test]
+        public void LazyDataFrameForwardsOperatorsToTheDataFrame()
+        {
+            var converter = new PandasConverter();
+            var start = new DateTime(2020, 1, 2, 9, 31, 0);
+            var history = GetHistory(Symbols.SPY, Resolution.Minute, Enumerable.Range(0, 5)
+                .Select(i => new TradeBar(start.AddMinutes(i), Symbols.SPY, i + 101m, i + 102m, i + 100m, i + 101m, i + 10m)))
+                .ToList();
+
+            using (Py.GIL())
+            {
+                var dataFrame = converter.GetDataFrame(history);
+
+                dynamic test = PyModule.FromString("testModule",
+    $@"
+import numpy as np
+import pandas as pd
+
+def Test(dataFrame, getLazy):
+    if not (getLazy() * 2).equals(dataFrame * 2) or not (1 - getLazy()).equals(1 - dataFrame):
+        raise Exception('Unexpected arithmetic result')
+    if not (getLazy() > 100).equals(dataFrame > 100) or not (getLazy() == dataFrame).all().all():
+        raise Exception('Unexpected comparison result')
+    array = np.asarray(getLazy())
+    if array.shape != dataFrame.shape or not np.array_equal(array, dataFrame.to_numpy()):
+        raise Exception(f'Unexpected array {{array}}')
+    lazy = getLazy()
+    lazy['range'] = lazy.high - lazy.low
+    if 'range' not in lazy.columns or not lazy.range.equals(dataFrame.high - dataFrame.low):
+        raise Exception(f'Unexpected assignment result {{lazy}}')
+    if isinstance(getLazy(), pd.DataFrame) or not isinstance(getLazy().to_frame(), pd.DataFrame):
+        raise Exception('Unexpected type')").GetAttr("Test");
+
+                Func<PyObject> getLazy = () => converter.GetLazyDataFrame(history);
+                Assert.DoesNotThrow(() => test(dataFrame, getLazy));
+            }
+        }
+
+        [Test]
+        public void GetNumpyArrayThrowsOnUnknownField()
+        {
+            var converter = new PandasConverter();
+            Assert.Throws<ArgumentException>(() => converter.GetNumpyArray(Enumerable.Empty<Slice>(), "bidclose"));
+        }
+
         /// <summary>
         /// Specific issues for symbol LOW, reference GH issue #4886
         /// </summary>
@@ -3633,6 +3923,39 @@ def DataFrameIsEmpty():
             }
         }
 
+        [Test]
+        public void GetIndicatorArrayMatchesDataFrame()
+        {
+            using (Py.GIL())
+            {
+                var dateTime = new DateTime(2018, 1, 1);
+                var data = new Dictionary<string, List<IndicatorDataPoint>>
+                {
+                    // unordered names and partially overlapping times
+                    {"Ind2", Enumerable.Range(3, 5).Select(i => new IndicatorDataPoint(dateTime.AddMinutes(i), i * 2)).ToList()},
+                    {"ind1", Enumerable.Range(0, 5).Select(i => new IndicatorDataPoint(dateTime.AddMinutes(i), i)).ToList()}
+                };
+
+                var pdConverter = new PandasConverter();
+                var dataFrame = pdConverter.GetIndicatorDataFrame(data);
+                var array = pdConverter.GetIndicatorArray(data);
+
+                dynamic test = PyModule.FromString("testModule",
+    $@"
+import numpy as np
+def Test(dataFrame, array):
+    values, names, times = array
+    if names != ['ind1', 'ind2'] or dataFrame.columns.tolist() != names:
+        raise Exception(f'Unexpected names {{names}}')
+    if values.shape != (8, 2) or not np.array_equal(values, dataFrame.values, equal_nan=True):
+        raise Exception(f'Unexpected values {{values}}')
+    if not (times == dataFrame.index.values).all():
+        raise Exception(f'Unexpected times {{times}}')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test(dataFrame, array));
+            }
+        }
+
         [TestCaseSource(nameof(GetHistoryWithDuplicateTimes))]
         public void HandlesSlicesWithDuplicateTimeStamps(Symbol symbol, IEnumerable<Slice> data, string expectedDataFrameString)
         {
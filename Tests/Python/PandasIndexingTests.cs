@@ -74,6 +74,46 @@ namespace QuantConnect.Tests.Python
             }
         }
 
+        [Test]
+        public void IndexingWithNdarrayOfTickers()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_indexing_with_ndarray_of_tickers();
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
+        [Test]
+        public void MapperCacheIsInvalidatedWhenSymbolCacheChanges()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_mapper_cache_is_invalidated_when_symbol_cache_changes();
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
+        [Test]
+        public void LeanScopeOnlyRemapsLeanDataFrames()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_lean_scope_only_remaps_lean_data_frames();
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
+        [Test]
+        public void DisableRemapping()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_disable_remapping();
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
         [Test]
         public void ExpectedException()
         {
@@ -68,3 +68,36 @@ class PandasDataFrameTests():
             return True
         except:
             return False
+
+    def test_indexing_with_ndarray_of_tickers(self):
+        # Indexing with a numpy array of tickers should be mapped like a list
+        closes = self.spydf['close'].unstack(level=0)
+        return len(closes[np.array(['spy'])].columns) == 1
+
+    def test_mapper_cache_is_invalidated_when_symbol_cache_changes(self):
+        import PandasMapper
+        ticker = 'PANDASMAPPERTEST'
+        if PandasMapper.mapper(ticker) != ticker:
+            return False
+        SymbolCache.Set(ticker, self.aapl)
+        try:
+            return PandasMapper.mapper(ticker) == str(self.aapl.ID)
+        finally:
+            SymbolCache.TryRemove(ticker)
+
+    def test_lean_scope_only_remaps_lean_data_frames(self):
+        import PandasMapper
+        df = pd.DataFrame({str(self.spy.ID): [2, 5, 8, 10]})
+        PandasMapper.set_remapping_scope('lean')
+        try:
+            # the user frame is not remapped, the Lean one still is
+            return 'spy' not in df.columns and 'spy' in self.spydf.index.levels[0]
+        finally:
+            PandasMapper.set_remapping_scope('all')
+
+    def test_disable_remapping(self):
+        import PandasMapper
+        with PandasMapper.disable_remapping():
+            if 'spy' in self.spydf.index.levels[0]:
+                return False
+        return 'spy' in self.spydf.index.levels[0]
@@ -14,6 +14,8 @@
 */
 
 using System;
+using System.Linq;
+using System.Collections.Generic;
 using NodaTime;
 using Python.Runtime;
 using NUnit.Framework;
@@ -98,6 +100,151 @@ class CustomDataTest(PythonData):
             }
         }
 
+        [Test]
+        public void ReadsBatchesWithSchema()
+        {
+            using (Py.GIL())
+            {
+                dynamic testModule = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+
+class CustomDataTest(PythonData):
+    def Schema(self, config, date, isLiveMode):
+        return PythonDataSchema([""Date"", ""Open"", ""Close"", ""Exchange""], ""Date"", ""Close"", ""%Y-%m-%d"", "","", timedelta(1))");
+
+                var lines = new[] { "Date,Open,Close,Exchange", "2022-05-05,10.5,11,NYSE", "2022-05-06,11,12.25,NYSE", "" };
+                var data = GetBatchFromModule(testModule, lines);
+
+                Assert.AreEqual(2, data.Count);
+                Assert.AreEqual(new DateTime(2022, 5, 6), data[1].Time);
+                Assert.AreEqual(new DateTime(2022, 5, 7), data[1].EndTime);
+                Assert.AreEqual(12.25m, data[1].Value);
+                Assert.AreEqual(11m, ((PythonData)data[1])["open"]);
+                Assert.AreEqual("NYSE", ((PythonData)data[1])["exchange"]);
+                Assert.IsTrue(((PythonData)data[1]).IsOfType(Extensions.CreateType(testModule.GetAttr("CustomDataTest"))));
+            }
+        }
+
+        [Test]
+        public void ReadsBatchesFromDataFrame()
+        {
+            using (Py.GIL())
+            {
+                dynamic testModule = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from io import StringIO
+
+class CustomDataTest(PythonData):
+    def ReaderBatch(self, config, lines, date, isLiveMode):
+        return pd.read_csv(StringIO('\n'.join(lines)), names=['time', 'close', 'exchange'], index_col='time', parse_dates=True)");
+
+                var lines = new[] { "2022-05-05,11,NYSE", "2022-05-06,12.25,NYSE" };
+                var data = GetBatchFromModule(testModule, lines);
+
+                Assert.AreEqual(2, data.Count);
+                Assert.AreEqual(new DateTime(2022, 5, 6), data[1].Time);
+                Assert.AreEqual(12.25m, data[1].Value);
+                Assert.AreEqual("NYSE", ((PythonData)data[1])["exchange"]);
+            }
+        }
+
+        [Test]
+        public void SkipsDataFrameRowsWithoutTime()
+        {
+            using (Py.GIL())
+            {
+                dynamic testModule = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from io import StringIO
+
+class CustomDataTest(PythonData):
+    def ReaderBatch(self, config, lines, date, isLiveMode):
+        dataFrame = pd.read_csv(StringIO('\n'.join(lines)), names=['time', 'close', 'endtime'], index_col='time')
+        dataFrame.index = pd.to_datetime(dataFrame.index)
+        dataFrame['endtime'] = pd.to_datetime(dataFrame['endtime'])
+        return dataFrame");
+
+                var lines = new[] { "2022-05-05,11,2022-05-06", ",12,2022-05-07", "2022-05-07,13," };
+                var data = GetBatchFromModule(testModule, lines);
+
+                Assert.AreEqual(2, data.Count);
+                Assert.AreEqual(new DateTime(2022, 5, 5), data[0].Time);
+                Assert.AreEqual(new DateTime(2022, 5, 6), data[0].EndTime);
+                Assert.AreEqual(11m, data[0].Value);
+                Assert.AreEqual(new DateTime(2022, 5, 7), data[1].Time);
+                Assert.AreEqual(13m, data[1].Value);
+                // the missing end time is not set, so it defaults to the time
+                Assert.AreEqual(data[1].Time, data[1].EndTime);
+            }
+        }
+
+        [Test]
+        public void ConvertsTimeZoneAwareDataFrameTimesIntoTheDataTimeZone()
+        {
+            using (Py.GIL())
+            {
+                dynamic testModule = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from io import StringIO
+
+class CustomDataTest(PythonData):
+    def ReaderBatch(self, config, lines, date, isLiveMode):
+        dataFrame = pd.read_csv(StringIO('\n'.join(lines)), names=['time', 'close'], index_col='time')
+        dataFrame.index = pd.to_datetime(dataFrame.index).tz_localize('America/New_York')
+        dataFrame['exchangetime'] = dataFrame.index.tz_convert('Europe/London')
+        return dataFrame");
+
+                var lines = new[] { "2022-05-05 09:30,11", "2022-05-06 09:30,12" };
+                var data = GetBatchFromModule(testModule, lines, TimeZones.NewYork);
+
+                Assert.AreEqual(new DateTime(2022, 5, 5, 9, 30, 0), data[0].Time);
+                Assert.AreEqual(new DateTime(2022, 5, 6, 9, 30, 0), data[1].Time);
+                Assert.AreEqual(new DateTime(2022, 5, 6, 9, 30, 0), ((PythonData)data[1])["exchangetime"]);
+
+                data = GetBatchFromModule(testModule, lines);
+
+                Assert.AreEqual(new DateTime(2022, 5, 5, 13, 30, 0), data[0].Time);
+            }
+        }
+
+        [Test]
+        public void ReadsBatchesFromIterable()
+        {
+            using (Py.GIL())
+            {
+                dynamic testModule = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+
+class CustomDataTest(PythonData):
+    def ReaderBatch(self, config, lines, date, isLiveMode):
+        for line in lines:
+            result = CustomDataTest()
+            result.Symbol = config.Symbol
+            result.Value = float(line)
+            result.Time = datetime(2022, 5, 5)
+            yield result");
+
+                var data = GetBatchFromModule(testModule, new[] { "1", "2", "3" });
+
+                Assert.AreEqual(new[] { 1m, 2m, 3m }, data.Select(x => x.Value).ToArray());
+            }
+        }
+
+        private static List<BaseData> GetBatchFromModule(dynamic testModule, string[] lines, DateTimeZone dataTimeZone = null)
+        {
+            var type = Extensions.CreateType(testModule.GetAttr("CustomDataTest"));
+            var customDataTest = new PythonData(testModule.GetAttr("CustomDataTest")());
+            Assert.IsTrue(customDataTest.SupportsBatchReading);
+            var config = new SubscriptionDataConfig(type, Symbols.SPY, Resolution.Daily, dataTimeZone ?? DateTimeZone.Utc,
+                DateTimeZone.Utc, false, false, false, isCustom: true);
+            return customDataTest.ReaderBatch(config, lines, DateTime.UtcNow, false);
+        }
+
         private static BaseData GetDataFromModule(dynamic testModule)
         {
             var type = Extensions.CreateType(testModule.GetAttr("CustomDataTest"));
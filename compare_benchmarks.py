@@ -1,10 +1,158 @@
-import sys
 import json
+import math
+import sqlite3
+import argparse
+import statistics
+from datetime import datetime, timezone
 
-print(f'Will compare benchmark results {sys.argv[2]} against reference {sys.argv[1]}')
+parser = argparse.ArgumentParser(description='Compares benchmark results produced by run_benchmarks.py against reference results')
+parser.add_argument('reference', help='The reference benchmark_results.json')
+parser.add_argument('new', help='The new benchmark_results.json')
+parser.add_argument('--tolerance', type=float, default=0.10, help='Default allowed relative change of the data points per second')
+parser.add_argument('--tolerances', help='Json file with per benchmark tolerance overrides, keyed by benchmark name or "<language>/<benchmark name>"')
+parser.add_argument('--memory-tolerance', type=float, default=0.10, help='Allowed relative increase of the memory metrics')
+parser.add_argument('--alpha', type=float, default=0.05, help='Significance level of the Mann-Whitney U test')
+parser.add_argument('--history', help='History store to append the new results to, sqlite if the path ends with .db or .sqlite, else jsonl')
+parser.add_argument('--label', default=None, help='Label of the new results in the history store, for example the commit sha')
+parser.add_argument('--drift-window', type=int, default=0, help='Number of previous history entries to compare against to detect slow drift, 0 disables')
+args = parser.parse_args()
 
-referenceBenchmark = json.load(open(sys.argv[1]))
-newBenchmark = json.load(open(sys.argv[2]))
+print(f'Will compare benchmark results {args.new} against reference {args.reference}')
+
+referenceBenchmark = json.load(open(args.reference))
+newBenchmark = json.load(open(args.new))
+
+tolerances = {}
+if args.tolerances:
+	tolerances = json.load(open(args.tolerances))
+
+def get_tolerance(language, name):
+	'''Gets the allowed relative change for a benchmark'''
+	return tolerances.get(f'{language}/{name}', tolerances.get(name, args.tolerance))
+
+def get_samples(result):
+	'''Gets the data points per second samples of a benchmark result, older results only have the average'''
+	samples = result.get("samples")
+	return samples if samples else [result["average-dps"]]
+
+def mann_whitney_u(x, y):
+	'''Two sided Mann-Whitney U test using the normal approximation with tie correction.
+	Returns the p-value, or None if there are too few samples for the test to ever reach the significance level'''
+	n1, n2 = len(x), len(y)
+	if n1 < 2 or n2 < 2:
+		return None
+	# p-value of fully separated samples, the lowest the test can produce for these sizes
+	n = n1 + n2
+	if math.erfc((n1 * n2 / 2 - 0.5) / math.sqrt(n1 * n2 * (n + 1) / 12) / math.sqrt(2)) >= args.alpha:
+		return None
+
+	# rank the pooled samples, ties get the average rank
+	pooled = sorted([(value, 0) for value in x] + [(value, 1) for value in y])
+	ranks = [0] * len(pooled)
+	tieCorrection = 0
+	i = 0
+	while i < len(pooled):
+		j = i
+		while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+			j += 1
+		for k in range(i, j + 1):
+			ranks[k] = (i + j) / 2 + 1
+		ties = j - i + 1
+		tieCorrection += ties ** 3 - ties
+		i = j + 1
+
+	rankSumX = sum(rank for rank, (value, group) in zip(ranks, pooled) if group == 0)
+	u = rankSumX - n1 * (n1 + 1) / 2
+	variance = n1 * n2 / 12 * ((n + 1) - tieCorrection / (n * (n - 1)))
+	if variance == 0:
+		return 1.0
+	z = (abs(u - n1 * n2 / 2) - 0.5) / math.sqrt(variance)
+	return min(1.0, math.erfc(max(z, 0) / math.sqrt(2)))
+
+def confidence_intervals_overlap(reference, new):
+	'''True if the bootstrap confidence intervals of the data points per second of both results overlap.
+	Returns None if either result has no interval computed from at least two samples'''
+	intervals = []
+	for result in [reference, new]:
+		if len(get_samples(result)) < 2 or "confidence-interval" not in result.get("dps", {}):
+			return None
+		intervals.append(result["dps"]["confidence-interval"])
+	(referenceLower, referenceUpper), (newLower, newUpper) = intervals
+	return referenceLower <= newUpper and newLower <= referenceUpper
+
+def compare(language, name, reference, new):
+	'''Compares a benchmark result against its reference.
+	Returns 'regression', 'improvement' or 'unchanged' and a description of the comparison'''
+	referenceSamples = get_samples(reference)
+	newSamples = get_samples(new)
+	referenceMedian = statistics.median(referenceSamples)
+	newMedian = statistics.median(newSamples)
+	change = (newMedian - referenceMedian) / referenceMedian if referenceMedian else 0
+	tolerance = get_tolerance(language, name)
+	pValue = mann_whitney_u(referenceSamples, newSamples)
+	overlap = confidence_intervals_overlap(reference, new)
+
+	if pValue is not None:
+		significant = pValue < args.alpha
+		test = f'p-value {pValue:.4f}'
+	elif overlap is not None:
+		# too few samples for the test to reach the significance level, fall back to the bootstrap confidence intervals
+		significant = not overlap
+		test = f'too few samples for the Mann-Whitney U test, confidence intervals {"overlap" if overlap else "do not overlap"}'
+	else:
+		# without enough samples for either we rely on the tolerance alone
+		significant = True
+		test = 'too few samples, no significance test applied'
+	description = f'median {newMedian} reference median {referenceMedian} change {change:+.2%} tolerance {tolerance:.2%}, {test}'
+
+	if significant and change < -tolerance:
+		return 'regression', description
+	if significant and change > tolerance:
+		return 'improvement', description
+	return 'unchanged', description
+
+def compare_memory(reference, new):
+	'''Compares the memory metrics present in both results, returns the descriptions of the ones that grew beyond the tolerance'''
+	regressions = []
+	for metric in ["peak-rss-bytes", "managed-heap-bytes", "python-peak-traced-bytes"]:
+		if metric not in reference or metric not in new:
+			continue
+		referenceValue = reference[metric]["median"]
+		newValue = new[metric]["median"]
+		change = (newValue - referenceValue) / referenceValue if referenceValue else 0
+		if change > args.memory_tolerance:
+			regressions.append(f'{metric} median {newValue} reference median {referenceValue} change {change:+.2%} tolerance {args.memory_tolerance:.2%}')
+	return regressions
+
+def store_history(path, label, results):
+	'''Appends the results to the history store and returns the previous entries per benchmark, oldest first'''
+	timestamp = datetime.now(timezone.utc).isoformat()
+	rows = [(timestamp, label, language, name, result["average-dps"], statistics.median(get_samples(result)), json.dumps(result))
+		for language, resultsPerLanguage in results.items() for name, result in resultsPerLanguage.items()]
+
+	previous = {}
+	if path.endswith(('.db', '.sqlite')):
+		connection = sqlite3.connect(path)
+		with connection:
+			connection.execute('CREATE TABLE IF NOT EXISTS benchmarks (timestamp TEXT, label TEXT, language TEXT, name TEXT, average_dps REAL, median_dps REAL, result TEXT)')
+			for language, name, medianDps in connection.execute('SELECT language, name, median_dps FROM benchmarks ORDER BY timestamp'):
+				previous.setdefault((language, name), []).append(medianDps)
+			connection.executemany('INSERT INTO benchmarks VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+		connection.close()
+	else:
+		try:
+			with open(path, 'r') as file:
+				for line in file:
+					if line.strip():
+						entry = json.loads(line)
+						previous.setdefault((entry["language"], entry["name"]), []).append(entry["median-dps"])
+		except FileNotFoundError:
+			pass
+		with open(path, 'a') as file:
+			for timestamp, label, language, name, averageDps, medianDps, result in rows:
+				file.write(json.dumps({ "timestamp": timestamp, "label": label, "language": language, "name": name,
+					"average-dps": averageDps, "median-dps": medianDps, "result": json.loads(result) }) + '\n')
+	return previous
 
 failed = False
 for language in ["CSharp", "Python"]:
@@ -14,15 +162,35 @@ for language in ["CSharp", "Python"]:
 			failed = True
 			print(f'Performance benchmark {key} language {language} was not found in new results')
 			continue
-		newResult = newBenchmark[language][key]
 
-		# allow 5% noise
-		expectedValue = value["average-dps"] * 0.90
-		if expectedValue > newResult["average-dps"]:
+		outcome, description = compare(language, key, value, newBenchmark[language][key])
+		if outcome == 'regression':
 			failed = True
-			print(f'Performance benchmark Failed for algorithm {key} language {language}. Was {str(newResult["average-dps"])} expected as low as {str(expectedValue)}')
+			print(f'Performance benchmark Failed for algorithm {key} language {language}. {description}')
+		elif outcome == 'improvement':
+			print(f'Performance benchmark Improved for algorithm {key} language {language}. {description}')
 		else:
-			print(f'Performance benchmark Passed for algorithm {key} language {language}. Was {str(newResult["average-dps"])} expected as low as {str(expectedValue)}')
+			print(f'Performance benchmark Passed for algorithm {key} language {language}. {description}')
+
+		for memoryDescription in compare_memory(value, newBenchmark[language][key]):
+			failed = True
+			print(f'Memory benchmark Failed for algorithm {key} language {language}. {memoryDescription}')
+
+if args.history:
+	previous = store_history(args.history, args.label, newBenchmark)
+
+	if args.drift_window > 0:
+		for language, resultsPerLanguage in newBenchmark.items():
+			for key, result in resultsPerLanguage.items():
+				window = previous.get((language, key), [])[-args.drift_window:]
+				if len(window) < args.drift_window:
+					continue
+				# compare against the oldest entries of the window so a sequence of small regressions adds up
+				baseline = statistics.median(window[:max(1, len(window) // 2)])
+				change = (statistics.median(get_samples(result)) - baseline) / baseline if baseline else 0
+				if change < -get_tolerance(language, key):
+					failed = True
+					print(f'Performance benchmark Drifted for algorithm {key} language {language}. Change {change:+.2%} over the last {len(window)} results')
 
 if failed:
 	exit(1)
@@ -2,57 +2,273 @@ import os
 import re
 import sys
 import json
+import random
+import shutil
+import argparse
+import threading
 import subprocess
 import statistics
+from queue import Queue
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-dataPath = '../../../Data'
-if len(sys.argv) > 1:
-	dataPath = sys.argv[1]
+parser = argparse.ArgumentParser(description='Runs the Lean performance benchmarks and stores their results in benchmark_results.json')
+parser.add_argument('dataPath', nargs='?', default='../../../Data', help='The data folder the launcher will use')
+parser.add_argument('--repetitions', type=int, default=1, help='Number of measured runs per benchmark')
+parser.add_argument('--warmup', type=int, default=0, help='Number of runs per benchmark to execute and discard before measuring')
+parser.add_argument('--confidence', type=float, default=0.95, help='Confidence level of the bootstrap interval')
+parser.add_argument('--bootstrap-resamples', type=int, default=2000, help='Number of bootstrap resamples used for the confidence interval')
+parser.add_argument('--workers', type=int, default=1, help='Number of benchmarks to run in parallel')
+parser.add_argument('--cores-per-worker', type=int, default=1, help='Number of dedicated cores each parallel worker is pinned to')
+parser.add_argument('--performance-report', action='store_true', help='Request the engine json performance report with the per stage timings instead of parsing the log')
+parser.add_argument('--profile', choices=['speedscope', 'raw'], help='After measuring, run each python benchmark once more under the py-spy sampling profiler '
+	'and store a speedscope json or collapsed stacks file per benchmark in benchmark-profiles')
+parser.add_argument('--profile-rate', type=int, default=100, help='Samples per second taken by the profiler')
+parser.add_argument('--python-memory', action='store_true', help='Trace the python heap of python benchmarks with tracemalloc, requires --performance-report')
+args = parser.parse_args()
+
+dataPath = args.dataPath
 print(f'Using data path {dataPath}')
 
+if args.profile and shutil.which("py-spy") is None:
+	sys.exit('The profile mode requires py-spy, please install it: pip install py-spy')
+
+def percentile(samples, percent):
+	'''Linear interpolated percentile of the given samples'''
+	ordered = sorted(samples)
+	position = (len(ordered) - 1) * percent / 100
+	lower = int(position)
+	upper = min(lower + 1, len(ordered) - 1)
+	return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def bootstrap_confidence_interval(samples, confidence, resamples):
+	'''Percentile bootstrap confidence interval of the mean of the given samples'''
+	if len(samples) < 2:
+		return [samples[0], samples[0]]
+	# fixed seed so the same samples always produce the same interval
+	generator = random.Random(0)
+	means = sorted(statistics.mean(generator.choices(samples, k=len(samples))) for _ in range(resamples))
+	alpha = (1 - confidence) / 2
+	return [percentile(means, alpha * 100), percentile(means, (1 - alpha) * 100)]
+
+def summarize(samples):
+	'''Computes the summary statistics for a list of samples'''
+	return {
+		"mean": statistics.mean(samples),
+		"median": statistics.median(samples),
+		"p95": percentile(samples, 95),
+		"stddev": statistics.stdev(samples) if len(samples) > 1 else 0,
+		"min": min(samples),
+		"max": max(samples),
+		"confidence-interval": bootstrap_confidence_interval(samples, args.confidence, args.bootstrap_resamples)
+	}
+
+def summarize_stages(reports):
+	'''Averages the seconds and calls of each engine stage over the performance reports of all the runs'''
+	stages = {}
+	for stage in reports[0]["stages"]:
+		seconds = [report["stages"][stage]["seconds"] for report in reports]
+		stages[stage] = {
+			"seconds": statistics.mean(seconds),
+			"seconds-samples": seconds,
+			"calls": statistics.mean(report["stages"][stage]["calls"] for report in reports)
+		}
+	return stages
+
+def get_core_sets(workers, coresPerWorker):
+	'''Splits the cores available to this process into disjoint sets, one per worker.
+	Returns None for every worker when pinning is not supported or there are not enough cores'''
+	if workers < 2 or not hasattr(os, "sched_setaffinity"):
+		return [None] * workers
+	available = sorted(os.sched_getaffinity(0))
+	if len(available) < workers * coresPerWorker:
+		print(f'Only {len(available)} cores available for {workers} workers using {coresPerWorker} cores each, will not pin benchmarks')
+		return [None] * workers
+	return [set(available[i * coresPerWorker:(i + 1) * coresPerWorker]) for i in range(workers)]
+
+def run_algorithm(algorithmName, language, algorithmLocation, runId, cores = None, profileOutput = None):
+	'''Runs the given algorithm once and returns the thousands of data points per second, the length in seconds, the performance report
+	and the peak resident set size in bytes of the launcher process'''
+	# each run writes into its own results folder so parallel runs of the same algorithm don't share a log file
+	resultsFolder = os.path.join("benchmark-runs", language, algorithmName, str(runId))
+	launcherFolder = "./Launcher/bin/Release"
+	# start from an empty folder so we never read the report or log left by an earlier invocation
+	shutil.rmtree(os.path.join(launcherFolder, resultsFolder), ignore_errors=True)
+	os.makedirs(os.path.join(launcherFolder, resultsFolder))
+
+	launcherArguments = ["dotnet", "./QuantConnect.Lean.Launcher.dll",
+		"--data-folder " + dataPath,
+		"--algorithm-language " + language,
+		"--algorithm-type-name " + algorithmName,
+		"--algorithm-location " + algorithmLocation,
+		"--results-destination-folder " + resultsFolder,
+		"--log-handler ConsoleErrorLogHandler",
+		"--close-automatically true"]
+	if args.performance_report:
+		launcherArguments.append("--performance-report true")
+	if profileOutput:
+		# py-spy samples the python frames of the embedded interpreter, including the ones called from engine threads
+		launcherArguments = ["py-spy", "record", "--output", profileOutput, "--format", args.profile,
+			"--rate", str(args.profile_rate), "--"] + launcherArguments
+
+	# preexec_fn is not safe to use from the worker threads, taskset pins the launcher before it starts any thread
+	pinAfterStart = cores and shutil.which("taskset") is None
+	if cores and not pinAfterStart:
+		launcherArguments = ["taskset", "-c", ",".join(str(core) for core in sorted(cores))] + launcherArguments
+
+	environment = os.environ.copy()
+	if args.python_memory and language == "Python":
+		environment["PYTHONTRACEMALLOC"] = "1"
+
+	process = subprocess.Popen(launcherArguments,
+		cwd=launcherFolder,
+		env=environment,
+		stdout=subprocess.DEVNULL,
+		stderr=subprocess.DEVNULL)
+	if pinAfterStart:
+		try:
+			os.sched_setaffinity(process.pid, cores)
+		except ProcessLookupError:
+			# the launcher already exited
+			pass
+
+	peakRss = None
+	if hasattr(os, "wait4"):
+		# wait4 gives us the resource usage of this launcher alone, even when others are running in parallel
+		pid, status, usage = os.wait4(process.pid, 0)
+		process.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+		# linux reports the max resident set size in kilobytes, macOS in bytes
+		peakRss = usage.ru_maxrss * 1024 if sys.platform.startswith('linux') else usage.ru_maxrss
+	else:
+		process.wait()
+
+	if process.returncode != 0:
+		with printLock:
+			print(f'Run {runId} of algorithm {algorithmName} language {language} failed with exit code {process.returncode}')
+		return None, None, None, None
+
+	performanceReport = os.path.join(launcherFolder, resultsFolder, algorithmName + "-performance.json")
+	if args.performance_report and os.path.exists(performanceReport):
+		with open(performanceReport, 'r') as file:
+			report = json.load(file)
+		return report["data-points-per-second"] / 1000, report["total-seconds"], report, peakRss
+
+	# fall back to the log for engines that don't support the performance report
+	dataPointsPerSecond = None
+	benchmarkLength = None
+	algorithmLogs = os.path.join(launcherFolder, resultsFolder, algorithmName + "-log.txt")
+	if not os.path.exists(algorithmLogs):
+		return None, None, None, peakRss
+	with open(algorithmLogs, 'r') as file:
+		for line in file.readlines():
+			for match in re.findall(r"(\d+)k data points per second", line):
+				dataPointsPerSecond = int(match)
+			for match in re.findall(r" completed in (\d+)", line):
+				benchmarkLength = int(match)
+	return dataPointsPerSecond, benchmarkLength, None, peakRss
+
+def run_benchmark(algorithmName, language, algorithmLocation):
+	'''Runs the warmup and measured runs of a benchmark on a free set of cores and returns its results'''
+	cores = coreSets.get()
+	try:
+		with printLock:
+			print(f'Start running algorithm {algorithmName} language {language}{f" on cores {sorted(cores)}" if cores else ""}...')
+
+		runId = 0
+		for x in range(args.warmup):
+			run_algorithm(algorithmName, language, algorithmLocation, runId, cores)
+			runId += 1
+
+		dataPointsPerSecond = []
+		benchmarkLengths = []
+		reports = []
+		peakRssSamples = []
+		for x in range(args.repetitions):
+			dps, length, report, peakRss = run_algorithm(algorithmName, language, algorithmLocation, runId, cores)
+			runId += 1
+			if dps is not None:
+				dataPointsPerSecond.append(dps)
+			if length is not None:
+				benchmarkLengths.append(length)
+			if report is not None:
+				reports.append(report)
+			if peakRss is not None:
+				peakRssSamples.append(peakRss)
+
+		if args.profile and language == "Python":
+			# profiling slows the algorithm down so this run is not part of the measured samples
+			extension = "speedscope.json" if args.profile == "speedscope" else "collapsed.txt"
+			profileOutput = os.path.abspath(os.path.join("benchmark-profiles", f'{algorithmName}.{extension}'))
+			os.makedirs(os.path.dirname(profileOutput), exist_ok=True)
+			run_algorithm(algorithmName, language, algorithmLocation, runId, cores, profileOutput)
+			with printLock:
+				print(f'Stored profile for {algorithmName} language {language} in {profileOutput}')
+	finally:
+		coreSets.put(cores)
+
+	if not dataPointsPerSecond or not benchmarkLengths:
+		with printLock:
+			print(f'No performance results were found for {algorithmName} language {language}')
+		return None
+
+	dpsSummary = summarize(dataPointsPerSecond)
+	lengthSummary = summarize(benchmarkLengths)
+	averageDps = dpsSummary["mean"]
+	averageLength = lengthSummary["mean"]
+	lower, upper = dpsSummary["confidence-interval"]
+	with printLock:
+		print(f'Performance for {algorithmName} language {language} avg dps: {averageDps}k median: {dpsSummary["median"]}k stddev: {dpsSummary["stddev"]:.2f} '
+			f'ci: [{lower:.2f}, {upper:.2f}] samples: [{",".join(str(x) for x in dataPointsPerSecond)}] avg length {averageLength} sec')
+
+	result = {
+		"average-dps": averageDps,
+		"samples": dataPointsPerSecond,
+		"average-length": averageLength,
+		"length-samples": benchmarkLengths,
+		"warmup-runs": args.warmup,
+		"dps": dpsSummary,
+		"length": lengthSummary
+	}
+	if peakRssSamples:
+		result["peak-rss-bytes"] = summarize(peakRssSamples)
+	if reports:
+		result["stages"] = summarize_stages(reports)
+		result["gc-collections"] = [statistics.mean(x) for x in zip(*(report["gc-collections"] for report in reports))]
+		result["total-allocated-bytes"] = statistics.mean(report["total-allocated-bytes"] for report in reports)
+		result["managed-heap-bytes"] = summarize([report["managed-heap-bytes"] for report in reports])
+		pythonPeaks = [report["python-peak-traced-bytes"] for report in reports if "python-peak-traced-bytes" in report]
+		if pythonPeaks:
+			result["python-peak-traced-bytes"] = summarize(pythonPeaks)
+			result["python-traced-bytes"] = summarize([report["python-traced-bytes"] for report in reports])
+	return result
+
+printLock = threading.Lock()
+coreSets = Queue()
+for cores in get_core_sets(args.workers, args.cores_per_worker):
+	coreSets.put(cores)
+
 results = {}
-for baseDirectory in ["Algorithm.CSharp/Benchmarks", "Algorithm.Python/Benchmarks"]:
-
-	language = baseDirectory[len("Algorithm") + 1:baseDirectory.index("/")]
-	resultsPerLanguage = {}
-
-	for algorithmFile in sorted(os.listdir(baseDirectory)):
-		if algorithmFile.endswith(("py", "cs")):
-
-			algorithmName = Path(algorithmFile).stem
-			algorithmLocation = "QuantConnect.Algorithm.CSharp.dll" if language == "CSharp" else os.path.join("../../../", baseDirectory, algorithmFile)
-			print(f'Start running algorithm {algorithmName} language {language}...')
-
-			dataPointsPerSecond = []
-			benchmarkLengths = []
-			for x in range(1, 2):
-
-				subprocess.run(["dotnet", "./QuantConnect.Lean.Launcher.dll",
-					"--data-folder " + dataPath,
-					"--algorithm-language " + language,
-					"--algorithm-type-name " + algorithmName,
-					"--algorithm-location " + algorithmLocation,
-					"--log-handler ConsoleErrorLogHandler",
-					"--close-automatically true"],
-					cwd="./Launcher/bin/Release",
-					stdout=subprocess.DEVNULL,
-					stderr=subprocess.DEVNULL)
-
-				algorithmLogs = os.path.join("./Launcher/bin/Release", algorithmName + "-log.txt")
-				file = open(algorithmLogs, 'r')
-				for line in file.readlines():
-					for match in re.findall(r"(\d+)k data points per second", line):
-						dataPointsPerSecond.append(int(match))
-					for match in re.findall(r" completed in (\d+)", line):
-						benchmarkLengths.append(int(match))
-
-			averageDps = statistics.mean(dataPointsPerSecond)
-			averageLength = statistics.mean(benchmarkLengths)
-			resultsPerLanguage[algorithmName] = { "average-dps": averageDps, "samples": dataPointsPerSecond, "average-length": averageLength }
-			print(f'Performance for {algorithmName} language {language} avg dps: {averageDps}k samples: [{",".join(str(x) for x in dataPointsPerSecond)}] avg length {averageLength} sec')
-
-	results[language] = resultsPerLanguage
+with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+	futures = {}
+	for baseDirectory in ["Algorithm.CSharp/Benchmarks", "Algorithm.Python/Benchmarks"]:
+
+		language = baseDirectory[len("Algorithm") + 1:baseDirectory.index("/")]
+		futures[language] = {}
+
+		for algorithmFile in sorted(os.listdir(baseDirectory)):
+			if algorithmFile.endswith(("py", "cs")):
+
+				algorithmName = Path(algorithmFile).stem
+				algorithmLocation = "QuantConnect.Algorithm.CSharp.dll" if language == "CSharp" else os.path.join("../../../", baseDirectory, algorithmFile)
+				futures[language][algorithmName] = executor.submit(run_benchmark, algorithmName, language, algorithmLocation)
+
+	for language, futuresPerLanguage in futures.items():
+		resultsPerLanguage = {}
+		for algorithmName, future in futuresPerLanguage.items():
+			result = future.result()
+			if result is not None:
+				resultsPerLanguage[algorithmName] = result
+		results[language] = resultsPerLanguage
 
 with open("benchmark_results.json", "w") as outfile:
 	json.dump(results, outfile)
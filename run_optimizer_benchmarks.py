@@ -0,0 +1,140 @@
+import os
+import sys
+import json
+import time
+import types
+import argparse
+import importlib
+import statistics
+
+import numpy as np
+import pandas as pd
+
+parser = argparse.ArgumentParser(description='Times the python portfolio optimizers on synthetic returns without running the engine')
+parser.add_argument('--assets', type=int, nargs='+', default=[10, 50, 200, 1000], help='Number of assets of the synthetic returns')
+parser.add_argument('--rows', type=int, nargs='+', default=[63, 252, 1000], help='Number of rows of the synthetic returns')
+parser.add_argument('--optimizers', nargs='+', default=None, help='Names of the optimizers to run, defaults to all')
+parser.add_argument('--repetitions', type=int, default=3, help='Number of timed solves per case')
+parser.add_argument('--output', default='optimizer_benchmark_results.json', help='File to store the results in')
+parser.add_argument('--baseline', default=None, help='Results of a previous run to compare against')
+parser.add_argument('--tolerance', type=float, default=0.10, help='Allowed relative increase of the median solve time when comparing against the baseline')
+parser.add_argument('--variance-tolerance', type=float, default=1e-4, help='Allowed relative change of the portfolio variance of the weights when comparing against the baseline')
+args = parser.parse_args()
+
+frameworkPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Algorithm.Framework')
+sys.path.insert(0, frameworkPath)
+
+try:
+	import AlgorithmImports
+except ImportError:
+	# without the engine there is no clr, the optimizers only need numpy, pandas and sys from AlgorithmImports
+	AlgorithmImports = types.ModuleType('AlgorithmImports')
+	AlgorithmImports.np = np
+	AlgorithmImports.pd = pd
+	AlgorithmImports.sys = sys
+	AlgorithmImports.__all__ = ['np', 'pd', 'sys']
+	sys.modules['AlgorithmImports'] = AlgorithmImports
+
+optimizerNames = [
+	'MinimumVariancePortfolioOptimizer',
+	'MaximumSharpeRatioPortfolioOptimizer',
+	'RiskParityPortfolioOptimizer',
+	'UnconstrainedMeanVariancePortfolioOptimizer'
+]
+
+def create_returns(assets, rows, seed = 0):
+	'''Creates a data frame of synthetic daily returns driven by a few common factors so the covariance looks like real equities'''
+	generator = np.random.default_rng(seed)
+	factors = min(5, assets)
+	loadings = generator.normal(0.5, 0.3, (factors, assets))
+	factorReturns = generator.normal(0.0003, 0.01, (rows, factors))
+	idiosyncratic = generator.normal(0, 0.015, (rows, assets))
+	returns = factorReturns @ loadings + idiosyncratic
+	return pd.DataFrame(returns, columns = [f'ASSET{i}' for i in range(assets)])
+
+def load_optimizer(name):
+	'''Imports the optimizer module and wraps its scipy minimize so we can record the outcome of the solver'''
+	module = importlib.import_module(f'Portfolio.{name}')
+	solves = []
+	if hasattr(module, 'minimize'):
+		minimize = module.minimize
+		def recording_minimize(*args, **kwargs):
+			result = minimize(*args, **kwargs)
+			x0 = kwargs['x0'] if 'x0' in kwargs else args[1]
+			solves.append({ 'iterations': result.get('nit'), 'success': bool(result['success']), 'x0': np.array(x0, dtype = float) })
+			return result
+		module.minimize = recording_minimize
+	return getattr(module, name), solves
+
+results = {}
+for name in args.optimizers or optimizerNames:
+	optimizerType, solves = load_optimizer(name)
+	resultsPerOptimizer = {}
+
+	for assets in args.assets:
+		for rows in args.rows:
+			returns = create_returns(assets, rows)
+			optimizer = optimizerType()
+
+			times = []
+			solves.clear()
+			for x in range(args.repetitions):
+				start = time.perf_counter()
+				weights = optimizer.Optimize(returns)
+				times.append(time.perf_counter() - start)
+
+			# a solver that fails, or stops at its initial guess, is fast but did not optimize anything
+			weights = np.asarray(weights, dtype = float)
+			solve = solves[-1] if solves else None
+			case = f'{assets}x{rows}'
+			resultsPerOptimizer[case] = {
+				'assets': assets,
+				'rows': rows,
+				'median-seconds': statistics.median(times),
+				'samples': times,
+				'iterations': solve['iterations'] if solve else None,
+				'success': solve['success'] if solve else None,
+				'returned-x0': bool(np.allclose(weights, solve['x0'], rtol = 1e-9, atol = 1e-12)) if solve else None,
+				'portfolio-variance': float(weights @ returns.cov().to_numpy() @ weights)
+			}
+			result = resultsPerOptimizer[case]
+			print(f'{name} assets {assets} rows {rows} median {result["median-seconds"]:.6f} sec iterations {result["iterations"]} '
+				f'success {result["success"]} returned x0 {result["returned-x0"]} variance {result["portfolio-variance"]:.6g}')
+
+	results[name] = resultsPerOptimizer
+
+with open(args.output, 'w') as outfile:
+	json.dump(results, outfile)
+
+def get_outcome_changes(result, reference):
+	'''Describes the changes of the solver outcome, the solve times are only comparable when there are none'''
+	changes = []
+	for key in ['success', 'returned-x0']:
+		if key in reference and result[key] != reference[key]:
+			changes.append(f'{key} {result[key]} reference {reference[key]}')
+	if 'portfolio-variance' in reference:
+		referenceVariance = reference['portfolio-variance']
+		change = abs(result['portfolio-variance'] - referenceVariance) / abs(referenceVariance) if referenceVariance else abs(result['portfolio-variance'])
+		if change > args.variance_tolerance:
+			changes.append(f'portfolio-variance {result["portfolio-variance"]:.6g} reference {referenceVariance:.6g}')
+	return changes
+
+if args.baseline:
+	baseline = json.load(open(args.baseline))
+	failed = False
+	for name, resultsPerOptimizer in results.items():
+		for case, result in resultsPerOptimizer.items():
+			reference = baseline.get(name, {}).get(case)
+			if reference is None:
+				continue
+			change = result['median-seconds'] / reference['median-seconds'] - 1
+			status = 'Failed' if change > args.tolerance else 'Passed'
+			failed |= change > args.tolerance
+			print(f'Optimizer benchmark {status} for {name} case {case}. Was {result["median-seconds"]:.6f} sec reference {reference["median-seconds"]:.6f} sec change {change:+.2%}')
+
+			outcomeChanges = get_outcome_changes(result, reference)
+			if outcomeChanges:
+				failed = True
+				print(f'Optimizer benchmark Changed outcome for {name} case {case}, the solve times are not comparable. {", ".join(outcomeChanges)}')
+	if failed:
+		exit(1)